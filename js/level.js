@@ -24,7 +24,7 @@ class Level {
                     const basePath = `assets/sprites/backgrounds/${base}_bg`;
                     // Use the robust variant loader which tries webp/png and suffixes
                     try {
-                        spriteLoader.loadSpriteBest(name, basePath).then(img => { try { this.cachedSprites[name] = img; } catch (e) {} }).catch(() => {});
+                        spriteLoader.loadSpriteBest(name, basePath, spriteLoader.backgroundSuffixes()).then(img => { try { this.cachedSprites[name] = img; } catch (e) {} }).catch(() => {});
                     } catch (e) {}
                 };
 
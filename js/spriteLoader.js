@@ -53,6 +53,21 @@ class SpriteLoader {
         };
     }
 
+    /**
+     * Size suffixes of the pre-rendered background variants that cover the
+     * screen, smallest first (toolshed/generate_backgrounds.py writes
+     * `name@480.png` and `name@720.png` next to the 1080p `name.png`), so
+     * small screens download and decode a smaller image instead of scaling.
+     */
+    backgroundSuffixes() {
+        let height = 1080;
+        try {
+            const dpr = (typeof window !== 'undefined' && window.devicePixelRatio) ? window.devicePixelRatio : 1;
+            if (typeof window !== 'undefined' && window.innerHeight) height = window.innerHeight * dpr;
+        } catch (e) {}
+        return [480, 720].filter(h => h >= height).map(h => '@' + h);
+    }
+
     _appendQuery(path, extraQuery) {
         if (!extraQuery) return path;
         return path.includes('?') ? (path + '&' + extraQuery) : (path + '?' + extraQuery);
@@ -61,14 +76,15 @@ class SpriteLoader {
     /**
      * Load an image by trying a list of candidate paths (useful for backgrounds)
      * Tries combinations of suffixes (@1x,@2x) and extensions (.webp,.png).
+     * `preferredSuffixes` (e.g. from backgroundSuffixes()) are tried first.
      * Stores the first successfully decoded image into `this.sprites[name]`.
      * Returns the stored image (ImageBitmap or HTMLImageElement or canvas placeholder).
      */
-    async loadSpriteBest(name, basePathNoExt) {
+    async loadSpriteBest(name, basePathNoExt, preferredSuffixes = []) {
         const v = (typeof Config !== 'undefined' && Config.ASSET_VERSION) ? ('v=' + encodeURIComponent(Config.ASSET_VERSION)) : '';
         const cb = this._cacheBuster ? ('cb=' + this._cacheBuster) : '';
         const query = [v, cb].filter(Boolean).join('&');
-        const suffixes = ['', '@1x', '@2x'];
+        const suffixes = [...preferredSuffixes, '', '@1x', '@2x'];
         // Try PNG first to avoid noisy .webp 404s on hosts without WebP variants
         const exts = ['.png', '.webp'];
 
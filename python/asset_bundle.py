@@ -0,0 +1,127 @@
+"""
+Asset bundle - the files under assets/ packed into one memory-mapped archive
+
+toolshed/pack_assets.py writes ASSET_BUNDLE: a header (magic, version,
+index length), a JSON index {name: {"offset", "length", "codec", "sha256"}}
+with names relative to assets/ ("sprites/characters/ninja_walk.png"), then
+the file contents, starting at the next multiple of ALIGN. When it exists
+it is opened once, mapped and read ahead in one sequential pass, and every
+asset lookup below is answered from the index with no filesystem access;
+loaders get zero-copy buffer views (or BytesIO over them) for
+pygame.image.load and pygame.mixer.Sound. Without it the same calls read
+the loose files, as they do for any name the bundle doesn't hold.
+
+A bundle older than the loose tree would shadow every edit made since it
+was packed, so when it is opened the folders it holds files from and its
+JSON manifests are checked (a stat each, no directory listing): if any
+of them changed after the bundle was written, it is ignored with a
+warning until toolshed/pack_assets.py is run again.
+"""
+import io
+import json
+import mmap
+import os
+import struct
+from config import ASSET_BUNDLE
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSET_DIR = os.path.join(ROOT, "assets")
+MAGIC = b"SKASSETS"
+VERSION = 1
+HEADER = struct.Struct("<8sII")  # Magic, version, index length
+ALIGN = 16
+
+
+def aligned(n):
+    return -(-n // ALIGN) * ALIGN
+
+
+class AssetBundle:
+    """A mapped bundle file and its index"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            magic, version, index_length = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a version {VERSION} asset bundle")
+            self.index = json.loads(f.read(index_length))
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if hasattr(mmap, "MADV_WILLNEED"):
+            # Ask for the whole file up front: one sequential read instead of a page fault per asset
+            self._map.madvise(mmap.MADV_WILLNEED)
+        self._base = aligned(HEADER.size + index_length)
+        self._view = memoryview(self._map)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def view(self, name):
+        """Read-only buffer over one file's bytes"""
+        entry = self.index[name]
+        start = self._base + entry["offset"]
+        return self._view[start:start + entry["length"]]
+
+
+def changed_since(packed, packed_at):
+    """A loose folder or manifest of `packed` modified after `packed_at`
+    (or gone), or None. Folders change when files in them are added,
+    removed or saved by rename; manifests when a tool regenerates assets."""
+    if not os.path.isdir(ASSET_DIR):
+        return None  # Shipped without the loose tree: the bundle is all there is
+    names = {os.path.dirname(name) for name in packed.index}
+    names.update(name for name in packed.index if name.endswith(".json"))
+    for name in sorted(names):
+        try:
+            if os.path.getmtime(os.path.join(ASSET_DIR, name)) > packed_at:
+                return name or "."
+        except OSError:
+            return name
+    return None
+
+
+_bundle = None
+
+
+def bundle():
+    """The open bundle, or None when there is none (or it is unreadable or stale)"""
+    global _bundle
+    if _bundle is None:
+        path = os.path.join(ROOT, ASSET_BUNDLE)
+        try:
+            _bundle = AssetBundle(path)
+            changed = changed_since(_bundle, os.path.getmtime(path))
+        except (OSError, ValueError, struct.error):
+            _bundle, changed = False, None
+        if changed is not None:
+            print(f"Warning: assets/{changed} changed after {ASSET_BUNDLE} was packed; "
+                  f"loading loose files (run toolshed/pack_assets.py)")
+            _bundle = False
+    return _bundle or None
+
+
+def exists(name):
+    """Whether assets/`name` is available"""
+    packed = bundle()
+    return (packed is not None and name in packed) or os.path.exists(os.path.join(ASSET_DIR, name))
+
+
+def size(name):
+    """Size of assets/`name` in bytes"""
+    packed = bundle()
+    if packed and name in packed:
+        return packed.index[name]["length"]
+    return os.path.getsize(os.path.join(ASSET_DIR, name))
+
+
+def read(name):
+    """Contents of assets/`name` (a zero-copy view when bundled); FileNotFoundError if missing"""
+    packed = bundle()
+    if packed and name in packed:
+        return packed.view(name)
+    with open(os.path.join(ASSET_DIR, name), "rb") as f:
+        return f.read()
+
+
+def open_asset(name):
+    """assets/`name` as a file object, for loaders that take one"""
+    return io.BytesIO(read(name))
@@ -1,15 +1,21 @@
 """
 Audio Manager - Handles all sound effects and music for the game
 """
+import json
 import pygame
 import os
+import zlib
+import asset_bundle
+from config import *
 
 class AudioManager:
     """Manages all game audio including sound effects and music"""
     
     def __init__(self):
         """Initialize the audio manager"""
-        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+        if pygame.mixer.get_init() not in (None, (MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS)):
+            pygame.mixer.quit()  # pygame.init() opened it with the defaults, which init() wouldn't change
+        pygame.mixer.init(frequency=MIXER_FREQUENCY, size=MIXER_SIZE, channels=MIXER_CHANNELS, buffer=MIXER_BUFFER)
         
         # Sound effect channels for mixing
         self.sfx_volume = 0.7
@@ -20,14 +26,15 @@ class AudioManager:
         # Sound effects dictionary
         self.sounds = {}
         
-        # Base paths
-        self.base_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'audio')
-        self.sfx_path = os.path.join(self.base_path, 'sfx')
-        self.music_path = os.path.join(self.base_path, 'music')
+        # Asset names (see asset_bundle.py): files come from the bundle when
+        # there is one, so checking for a sound costs no filesystem access
+        self.sfx_path = 'audio/sfx/'
+        self.music_path = 'audio/music/'
+        self.built_path = 'audio/sfx_mixer/'
+        self.music_file = None  # Keeps the playing track's buffer alive for the mixer
         
-        # Ensure directories exist
-        os.makedirs(self.sfx_path, exist_ok=True)
-        os.makedirs(self.music_path, exist_ok=True)
+        # Pre-converted clips from toolshed/build_audio.py, if they match the mixer
+        self.built_clips = self.load_manifest()
         
         # Load all sound effects
         self.load_sounds()
@@ -41,37 +48,42 @@ class AudioManager:
         self.metal_pad_sound = None
         self.load_metal_pad()
     
+    def load_manifest(self):
+        """Clips built for this mixer format by toolshed/build_audio.py ({} if none)"""
+        try:
+            manifest = json.load(asset_bundle.open_asset(self.built_path + 'manifest.json'))
+        except (OSError, ValueError):
+            return {}
+        built = manifest.get('format', {})
+        frequency, size, channels = pygame.mixer.get_init()
+        if (built.get('frequency'), built.get('size'), built.get('channels')) != (frequency, size, channels):
+            print(f"✗ Built SFX are for {built}, mixer is {frequency} Hz {size}-bit x{channels}; using WAVs")
+            return {}
+        return manifest.get('clips', {})
+    
+    def load_clip(self, filename):
+        """Load a sound, from its pre-converted buffer when one is up to date
+        
+        Built buffers are already in the mixer's format, so SDL doesn't have
+        to resample or convert them. A buffer is only used while the WAV's
+        checksum matches the one it was built from.
+        """
+        name = self.sfx_path + filename
+        clip = self.built_clips.get(os.path.splitext(filename)[0])
+        if clip and (not asset_bundle.exists(name) or zlib.crc32(asset_bundle.read(name)) == clip['source_crc32']):
+            try:
+                return pygame.mixer.Sound(buffer=asset_bundle.read(self.built_path + clip['file']))
+            except OSError:
+                pass  # Fall back to the WAV
+        return pygame.mixer.Sound(file=asset_bundle.open_asset(name))
+    
     def load_sounds(self):
         """Load all sound effects"""
-        sound_files = {
-            # Player sounds
-            'jump': 'jump.wav',
-            'attack1': 'attack1.wav',
-            'attack2': 'attack2.wav',
-            'attack3': 'attack3.wav',
-            'shadow_strike': 'shadow_strike.wav',
-            'player_hit': 'player_hit.wav',
-            'land': 'land.wav',
-            
-            # Enemy sounds
-            'enemy_hit': 'enemy_hit.wav',
-            'enemy_death': 'enemy_death.wav',
-            
-            # UI sounds
-            'menu_select': 'menu_select.wav',
-            'menu_move': 'menu_move.wav',
-            'pause': 'pause.wav',
-            'combo': 'combo.wav',
-            'game_over': 'game_over.wav'
-        }
-        
-        for name, filename in sound_files.items():
-            filepath = os.path.join(self.sfx_path, filename)
-            
+        for name, filename in SOUND_EFFECTS.items():
             # Try to load the sound, skip if file doesn't exist
-            if os.path.exists(filepath):
+            if asset_bundle.exists(self.sfx_path + filename) or os.path.splitext(filename)[0] in self.built_clips:
                 try:
-                    sound = pygame.mixer.Sound(filepath)
+                    sound = self.load_clip(filename)
                     sound.set_volume(self.sfx_volume)
                     self.sounds[name] = sound
                     print(f"✓ Loaded sound: {name}")
@@ -83,10 +95,9 @@ class AudioManager:
     
     def load_metal_pad(self):
         """Load the metal pad sound for background layering"""
-        metal_path = os.path.join(self.sfx_path, 'metal_pad.wav')
-        if os.path.exists(metal_path):
+        if asset_bundle.exists(self.sfx_path + 'metal_pad.wav') or 'metal_pad' in self.built_clips:
             try:
-                self.metal_pad_sound = pygame.mixer.Sound(metal_path)
+                self.metal_pad_sound = self.load_clip('metal_pad.wav')
                 self.metal_pad_sound.set_volume(self.metal_pad_volume)  # Use configurable volume
                 print(f"✓ Loaded metal pad layer")
             except pygame.error as e:
@@ -132,14 +143,14 @@ class AudioManager:
         # Try OGG first, then WAV
         music_file = None
         for ext in ['.ogg', '.wav', '.mp3']:
-            test_file = os.path.join(self.music_path, f"{music_name}{ext}")
-            if os.path.exists(test_file):
-                music_file = test_file
+            if asset_bundle.exists(f"{self.music_path}{music_name}{ext}"):
+                music_file = f"{music_name}{ext}"
                 break
         
         if music_file:
             try:
-                pygame.mixer.music.load(music_file)
+                self.music_file = asset_bundle.open_asset(self.music_path + music_file)
+                pygame.mixer.music.load(self.music_file, music_file)
                 pygame.mixer.music.set_volume(self.music_volume)
                 pygame.mixer.music.play(loop)
                 self.current_music = music_name
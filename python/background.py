@@ -0,0 +1,124 @@
+"""
+Background - Image parallax layers, decoded per level and pre-scaled once
+"""
+import json
+import pygame
+import asset_bundle
+from config import *
+
+# (name, height) -> [scaled surface or None if missing, number of layers using it]
+_images = {}
+_variants = None  # Image name -> {height: file}, from manifest.json
+
+
+def variant_file(name, height):
+    """File of the smallest pre-rendered size of `name` at least `height` tall
+    (the largest if none is), as listed by toolshed/generate_backgrounds.py"""
+    global _variants
+    if _variants is None:
+        try:
+            _variants = json.load(asset_bundle.open_asset("sprites/backgrounds/manifest.json")).get("images", {})
+        except (OSError, ValueError):
+            _variants = {}
+    sizes = sorted((int(h), file) for h, file in _variants.get(name, {}).items())
+    if not sizes:
+        return name + ".png"
+    return next((file for h, file in sizes if h >= height), sizes[-1][1])
+
+
+def acquire_image(name, height):
+    """Image `name` scaled to `height` pixels, decoded on first use and shared"""
+    key = (name, height)
+    entry = _images.get(key)
+    if entry is None:
+        entry = _images[key] = [load_image(name, height), 0]
+    entry[1] += 1
+    return entry[0]
+
+
+def release_image(name, height):
+    """Drop one user of an image; it is freed when the last one lets go"""
+    key = (name, height)
+    entry = _images.get(key)
+    if entry is None:
+        return
+    entry[1] -= 1
+    if entry[1] <= 0:
+        del _images[key]
+
+
+def load_image(name, height):
+    """Decode the closest size, scale to `height` (keeping the aspect ratio) and convert to display format"""
+    try:
+        file = variant_file(name, height)
+        image = pygame.image.load(asset_bundle.open_asset("sprites/backgrounds/" + file), file)
+    except (pygame.error, FileNotFoundError) as e:
+        print(f"Warning: Could not load background {name}: {e}")
+        return None
+    w, h = image.get_size()
+    if h != height:
+        image = pygame.transform.smoothscale(image, (max(1, round(w * height / h)), height))
+    if pygame.display.get_surface() is not None:
+        image = image.convert_alpha() if image.get_flags() & pygame.SRCALPHA else image.convert()
+    return image
+
+
+class ParallaxLayer:
+    """One background image scrolling at `parallax` times the camera speed"""
+
+    def __init__(self, name, parallax):
+        self.name = name
+        self.parallax = parallax
+        self.image = None
+        self.height = None  # Height the image is held at, while acquired
+
+    def prepare(self, height):
+        """Make sure the image is decoded at `height`; returns it (None if missing)"""
+        if height != self.height:
+            self.unload()
+            self.image = acquire_image(self.name, height)
+            self.height = height
+        return self.image
+
+    def unload(self):
+        if self.height is not None:
+            release_image(self.name, self.height)
+        self.image = None
+        self.height = None
+
+    def render(self, screen, camera_x):
+        """Blit the image wrapped horizontally: one or two blits for a full-width image"""
+        width = self.image.get_width()
+        screen_width = screen.get_width()
+        x = -(camera_x * self.parallax * screen_width / SCREEN_WIDTH % width)
+        while x < screen_width:
+            screen.blit(self.image, (round(x), 0))
+            x += width
+
+
+class ParallaxBackground:
+    """A level's image layers, back to front
+
+    Images are decoded the first time the level draws, at the height of the
+    render target, so there is no per-frame scaling. The decoded images are
+    shared between levels using the same picture and freed by unload() when
+    the last level using them goes away.
+    """
+
+    def __init__(self, layers):
+        self.layers = [ParallaxLayer(name, parallax) for name, parallax in layers]
+
+    def render(self, screen, camera_x, max_layers=None):
+        """Draw up to `max_layers` layers; returns False if there was nothing to draw"""
+        height = screen.get_height()
+        layers = self.layers if max_layers is None else self.layers[:max_layers]
+        drawn = False
+        for layer in layers:
+            if layer.prepare(height) is not None:
+                layer.render(screen, camera_x)
+                drawn = True
+        return drawn
+
+    def unload(self):
+        for layer in self.layers:
+            layer.unload()
@@ -0,0 +1,167 @@
+"""
+Capture - Record frames to disk from a background writer thread
+"""
+import json
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+import zlib
+import numpy as np
+import pygame
+from config import *
+
+
+def _png_chunk(tag, data):
+    chunk = tag + data
+    return struct.pack("!I", len(data)) + chunk + struct.pack("!I", zlib.crc32(chunk))
+
+
+def encode_png(scanlines, width, height, level=CAPTURE_PNG_LEVEL):
+    """Encode RGB scanlines (height x (1 + width * 3), filter byte first) as PNG
+
+    zlib releases the GIL while compressing, so encoding on a writer thread
+    runs in parallel with the game loop.
+    """
+    header = struct.pack("!IIBBBBB", width, height, 8, 2, 0, 0, 0)  # 8-bit RGB
+    return (b"\x89PNG\r\n\x1a\n" + _png_chunk(b"IHDR", header)
+            + _png_chunk(b"IDAT", zlib.compress(scanlines, level))
+            + _png_chunk(b"IEND", b""))
+
+
+def frame_buffer(width, height):
+    """Scanline buffer for encode_png() and its (height, width, 3) pixel view"""
+    scanlines = np.zeros((height, 1 + width * 3), dtype=np.uint8)  # Filter byte 0 per row
+    pixels = scanlines[:, 1:].reshape(height, width, 3)  # A view, not a copy
+    return scanlines, pixels
+
+
+def copy_surface(surface, pixels):
+    """Copy a surface's RGB into a (height, width, 3) array"""
+    view = pygame.surfarray.pixels3d(surface)  # (width, height, 3) view, locks the surface
+    np.copyto(pixels, view.transpose(1, 0, 2))
+    del view
+
+
+def channel_bytes(surface):
+    """Byte offsets of R, G and B inside a 32-bit pixel of `surface`"""
+    offsets = [shift // 8 for shift in surface.get_shifts()[:3]]
+    if sys.byteorder == "big":
+        offsets = [3 - offset for offset in offsets]
+    return offsets
+
+
+class FrameCapture:
+    """Copies frames into a preallocated ring and writes them on a background thread
+
+    capture() only copies pixels into a free buffer and queues it; unpacking,
+    encoding and file I/O happen on the writer thread. For 32-bit surfaces
+    (the usual display format) the copy is of the packed pixels, about a
+    tenth of the cost of gathering RGB. When every buffer is still waiting
+    to be written the frame is dropped and counted, so a slow disk never
+    stalls the game. Frames whose size differs from the first one
+    (e.g. after a window resize) are dropped too.
+    """
+
+    def __init__(self, size, out_dir=CAPTURE_DIR, fmt=CAPTURE_FORMAT,
+                 ring_size=CAPTURE_RING_SIZE, fps=FPS):
+        self.size = size
+        self.fmt = fmt
+        self.fps = fps
+        self.out_dir = os.path.join(out_dir, time.strftime("%Y%m%d-%H%M%S"))
+        os.makedirs(self.out_dir, exist_ok=True)
+
+        width, height = size
+        self.raw_frames = [np.empty((height, width), dtype=np.uint32) for _ in range(ring_size)]
+        self.scanlines, self.pixels = frame_buffer(width, height)  # Writer thread only
+        self.free = queue.Queue()
+        for index in range(ring_size):
+            self.free.put(index)
+        self.filled = queue.Queue()
+
+        self.frame_number = 0
+        self.written = 0
+        self.dropped = 0
+        self.wrong_size = 0
+
+        self.raw_file = None
+        if fmt == "raw":
+            self.raw_file = open(os.path.join(self.out_dir, "frames.rgb"), "wb")
+        self.writer = threading.Thread(target=self.write_frames, name="frame-writer", daemon=True)
+        self.writer.start()
+
+    def capture(self, surface):
+        """Queue a copy of `surface`; returns False if the frame was dropped"""
+        frame_number = self.frame_number
+        self.frame_number += 1
+        if surface.get_size() != self.size:
+            self.wrong_size += 1
+            return False
+        try:
+            index = self.free.get_nowait()
+        except queue.Empty:
+            self.dropped += 1
+            return False
+        if surface.get_bitsize() == 32:
+            view = pygame.surfarray.pixels2d(surface)  # (width, height) view, locks the surface
+            np.copyto(self.raw_frames[index], view.T)
+            del view
+            self.filled.put((index, frame_number, channel_bytes(surface)))
+        else:
+            copy_surface(surface, self.pixels_for_slow_path(index))
+            self.filled.put((index, frame_number, None))
+        return True
+
+    def pixels_for_slow_path(self, index):
+        """RGB view over a ring buffer, for surfaces that aren't 32-bit"""
+        height, width = self.raw_frames[index].shape
+        return self.raw_frames[index].view(np.uint8).reshape(-1)[:width * height * 3].reshape(height, width, 3)
+
+    def write_frames(self):
+        """Writer thread: encode and save queued buffers until stop()"""
+        width, height = self.size
+        while True:
+            item = self.filled.get()
+            if item is None:
+                break
+            index, frame_number, channels = item
+            if channels is None:
+                np.copyto(self.pixels, self.pixels_for_slow_path(index))
+            else:
+                packed = self.raw_frames[index].view(np.uint8).reshape(height, width, 4)
+                for channel, offset in enumerate(channels):
+                    np.copyto(self.pixels[:, :, channel], packed[:, :, offset])
+            self.free.put(index)  # Unpacked, so the game can reuse the buffer
+
+            if self.raw_file:
+                self.raw_file.write(self.pixels.tobytes())
+            else:
+                path = os.path.join(self.out_dir, f"frame_{frame_number:06d}.png")
+                with open(path, "wb") as f:
+                    f.write(encode_png(self.scanlines, width, height))
+            self.written += 1
+
+    def stop(self):
+        """Finish writing queued frames and save a manifest; returns the manifest"""
+        self.filled.put(None)
+        self.writer.join()
+        if self.raw_file:
+            self.raw_file.close()
+        manifest = {
+            "format": self.fmt,
+            "width": self.size[0],
+            "height": self.size[1],
+            "fps": self.fps,
+            "frames": self.frame_number,
+            "written": self.written,
+            "dropped": self.dropped,
+            "wrong_size": self.wrong_size,
+        }
+        if self.fmt == "raw":
+            manifest["ffmpeg"] = (f"ffmpeg -f rawvideo -pix_fmt rgb24 -s {self.size[0]}x{self.size[1]} "
+                                  f"-r {self.fps} -i frames.rgb capture.mp4")
+        with open(os.path.join(self.out_dir, "manifest.json"), "w") as f:
+            json.dump(manifest, f, indent=2)
+        return manifest
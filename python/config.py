@@ -22,6 +22,7 @@ ENEMY_SPEED = 150
 ENEMY_HEALTH = 50
 ENEMY_ATTACK_DAMAGE = 10
 ENEMY_POINTS = 100
+ENEMY_JUMP_FORCE = 650  # Ground enemies jump between platforms when pathing
 
 # Colors
 WHITE = (255, 255, 255)
@@ -42,3 +43,139 @@ CHARACTER = {
     "special_ability": "Shadow Strike",
     "color": (64, 64, 64)  # Dark gray for ninja
 }
+
+# Enemy pool: inactive instances created up front at level start
+ENEMY_POOL_PREWARM = {
+    "BASIC": 6,
+    "FAST_BASIC": 3,
+    "FLYING": 4
+}
+
+# Spawn director: population budgets and despawning
+SPAWN_GLOBAL_CAP = 12  # Max active enemies
+SPAWN_TYPE_CAPS = {
+    "BASIC": 6,
+    "FAST_BASIC": 3,
+    "FLYING": 4
+}
+SPAWN_MARGIN = 100  # Spawn at least this far outside the visible screen
+SPAWN_WINDOW = 600  # ...and no further than this beyond the margin
+DESPAWN_DISTANCE = 1200  # Recycle enemies this far outside the visible screen
+SPAWN_ADAPTIVE = True  # Slow spawning down when frames run over budget
+
+# Quality tiers, best first. The quality governor steps down this list when
+# frames run over budget and back up when there is headroom again. "postfx"
+# lists the post-processing effects (see postfx.py) a tier allows.
+QUALITY_TIERS = [
+    {"name": "HIGH", "particles": 8, "parallax_layers": 3, "platform_detail": True,
+     "text_outlines": True, "screen_shake": True, "render_scale": 1.0,
+     "postfx": ("vignette", "flash", "scanlines", "grade")},
+    {"name": "MEDIUM", "particles": 5, "parallax_layers": 2, "platform_detail": True,
+     "text_outlines": True, "screen_shake": True, "render_scale": 1.0,
+     "postfx": ("vignette", "flash", "scanlines", "grade")},
+    {"name": "LOW", "particles": 3, "parallax_layers": 1, "platform_detail": False,
+     "text_outlines": False, "screen_shake": True, "render_scale": 0.75,
+     "postfx": ("vignette", "flash")},
+    {"name": "MINIMAL", "particles": 2, "parallax_layers": 0, "platform_detail": False,
+     "text_outlines": False, "screen_shake": False, "render_scale": 0.5,
+     "postfx": ()},
+]
+QUALITY_WINDOW = 60  # Frames in the rolling frame-time window
+QUALITY_DOWNGRADE_RATIO = 1.1  # Step down when average work time exceeds budget * ratio
+QUALITY_UPGRADE_RATIO = 0.6  # Step up when average work time is below budget * ratio
+QUALITY_HOLD_TIME = 2.0  # Seconds to wait after a tier change before changing again
+QUALITY_LOG_INTERVAL = 10.0  # Minimum seconds between tier change log lines
+
+# Window and internal render target. The world and UI are laid out in
+# SCREEN_WIDTH x SCREEN_HEIGHT logical units; the game draws them into an
+# offscreen surface at RENDER_WIDTH x RENDER_HEIGHT (e.g. 640x360 for
+# pixel-art native rendering), which is scaled to the window once per frame.
+WINDOW_WIDTH = 1280
+WINDOW_HEIGHT = 720
+RENDER_WIDTH = 1280
+RENDER_HEIGHT = 720
+RENDER_SMOOTH = False  # False: nearest-neighbour, True: smoothscale
+RENDER_INTEGER_SCALING = False  # Only scale by whole multiples (letterboxed)
+LETTERBOX_COLOR = (0, 0, 0)
+
+# Input buttons as bits, so a player's input for one tick fits in a byte
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_JUMP = 4
+INPUT_ATTACK = 8
+INPUT_SPECIAL = 16
+
+# Two-player versus (rollback netcode, see netplay.py)
+VERSUS_SPAWNS = [(198, 468), (1050, 468)]
+VERSUS_ROUNDS_TO_WIN = 3
+VERSUS_INPUT_DELAY = 2  # Ticks local input is delayed to hide transport latency
+VERSUS_MAX_ROLLBACK = 8  # Max ticks predicted ahead of the peer before stalling
+VERSUS_TRANSPORT = "loopback"  # "loopback" (in-process) or "udp" (localhost sockets)
+VERSUS_LOOPBACK_LATENCY = 3  # Frames of simulated latency on the loopback, to exercise rollback
+VERSUS_UDP_PORT = 0  # Port player 1 binds (0: any free port); player 2 always takes a free one
+
+# Enemy navigation graph (see navigation.py)
+NAV_JUMP_CLEARANCE = 8  # Margin kept below the peak jump height
+NAV_JUMP_COST = 100  # Extra path cost of a jump, so walking is preferred
+
+# Frame capture (F12 in game, see capture.py) and replays (F11, see replay.py)
+CAPTURE_DIR = "captures"
+CAPTURE_FORMAT = "png"  # "png" (numbered files) or "raw" (one rgb24 stream for ffmpeg)
+CAPTURE_RING_SIZE = 8  # Preallocated frame buffers; frames are dropped when all are busy
+CAPTURE_PNG_LEVEL = 1  # zlib level for captured PNGs (fast, bigger files)
+
+# Post-processing (see postfx.py). F1-F3 toggle effects, F4 cycles colour
+# grades, F6 shows per-effect cost
+POSTFX_EFFECTS = {"vignette": True, "flash": True, "scanlines": False, "grade": False}
+POSTFX_GRADE = "warm"  # Initial colour grade: "warm", "cool" or "noir"
+POSTFX_LUT_BITS = 6  # Bits per channel in the colour grade LUTs (64^3 entries)
+POSTFX_VIGNETTE_INNER = 0.6  # Vignette starts this far out (fraction of the half diagonal)
+POSTFX_VIGNETTE_TIME = 0.4  # Seconds the damage vignette takes to fade
+POSTFX_LOW_HEALTH = 0.3  # Below this health fraction the vignette stays on
+POSTFX_FLASH_TIME = 0.1  # Seconds of the hit flash
+POSTFX_SCANLINE_SHIFT = 2  # Scanlines darken odd rows by 1 / 2**shift
+
+# Tile-based platforms (see tilemap.py)
+TILE_CHUNK_WIDTH = 512  # Logical width of each pre-rendered strip of the level
+
+# Level backgrounds: (image in assets/sprites/backgrounds, parallax factor)
+# layers, back to front (see background.py). The _far/_near halves come from
+# toolshed/generate_backgrounds.py
+LEVEL_BACKGROUND = [("neon_bg_far", 0.1), ("neon_bg_near", 0.2)]
+VERSUS_BACKGROUND = [("city_bg_far", 0.15), ("city_bg_near", 0.3)]
+
+# Audio mixer format. toolshed/build_audio.py pre-converts SFX to this format;
+# rebuild them if it changes
+MIXER_FREQUENCY = 22050
+MIXER_SIZE = -16
+MIXER_CHANNELS = 2
+MIXER_BUFFER = 512
+
+# Sound effects the game loads: name -> file in assets/audio/sfx. Only these
+# (and the metal_pad loop) are pre-converted by toolshed/build_audio.py
+SOUND_EFFECTS = {
+    # Player sounds
+    'jump': 'jump.wav',
+    'attack1': 'attack1.wav',
+    'attack2': 'attack2.wav',
+    'attack3': 'attack3.wav',
+    'shadow_strike': 'shadow_strike.wav',
+    'player_hit': 'player_hit.wav',
+    'land': 'land.wav',
+    
+    # Enemy sounds
+    'enemy_hit': 'enemy_hit.wav',
+    'enemy_death': 'enemy_death.wav',
+    
+    # UI sounds
+    'menu_select': 'menu_select.wav',
+    'menu_move': 'menu_move.wav',
+    'pause': 'pause.wav',
+    'combo': 'combo.wav',
+    'game_over': 'game_over.wav'
+}
+
+# Asset bundle (see asset_bundle.py), relative to the repo root. Built by
+# toolshed/pack_assets.py; the loose files under assets/ are used when it is
+# missing, so re-pack (or delete it) after changing assets
+ASSET_BUNDLE = "assets.pak"
@@ -0,0 +1,41 @@
+"""
+Controls - Keyboard to INPUT_* button mapping
+"""
+import pygame
+from config import *
+
+# INPUT_* bit -> keys (same keys Player.handle_event and Player.update use)
+PLAYER_KEYS = {
+    INPUT_LEFT: (pygame.K_LEFT, pygame.K_a),
+    INPUT_RIGHT: (pygame.K_RIGHT, pygame.K_d),
+    INPUT_JUMP: (pygame.K_SPACE,),
+    INPUT_ATTACK: (pygame.K_x,),
+    INPUT_SPECIAL: (pygame.K_z,),
+}
+
+# Per-player keys for local versus
+VERSUS_KEYS = [
+    {INPUT_LEFT: (pygame.K_a,), INPUT_RIGHT: (pygame.K_d,), INPUT_JUMP: (pygame.K_w,),
+     INPUT_ATTACK: (pygame.K_f,), INPUT_SPECIAL: (pygame.K_g,)},
+    {INPUT_LEFT: (pygame.K_LEFT,), INPUT_RIGHT: (pygame.K_RIGHT,), INPUT_JUMP: (pygame.K_UP,),
+     INPUT_ATTACK: (pygame.K_k,), INPUT_SPECIAL: (pygame.K_l,)},
+]
+
+
+def read_buttons(keys, keymap=PLAYER_KEYS):
+    """Held INPUT_* bits from a pygame.key.get_pressed() result"""
+    buttons = 0
+    for bit, key_codes in keymap.items():
+        for key in key_codes:
+            if keys[key]:
+                buttons |= bit
+                break
+    return buttons
+
+
+def key_button(key, keymap=PLAYER_KEYS):
+    """INPUT_* bit a key is bound to (0 if unbound)"""
+    for bit, key_codes in keymap.items():
+        if key in key_codes:
+            return bit
+    return 0
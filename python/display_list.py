@@ -0,0 +1,128 @@
+"""
+Display list - Batches sprite blits per frame and flushes them with Surface.blits
+"""
+import pygame
+from config import *
+
+# Draw layers, back to front
+LAYER_ENEMIES = 10
+LAYER_PLAYER = 20
+LAYER_EFFECTS = 30
+LAYER_TEXT = 40
+LAYER_HUD = 50
+
+
+class DisplayList:
+    """Per-frame list of (surface, dest) blit commands grouped by layer
+
+    Renderers submit commands instead of blitting directly. flush() draws the
+    layers in ascending order, one Surface.blits call per layer, so a frame
+    costs a handful of Python->SDL calls instead of one per sprite. The layer
+    buckets are kept between frames and only cleared, so steady-state frames
+    don't reallocate them.
+    """
+
+    def __init__(self, layers=(LAYER_ENEMIES, LAYER_PLAYER, LAYER_EFFECTS, LAYER_TEXT, LAYER_HUD)):
+        self.buckets = {layer: [] for layer in layers}
+        self.layer_order = sorted(self.buckets)
+        self.count = 0
+
+    def submit(self, surface, dest, layer=LAYER_ENEMIES):
+        """Queue a blit of `surface` at `dest` (a point or rect) on `layer`"""
+        bucket = self.buckets.get(layer)
+        if bucket is None:
+            bucket = self.buckets[layer] = []
+            self.layer_order = sorted(self.buckets)
+        bucket.append((surface, dest))
+        self.count += 1
+
+    def flush(self, target):
+        """Blit all queued commands onto `target` in layer order and clear the list"""
+        for layer in self.layer_order:
+            bucket = self.buckets[layer]
+            if bucket:
+                target.blits(bucket, doreturn=False)
+                bucket.clear()
+        self.count = 0
+
+    def clear(self):
+        """Drop all queued commands without drawing them"""
+        for bucket in self.buckets.values():
+            bucket.clear()
+        self.count = 0
+
+
+def draw(screen, display_list, surface, dest, layer):
+    """Submit to the display list if there is one, otherwise blit immediately"""
+    if display_list is not None:
+        display_list.submit(surface, dest, layer)
+    else:
+        screen.blit(surface, dest)
+
+
+# (width, height, color, alpha) -> solid rectangle surface
+_fill_surfaces = {}
+
+
+def fill_surface(width, height, color, alpha=None):
+    """Return a cached solid rectangle (translucent with `alpha`), so
+    placeholder shapes can go through the display list like sprites"""
+    width = max(1, int(width))
+    height = max(1, int(height))
+    key = (width, height, tuple(color), alpha)
+    surface = _fill_surfaces.get(key)
+    if surface is None:
+        surface = pygame.Surface((width, height))
+        surface.fill(color)
+        if alpha is not None:
+            surface.set_alpha(alpha)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        _fill_surfaces[key] = surface
+    return surface
+
+
+# (radius, color) -> circle on a transparent square
+_circle_surfaces = {}
+
+
+def circle_surface(radius, color):
+    """Return a cached filled circle; blit it at (center - radius)"""
+    radius = max(1, int(radius))
+    key = (radius, tuple(color))
+    surface = _circle_surfaces.get(key)
+    if surface is None:
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, color, (radius, radius), radius)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        _circle_surfaces[key] = surface
+    return surface
+
+
+# (width, height, filled, border) -> pre-rendered bar surface
+_bar_surfaces = {}
+
+
+def health_bar_surface(width, height, filled, back_color=RED, fill_color=GREEN, border=0):
+    """Return a cached health bar surface (red background, green fill)
+
+    Sizes are in target pixels; bars are reused across enemies and frames, so
+    there are at most width + 1 variants per bar size.
+    """
+    width = max(1, int(width))
+    height = max(1, int(height))
+    filled = max(0, min(int(filled), width))
+    key = (width, height, filled, back_color, fill_color, border)
+    bar = _bar_surfaces.get(key)
+    if bar is None:
+        bar = pygame.Surface((width, height))
+        bar.fill(back_color)
+        if filled:
+            bar.fill(fill_color, (0, 0, filled, height))
+        if border:
+            pygame.draw.rect(bar, WHITE, bar.get_rect(), border)
+        if pygame.display.get_surface() is not None:
+            bar = bar.convert()
+        _bar_surfaces[key] = bar
+    return bar
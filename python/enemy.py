@@ -4,19 +4,39 @@ Enemy character class
 import pygame
 from config import *
 from sprite_loader import sprite_loader, Animation
+from render_target import render_scale, scale_surface, flash_surface
+from display_list import draw, fill_surface, health_bar_surface, LAYER_ENEMIES
+from collision import move as sweep_move
 
 class Enemy:
     """Base enemy class"""
     
     def __init__(self, x, y, enemy_type="BASIC", audio_manager=None):
-        self.x = x
-        self.y = y
         self.enemy_type = enemy_type
         self.audio_manager = audio_manager
         
         # Load sprites based on enemy type
         self.load_sprites()
         
+        # Rects are allocated once and repositioned on every reinit
+        self.rect = pygame.Rect(x, y, 0, 0)
+        self.attack_hitbox = pygame.Rect(0, 0, 60, 40)
+        
+        # Slot in EnemyManager.enemies (used for swap-remove), -1 when inactive
+        self.pool_index = -1
+        
+        self.reinit(x, y)
+    
+    def reinit(self, x, y):
+        """Reset the enemy in place from its archetype defaults
+        
+        Sprites, rects and the animation objects are kept, so a pooled enemy
+        can be respawned without any loading or allocation.
+        """
+        enemy_type = self.enemy_type
+        self.x = x
+        self.y = y
+        
         # Set size based on type
         if enemy_type == "BASIC" or enemy_type == "FAST_BASIC":
             self.width = 48
@@ -37,7 +57,7 @@ class Enemy:
             self.width = 50
             self.height = 70
             
-        self.rect = pygame.Rect(x, y, self.width, self.height)
+        self.rect.update(x, y, self.width, self.height)
         
         # Stats
         if enemy_type == "FAST_BASIC":
@@ -61,6 +81,11 @@ class Enemy:
         self.start_x = x
         self.start_y = y
         
+        # Path following (ground enemies, see navigation.py)
+        self.nav_node = None  # Platform surface we last stood on
+        self.nav_goal = None  # Surface the current edge leads towards
+        self.nav_edge = -1  # Index of the edge being followed, -1 for none
+        
         # Flying enemy specific
         if enemy_type == "FLYING":
             self.hover_time = 0
@@ -76,7 +101,7 @@ class Enemy:
         self.attack_cooldown = 2.0
         self.attack_cooldown_timer = 0
         self.attack_range = 80
-        self.attack_hitbox = pygame.Rect(0, 0, 60, 40)
+        self.attack_hitbox.update(0, 0, 60, 40)
         
         # Hit feedback
         self.hit_stun_timer = 0
@@ -90,6 +115,9 @@ class Enemy:
         self.current_animation = "idle"
         self.current_anim = None
         self.last_anim_state = "idle"
+        if self.animations:
+            for anim in self.animations.values():
+                anim.reset()
     
     def load_sprites(self):
         """Load sprites based on enemy type"""
@@ -151,8 +179,12 @@ class Enemy:
             self.sprites = None
             self.animations = None
     
-    def update(self, dt, level, player):
-        """Update enemy behavior"""
+    def update(self, dt, level, player, player_node=None):
+        """Update enemy behavior
+        
+        player_node is the nav graph surface the player last stood on; ground
+        enemies path towards it when chasing.
+        """
         # Check player distance
         distance_to_player = abs(self.x - player.x)
         
@@ -179,7 +211,8 @@ class Enemy:
             if self.state == "PATROL":
                 self.patrol(dt)
             elif self.state == "CHASE":
-                self.chase(dt, player)
+                if not self.follow_path(dt, level.nav_graph, player_node):
+                    self.chase(dt, player)
             elif self.state == "ATTACK":
                 self.attack_player(dt, player)
         else:
@@ -192,25 +225,29 @@ class Enemy:
             if self.velocity_y > MAX_FALL_SPEED:
                 self.velocity_y = MAX_FALL_SPEED
         
-        # Update horizontal position (including knockback)
+        # Move (including knockback)
         total_velocity_x = self.velocity_x + self.knockback_velocity_x
-        self.x += total_velocity_x * dt
-        self.rect.x = int(self.x)
-        
-        # Check horizontal collisions with platforms (not for flying enemies)
         if self.enemy_type != "FLYING":
-            for platform in level.platforms:
-                if self.rect.colliderect(platform):
-                    # Push out of platform and turn around
-                    if self.velocity_x > 0:  # Moving right
-                        self.x = platform.left - self.width
-                        self.velocity_x = -self.speed
-                        self.facing_right = False
-                    elif self.velocity_x < 0:  # Moving left
-                        self.x = platform.right
-                        self.velocity_x = self.speed
-                        self.facing_right = True
-                    self.rect.x = int(self.x)
+            # Swept against platforms, so fast falls can't tunnel through them
+            self.x, self.y, hit_x, hit_y = sweep_move(
+                self.x, self.y, self.width, self.height,
+                total_velocity_x * dt, self.velocity_y * dt, level.platforms)
+            if hit_x is not None:
+                # Turn around at platform sides
+                if self.velocity_x > 0:  # Moving right
+                    self.velocity_x = -self.speed
+                    self.facing_right = False
+                elif self.velocity_x < 0:  # Moving left
+                    self.velocity_x = self.speed
+                    self.facing_right = True
+            if hit_y is not None:
+                # Landed, or hit head on platform
+                self.velocity_y = 0
+        else:
+            self.x += total_velocity_x * dt
+            self.y += self.velocity_y * dt
+        self.rect.x = int(self.x)
+        self.rect.y = int(self.y)
         
         # Check boundaries (level edges)
         for boundary in level.boundaries:
@@ -230,28 +267,6 @@ class Enemy:
                     self.health = 0
                 self.rect.x = int(self.x)
         
-        # Update vertical position
-        self.y += self.velocity_y * dt
-        self.rect.y = int(self.y)
-        
-        # Check vertical collisions with platforms (not for flying enemies)
-        if self.enemy_type != "FLYING":
-            on_ground = False
-            for platform in level.platforms:
-                if self.rect.colliderect(platform):
-                    if self.velocity_y > 0:  # Falling down
-                        # Land on platform
-                        self.y = platform.top - self.height
-                        self.rect.y = int(self.y)
-                        self.velocity_y = 0
-                        on_ground = True
-                        break
-                    elif self.velocity_y < 0:  # Jumping up
-                        # Hit head on platform
-                        self.y = platform.bottom
-                        self.rect.y = int(self.y)
-                        self.velocity_y = 0
-        
         # Update attack
         if self.is_attacking:
             self.attack_timer -= dt
@@ -366,6 +381,65 @@ class Enemy:
                     self.velocity_x = -self.speed
                     self.facing_right = False
     
+    def follow_path(self, dt, nav, goal):
+        """Steer along the nav graph towards the `goal` surface
+        
+        Returns False when there is nothing to follow (flying enemy, same
+        surface as the player, or no path), so the caller chases directly.
+        The path is only looked up again when the enemy reaches a new surface
+        or the player moves to a different one.
+        """
+        if self.enemy_type == "FLYING" or goal is None:
+            return False
+        
+        # Standing on a surface (node_at allows the few pixels of resting jitter)
+        node = nav.node_at(self.rect) if self.velocity_y >= 0 else None
+        if node is not None:
+            if node != self.nav_node:
+                self.nav_node = node
+                self.nav_edge = -1
+        elif self.nav_edge >= 0:
+            # Mid-air on a jump or drop: steer to the landing spot
+            edge = nav.edges[self.nav_edge]
+            if edge.kind == "jump" and self.rect.bottom > edge.land_top:
+                self.velocity_x = 0  # Rise beside the platform before moving over it
+            else:
+                self.move_towards(edge.land_x, dt)
+            return True
+        
+        if self.nav_node is None or self.nav_node == goal:
+            self.nav_edge = -1
+            return False
+        if self.nav_edge < 0 or self.nav_goal != goal:
+            self.nav_edge = nav.choose_edge(self.nav_node, goal, self.x)
+            self.nav_goal = goal
+        if self.nav_edge < 0:
+            return False
+        
+        edge = nav.edges[self.nav_edge]
+        if edge.kind == "jump":
+            if node is None or node != edge.source:
+                return True  # Falling or knocked back: only take off from the edge's own surface
+            if abs(self.x - edge.takeoff_x) > 1:
+                self.move_towards(edge.takeoff_x, dt)
+            else:
+                self.velocity_x = 0
+                self.velocity_y = -ENEMY_JUMP_FORCE
+        else:
+            # Walk (or drop) off the end of the platform
+            self.velocity_x = edge.direction * self.speed
+            self.facing_right = edge.direction > 0
+        return True
+    
+    def move_towards(self, target_x, dt):
+        """Walk towards target_x, arriving exactly on it"""
+        dx = target_x - self.x
+        if abs(dx) <= self.speed * dt:
+            self.velocity_x = dx / dt if dt > 0 else 0
+            return
+        self.velocity_x = self.speed if dx > 0 else -self.speed
+        self.facing_right = dx > 0
+    
     def attack_player(self, dt, player):
         """Attack the player"""
         self.velocity_x = 0
@@ -390,45 +464,41 @@ class Enemy:
             else:
                 self.audio_manager.play_sound('enemy_hit')
     
-    def render(self, screen, camera_x):
-        """Render the enemy"""
+    def render(self, screen, camera_x, display_list=None):
+        """Render the enemy (sprites go through the display list when given)"""
+        s = render_scale(screen)
         screen_x = int(self.x - camera_x)
         screen_y = int(self.y)
         
         # Try to render animated sprite
         if self.animations and self.current_anim:
-            sprite = self.current_anim.get_current_frame()
-            
             # Flip sprite based on facing direction
             # Enemy sprites face left by default, so flip when facing_right
-            if self.facing_right:
-                sprite = pygame.transform.flip(sprite, True, False)
+            sprite = scale_surface(self.current_anim.get_current_frame(), s, self.facing_right)
             
-            # Hit flash effect
+            # Hit flash effect (white copy cached per animation frame)
             if self.hit_stun_timer > 0:
-                # Create white flash overlay
-                flash_sprite = sprite.copy()
-                flash_sprite.fill((255, 255, 255, 180), special_flags=pygame.BLEND_RGB_ADD)
-                sprite = flash_sprite
+                sprite = flash_surface(sprite)
             
             # Center sprite on collision box
             sprite_rect = sprite.get_rect()
-            sprite_rect.center = (screen_x + self.width // 2, screen_y + self.height // 2)
-            screen.blit(sprite, sprite_rect)
+            sprite_rect.center = ((screen_x + self.width // 2) * s, (screen_y + self.height // 2) * s)
+            draw(screen, display_list, sprite, sprite_rect, LAYER_ENEMIES)
         else:
             # Fallback to colored rectangles with hit flash
             if self.hit_stun_timer > 0:
                 color = WHITE
             else:
                 color = RED if self.state == "ATTACK" else YELLOW if self.state == "CHASE" else GRAY
-            pygame.draw.rect(screen, color, (screen_x, screen_y, self.width, self.height))
+            body = fill_surface(self.width * s, self.height * s, color)
+            draw(screen, display_list, body, (screen_x * s, screen_y * s), LAYER_ENEMIES)
         
-        # Health bar
-        health_ratio = self.health / self.max_health
+        # Health bar (cached surface per fill width)
+        health_ratio = max(0, self.health) / self.max_health
         bar_width = max(self.width, 50)
         bar_x = screen_x + (self.width - bar_width) // 2
-        pygame.draw.rect(screen, RED, (bar_x, screen_y - 10, bar_width, 5))
-        pygame.draw.rect(screen, GREEN, (bar_x, screen_y - 10, int(bar_width * health_ratio), 5))
+        bar = health_bar_surface(bar_width * s, 5 * s, int(bar_width * health_ratio) * s)
+        draw(screen, display_list, bar, (bar_x * s, (screen_y - 10) * s), LAYER_ENEMIES)
         
         # Debug: Draw collision box outline to see sprite alignment (TEMPORARY)
         if False:  # Set to False to disable debug
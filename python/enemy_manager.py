@@ -2,20 +2,34 @@
 Enemy manager - Handles spawning and managing enemies
 """
 import pygame
-from enemy import Enemy
+from config import ENEMY_POOL_PREWARM, SCREEN_WIDTH
+from enemy_pool import EnemyPool
+from spawn_director import SpawnDirector
 
 class EnemyManager:
     """Manages all enemies in the level"""
     
     def __init__(self, audio_manager=None):
         self.enemies = []
-        self.spawn_timer = 0
-        self.spawn_interval = 5.0  # Seconds between spawns
-        self.flying_spawn_timer = 0
-        self.flying_spawn_interval = 8.0  # Spawn flying enemies less frequently
         self.audio_manager = audio_manager
         
-        # Spawn initial enemies
+        # Nav graph surface the player last stood on (kept while airborne)
+        self.player_node = None
+        
+        # Player whose attack hit tracking must forget recycled enemies
+        self.player = None
+        
+        # Timed spawning, population caps and despawning
+        self.director = SpawnDirector()
+        
+        # Recycled enemy instances (see enemy_pool.py)
+        self.pool = EnemyPool(audio_manager=audio_manager)
+        self.pool.prewarm(ENEMY_POOL_PREWARM)
+        
+        self.spawn_initial_enemies()
+    
+    def spawn_initial_enemies(self):
+        """Spawn the enemies present at level start"""
         self.spawn_enemy(400, 500, "BASIC")
         self.spawn_enemy(700, 500, "BASIC")
         self.spawn_enemy(1000, 500, "BASIC")
@@ -26,53 +40,64 @@ class EnemyManager:
     
     def spawn_enemy(self, x, y, enemy_type="BASIC"):
         """Spawn a new enemy at position"""
-        enemy = Enemy(x, y, enemy_type=enemy_type, audio_manager=self.audio_manager)
+        enemy = self.pool.acquire(x, y, enemy_type)
+        enemy.pool_index = len(self.enemies)
         self.enemies.append(enemy)
+        return enemy
     
-    def update(self, dt, level, player):
+    def update(self, dt, level, player, camera_x=None):
         """Update all enemies"""
-        # Update spawn timer for ground enemies
-        self.spawn_timer += dt
-        if self.spawn_timer >= self.spawn_interval:
-            self.spawn_timer = 0
-            # Spawn enemy off-screen to the right
-            import random
-            enemy_type = "BASIC" if random.random() < 0.7 else "FAST_BASIC"
-            self.spawn_enemy(player.x + 800, 500, enemy_type)
+        if camera_x is None:
+            camera_x = player.x - SCREEN_WIDTH // 2
+        self.player = player
+        self.director.update(dt, self, level, camera_x)
         
-        # Update spawn timer for flying enemies
-        self.flying_spawn_timer += dt
-        if self.flying_spawn_timer >= self.flying_spawn_interval:
-            self.flying_spawn_timer = 0
-            # Spawn flying enemy off-screen at random height
-            import random
-            spawn_y = random.randint(200, 400)
-            self.spawn_enemy(player.x + 900, spawn_y, "FLYING")
+        # Enemies only repath when this changes
+        if player.on_ground:
+            node = level.nav_graph.node_at(player.rect)
+            if node is not None:
+                self.player_node = node
         
         # Update each enemy
         for enemy in self.enemies:
-            enemy.update(dt, level, player)
+            enemy.update(dt, level, player, self.player_node)
         
-        # Remove dead enemies
-        self.enemies = [e for e in self.enemies if e.health > 0]
+        # Recycle dead enemies (walk backwards so swap-remove never skips one)
+        for i in range(len(self.enemies) - 1, -1, -1):
+            if self.enemies[i].health <= 0:
+                self.remove_enemy(self.enemies[i])
     
     def remove_enemy(self, enemy):
-        """Remove an enemy"""
-        if enemy in self.enemies:
-            self.enemies.remove(enemy)
+        """Remove an enemy and return it to the pool"""
+        index = enemy.pool_index
+        if not (0 <= index < len(self.enemies)) or self.enemies[index] is not enemy:
+            return
+        
+        # Swap-remove: move the last enemy into the freed slot
+        last = self.enemies.pop()
+        if last is not enemy:
+            self.enemies[index] = last
+            last.pool_index = index
+        self.release(enemy)
+    
+    def release(self, enemy):
+        """Return an enemy to the pool; it comes back as a new enemy, so the
+        player's current attack must not remember hitting it"""
+        if self.player is not None:
+            self.player.hit_enemies.discard(enemy)
+        self.pool.release(enemy)
     
     def reset(self):
         """Reset all enemies"""
+        for enemy in self.enemies:
+            self.release(enemy)
         self.enemies.clear()
-        self.spawn_enemy(400, 500, "BASIC")
-        self.spawn_enemy(700, 500, "BASIC")
-        self.spawn_enemy(1000, 500, "BASIC")
-        self.spawn_enemy(600, 300, "FLYING")
-        self.spawn_enemy(1200, 250, "FLYING")
-        self.spawn_timer = 0
-        self.flying_spawn_timer = 0
+        self.pool.prewarm(ENEMY_POOL_PREWARM)
+        self.spawn_initial_enemies()
+        self.director.reset()
+        self.player_node = None
     
-    def render(self, screen, camera_x):
+    def render(self, screen, camera_x, display_list=None):
         """Render all enemies"""
         for enemy in self.enemies:
-            enemy.render(screen, camera_x)
+            enemy.render(screen, camera_x, display_list)
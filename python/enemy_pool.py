@@ -0,0 +1,42 @@
+"""
+Enemy pool - Recycles enemy instances instead of rebuilding them
+"""
+from enemy import Enemy
+
+
+class EnemyPool:
+    """Typed free lists of inactive enemies, keyed by enemy type"""
+
+    def __init__(self, audio_manager=None):
+        self.audio_manager = audio_manager
+        self.free = {}  # enemy_type -> list of inactive Enemy instances
+        self.created = 0  # Total instances ever constructed (for diagnostics)
+
+    def prewarm(self, counts):
+        """Make sure at least `counts[type]` inactive enemies exist per type"""
+        for enemy_type, count in counts.items():
+            free_list = self.free.setdefault(enemy_type, [])
+            while len(free_list) < count:
+                free_list.append(self._create(enemy_type))
+
+    def acquire(self, x, y, enemy_type="BASIC"):
+        """Return an enemy of the given type reset to its archetype defaults"""
+        free_list = self.free.get(enemy_type)
+        if free_list:
+            enemy = free_list.pop()
+            enemy.reinit(x, y)
+            return enemy
+        return self._create(enemy_type, x, y)
+
+    def release(self, enemy):
+        """Return an enemy to its free list"""
+        enemy.pool_index = -1
+        self.free.setdefault(enemy.enemy_type, []).append(enemy)
+
+    def available(self, enemy_type):
+        """Number of inactive enemies of a type"""
+        return len(self.free.get(enemy_type, ()))
+
+    def _create(self, enemy_type, x=0, y=0):
+        self.created += 1
+        return Enemy(x, y, enemy_type=enemy_type, audio_manager=self.audio_manager)
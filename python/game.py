@@ -8,12 +8,22 @@ from enemy_manager import EnemyManager
 from ui import UI
 from visual_effects import DamageNumber, HitSpark
 from audio_manager import AudioManager
+from config import QUALITY_LOG_INTERVAL
+from quality import QualityGovernor
+from display_list import DisplayList
+from snapshot import SnapshotRing, capture, restore
+from versus import VersusMode
+from controls import read_buttons, key_button
+from replay import ReplayRecorder
+from postfx import PostProcess
 
 class Game:
     """Main game controller"""
     
-    def __init__(self, screen, width, height):
-        self.screen = screen
+    def __init__(self, screen, width, height, render_target=None):
+        # With a render target the game draws offscreen and main.py presents it
+        self.render_target = render_target
+        self.screen = render_target.surface if render_target else screen
         self.width = width
         self.height = height
         
@@ -21,7 +31,7 @@ class Game:
         self.audio_manager = AudioManager()
         
         # Game state
-        self.state = "MENU"  # MENU, PLAYING, PAUSED, GAME_OVER
+        self.state = "MENU"  # MENU, PLAYING, PAUSED, GAME_OVER, VERSUS
         self.score = 0
         self.lives = 3
         
@@ -35,6 +45,12 @@ class Game:
         # Font for damage numbers
         self.damage_font = pygame.font.Font(None, 24)
         
+        # Sprite blits are batched per frame and flushed with Surface.blits
+        self.display_list = DisplayList()
+        
+        # Full-screen post-processing over the rendered game (see postfx.py)
+        self.postfx = PostProcess()
+        
         # Initialize game components
         self.player = Player(198, 468, audio_manager=self.audio_manager)  # Spawn on left platform to avoid ground hazards
         self.level = Level(width, height)
@@ -44,6 +60,49 @@ class Game:
         # Camera
         self.camera_x = 0
         
+        # Buttons pressed since the last update, and the input recorder (F11)
+        self.pressed_buttons = 0
+        self.recorder = None
+        
+        # Two-player versus mode, created when a versus match starts
+        self.versus = None
+        
+        # Recent-state ring for rewind/checkpoints, and the level-start state for restarts
+        self.snapshots = SnapshotRing()
+        self.start_snapshot = None
+        
+        # Adaptive render quality (see quality.py)
+        self.quality = QualityGovernor()
+        self.apply_quality()
+        self.logged_tier = self.quality.tier
+        self.quality_log_timer = 0.0
+    
+    def record_frame(self, frame_time, dt=None):
+        """Feed one frame's work time to the quality governor"""
+        if self.quality.record_frame(frame_time, dt):
+            self.apply_quality()
+        
+        # Log the tier it settles on, at most once per QUALITY_LOG_INTERVAL
+        self.quality_log_timer -= dt if dt is not None else frame_time
+        if self.quality.tier != self.logged_tier and self.quality_log_timer <= 0:
+            self.logged_tier = self.quality.tier
+            self.quality_log_timer = QUALITY_LOG_INTERVAL
+            print(f"Quality tier -> {self.quality.tier_name} ({self.quality.telemetry()})")
+    
+    def apply_quality(self):
+        """Push the current quality tier settings to the components that use them"""
+        settings = self.quality.settings
+        levels = [self.level]
+        if self.versus:
+            levels.append(self.versus.level)
+        for level in levels:
+            level.parallax_layers = settings["parallax_layers"]
+            level.platform_detail = settings["platform_detail"]
+        self.postfx.allowed = settings["postfx"]
+        if self.render_target:
+            self.render_target.set_render_scale(settings["render_scale"])
+            self.screen = self.render_target.surface
+        
     def handle_event(self, event):
         """Handle input events"""
         if event.type == pygame.KEYDOWN:
@@ -55,6 +114,8 @@ class Game:
                 elif self.state == "PAUSED":
                     self.state = "PLAYING"
                     self.audio_manager.unpause_music()
+                elif self.state == "VERSUS":
+                    self.end_versus()
             elif event.key == pygame.K_RETURN:
                 if self.state == "MENU":
                     self.audio_manager.play_sound('menu_select')
@@ -62,6 +123,22 @@ class Game:
                 elif self.state == "GAME_OVER":
                     self.audio_manager.play_sound('menu_select')
                     self.start_game()  # Restart game
+                elif self.state == "VERSUS" and self.versus.match.match_winner is not None:
+                    self.audio_manager.play_sound('menu_select')
+                    self.start_versus()  # Rematch
+            elif event.key == pygame.K_v and self.state == "MENU":
+                self.audio_manager.play_sound('menu_select')
+                self.start_versus()
+            elif event.key == pygame.K_F1:
+                self.postfx.toggle("vignette")
+            elif event.key == pygame.K_F2:
+                self.postfx.toggle("flash")
+            elif event.key == pygame.K_F3:
+                self.postfx.toggle("scanlines")
+            elif event.key == pygame.K_F4:
+                self.postfx.cycle_grade()
+            elif event.key == pygame.K_F6:
+                self.postfx.show_costs = not self.postfx.show_costs
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if self.state == "MENU" or self.state == "GAME_OVER":
@@ -69,24 +146,90 @@ class Game:
                 self.start_game()
 
         if self.state == "PLAYING":
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_BACKSPACE:
+                    if self.snapshots.rewind(self):  # About one second back
+                        self.split_recording()
+                elif event.key == pygame.K_F5:
+                    self.snapshots.save_checkpoint(self)
+                elif event.key == pygame.K_F9:
+                    if self.snapshots.load_checkpoint(self):
+                        self.split_recording()
+                elif event.key == pygame.K_F11:
+                    self.toggle_recording()
+                self.pressed_buttons |= key_button(event.key)
             self.player.handle_event(event)
     
     def start_game(self):
         """Start a new game"""
-        self.state = "PLAYING"
-        self.score = 0
-        self.lives = 3
-        self.player.reset()
-        self.enemy_manager.reset()
+        if self.start_snapshot is None:
+            self.state = "PLAYING"
+            self.score = 0
+            self.lives = 3
+            self.camera_x = 0
+            self.player.reset()
+            self.enemy_manager.reset()
+            self.start_snapshot = capture(self)
+        else:
+            # Restart by restoring the level-start state in place (keep the RNG
+            # running so every run doesn't spawn identically)
+            restore(self, self.start_snapshot, restore_rng=False)
+        self.snapshots.clear()
+        self.postfx.clear()
         
         # Start gameplay music
         self.audio_manager.play_music('gameplay', loop=-1)
     
-    def update(self, dt):
-        """Update game state"""
+    def start_versus(self):
+        """Start a two-player versus match"""
+        if self.versus:
+            self.versus.close()
+        self.versus = VersusMode(self.width, self.height, audio_manager=self.audio_manager)
+        self.apply_quality()
+        self.state = "VERSUS"
+        self.audio_manager.play_music('gameplay', loop=-1)
+    
+    def end_versus(self):
+        """Leave versus mode and go back to the menu"""
+        print(f"Versus session: {self.versus.sessions[0].telemetry()}")
+        self.versus.close()
+        self.versus = None
+        self.state = "MENU"
+        self.audio_manager.stop_music()
+    
+    def toggle_recording(self):
+        """Start recording inputs for a replay, or stop and save it"""
+        if self.recorder is None:
+            self.recorder = ReplayRecorder(self)
+            print("Recording replay...")
+        else:
+            path = self.recorder.save()
+            print(f"Saved replay ({len(self.recorder.frames)} frames): {path}")
+            self.recorder = None
+    
+    def split_recording(self):
+        """After a rewind/checkpoint load, save the replay so far and record a new one"""
+        if self.recorder:
+            self.toggle_recording()
+            self.toggle_recording()
+    
+    def update(self, dt, buttons=None):
+        """Update game state
+        
+        buttons: held INPUT_* bits for the player (read from the keyboard if None)
+        """
+        if self.state == "VERSUS":
+            self.versus.update(dt)
+            return
         if self.state != "PLAYING":
             return
         
+        if buttons is None:
+            buttons = read_buttons(pygame.key.get_pressed())
+        if self.recorder:
+            self.recorder.record(dt, buttons, self.pressed_buttons, self.quality.tier)
+        self.pressed_buttons = 0
+        
         # Update visual effect timers
         if self.screen_shake_timer > 0:
             self.screen_shake_timer -= dt
@@ -102,15 +245,16 @@ class Game:
         self.hit_sparks = [hs for hs in self.hit_sparks if hs.is_alive()]
         for hs in self.hit_sparks:
             hs.update(dt)
+        self.postfx.update(dt, self.player.health / self.player.max_health)
         
         # Pass enemy list to player for upward strike detection
         self.player._current_enemies = self.enemy_manager.enemies
         
         # Update player
-        self.player.update(dt, self.level)
+        self.player.update(dt, self.level, buttons)
         
         # Update enemies
-        self.enemy_manager.update(dt, self.level, self.player)
+        self.enemy_manager.update(dt, self.level, self.player, self.camera_x)
         
         # Check collisions
         self.check_collisions()
@@ -118,6 +262,8 @@ class Game:
         # Update camera to follow player
         self.update_camera()
         
+        self.snapshots.record(self, dt)
+        
     def check_collisions(self):
         """Check for collisions between game objects"""
         # Player attacks hitting enemies
@@ -151,7 +297,8 @@ class Game:
                         
                         hit_spark = HitSpark(
                             enemy.x + enemy.width // 2,
-                            enemy.y + enemy.height // 2
+                            enemy.y + enemy.height // 2,
+                            self.quality.settings["particles"]
                         )
                         self.hit_sparks.append(hit_spark)
                         
@@ -159,6 +306,7 @@ class Game:
                         self.screen_shake_timer = 0.1
                         self.screen_shake_intensity = 3 if enemy.health > 0 else 6
                         self.hit_pause_timer = 0.05  # Brief pause on hit
+                        self.postfx.flash()
                         
                         # Score and cleanup
                         if enemy.health <= 0:
@@ -174,7 +322,10 @@ class Game:
         # Enemy attacks hitting player
         for enemy in self.enemy_manager.enemies:
             if enemy.is_attacking and enemy.attack_hitbox.colliderect(self.player.rect):
+                health = self.player.health
                 self.player.take_damage(enemy.attack_damage)
+                if self.player.health < health:
+                    self.postfx.damage()
                 
                 # Screen shake on player hit
                 self.screen_shake_timer = 0.2
@@ -196,7 +347,7 @@ class Game:
         self.camera_x = max(0, min(target_x, self.level.width - self.width))
         
         # Apply screen shake
-        if self.screen_shake_timer > 0:
+        if self.screen_shake_timer > 0 and self.quality.settings["screen_shake"]:
             import random
             shake_x = random.randint(-int(self.screen_shake_intensity), int(self.screen_shake_intensity))
             self.camera_x += shake_x
@@ -209,11 +360,15 @@ class Game:
             self.render_menu()
         elif self.state == "PLAYING":
             self.render_game()
+            self.render_postfx()
         elif self.state == "PAUSED":
             self.render_game()
+            self.render_postfx()
             self.render_pause()
         elif self.state == "GAME_OVER":
             self.render_game_over()
+        elif self.state == "VERSUS":
+            self.versus.render(self.screen, self.ui, self.display_list)
     
     def render_menu(self):
         """Render main menu"""
@@ -224,21 +379,33 @@ class Game:
         # Render level (with camera offset)
         self.level.render(self.screen, self.camera_x)
         
+        # Sprites, effects and HUD are queued, then drawn in one batched flush
+        display_list = self.display_list
+        
         # Render enemies
-        self.enemy_manager.render(self.screen, self.camera_x)
+        self.enemy_manager.render(self.screen, self.camera_x, display_list)
         
         # Render player
-        self.player.render(self.screen, self.camera_x)
+        self.player.render(self.screen, self.camera_x, display_list)
         
         # Render visual effects
         for spark in self.hit_sparks:
-            spark.render(self.screen, self.camera_x)
+            spark.render(self.screen, self.camera_x, display_list)
             
+        outlines = self.quality.settings["text_outlines"]
         for damage_num in self.damage_numbers:
-            damage_num.render(self.screen, self.camera_x, self.damage_font)
+            damage_num.render(self.screen, self.camera_x, self.damage_font, outlines, display_list)
         
         # Render UI
-        self.ui.render_hud(self.screen, self.player.health, self.lives, self.score, self.player)
+        self.ui.render_hud(self.screen, self.player.health, self.lives, self.score, self.player, display_list)
+        
+        display_list.flush(self.screen)
+    
+    def render_postfx(self):
+        """Post-process the game image, then draw the cost readout (F6) on top"""
+        self.postfx.apply(self.screen)
+        if self.postfx.show_costs:
+            self.ui.render_postfx_costs(self.screen, self.postfx.readout())
     
     def render_pause(self):
         """Render pause overlay"""
@@ -1,30 +1,53 @@
 """
 Level class - Handles platforms and level layout
 """
+import math
 import pygame
 from config import *
+from render_target import render_scale, scale_rect, scale_points
+from navigation import NavGraph
+from tilemap import TileMap
+from background import ParallaxBackground
 
 class Level:
     """Game level with platforms and decorations"""
     
-    def __init__(self, screen_width, screen_height):
+    def __init__(self, screen_width, screen_height, background=LEVEL_BACKGROUND):
         self.width = 3000  # Total level width
         self.height = screen_height
         self.platforms = []
+        self.platform_tiles = []  # Tile image name for each platform
         self.boundaries = []  # Invisible walls
+        self.spawn_points = []  # Enemy spawn locations used by the spawn director
         
-        # Background elements (clouds, mountains)
+        # Render detail (lowered by the quality governor on slow machines)
+        self.parallax_layers = 3  # 0-3: mountains, far clouds, near clouds (image layers: at least 1)
+        self.platform_detail = True  # Grid lines, highlights and outlines
+        
+        # Image parallax layers (decoded on first draw), with vector
+        # clouds and mountains as the fallback
+        self.background = ParallaxBackground(background)
         self.clouds = self.create_clouds()
         self.mountains = self.create_mountains()
         
         # Create platforms
         self.create_platforms()
         self.create_boundaries()
+        self.create_spawn_points()
+        
+        # Platform graph for enemy pathing (the layout is static, so built once)
+        self.nav_graph = NavGraph(self.platforms)
+        
+        # Platforms pre-rendered from tile images; the procedural look is the fallback
+        self.tilemap = TileMap(self.platforms, self.platform_tiles, self.width)
+        if self.tilemap.ready and pygame.display.get_surface() is not None:
+            self.tilemap.build(1.0)
     
     def create_platforms(self):
         """Create a simplified platform layout (evenly spaced static platforms)"""
         # Ground platform (full width)
         self.platforms.append(pygame.Rect(0, 580, self.width, 40))
+        self.platform_tiles.append('ground_tile')
 
         # Simple evenly-spaced platforms for straightforward mobile play
         x = 120
@@ -33,10 +56,12 @@ class Level:
             # Vary y slightly for interest but keep reachable distances
             y = 540 - (i % 3) * 20
             self.platforms.append(pygame.Rect(x + i * 300, y, 220, 20))
+            self.platform_tiles.append('platform_tile')
 
         # Add a couple of small ledges near the end
         self.platforms.append(pygame.Rect(self.width - 800, 520, 180, 20))
         self.platforms.append(pygame.Rect(self.width - 520, 480, 180, 20))
+        self.platform_tiles += ['platform_tile', 'platform_tile']
     
     def create_clouds(self):
         """Create parallax clouds across the level"""
@@ -83,6 +108,20 @@ class Level:
         # Death zone below level
         self.boundaries.append(pygame.Rect(0, 650, self.width, 50))
     
+    def create_spawn_points(self):
+        """Create enemy spawn points (ground points on platforms, air points above)"""
+        for platform in self.platforms:
+            if platform.y >= 580:
+                # Ground spans the level, so place a point every 300px
+                for x in range(300, self.width - 100, 300):
+                    self.spawn_points.append({'x': x, 'y': platform.top - 80, 'kind': 'ground'})
+            else:
+                self.spawn_points.append({'x': platform.centerx, 'y': platform.top - 80, 'kind': 'ground'})
+        
+        # Flying enemies enter at varied heights
+        for i, x in enumerate(range(450, self.width - 100, 450)):
+            self.spawn_points.append({'x': x, 'y': 200 + (i % 3) * 100, 'kind': 'air'})
+    
     def check_collision(self, rect, velocity_y):
         """Check if rect collides with platforms"""
         for platform in self.platforms:
@@ -92,41 +131,78 @@ class Level:
         return False, 0
     
     def render(self, screen, camera_x):
-        """Render the level"""
+        """Render the level (logical coordinates are scaled to the target surface)"""
+        s = render_scale(screen)
+        
+        # Background images, or the vector sky if they are missing
+        if not self.background.render(screen, camera_x, max(1, self.parallax_layers)):
+            self.render_sky(screen, camera_x, s)
+        
+        # Draw platforms
+        if self.tilemap.ready:
+            self.tilemap.render(screen, camera_x)
+        else:
+            self.render_platforms(screen, camera_x, s)
+        
+        # Draw boundaries (visual indicators)
+        for boundary in self.boundaries:
+            screen_x = int(boundary.x - camera_x)
+            
+            # Only draw if visible on screen
+            if -100 < screen_x < SCREEN_WIDTH + 100:
+                # Left wall or right wall (neon magenta barrier)
+                if boundary.x < 0 or boundary.x >= self.width:
+                    # Draw warning stripes
+                    for i in range(0, self.height, 40):
+                        color = (255, 0, 150) if (i // 40) % 2 == 0 else (150, 0, 100)
+                        pygame.draw.rect(screen, color,
+                                       scale_rect((screen_x, i, 50, 40), s))
+                    # Outline
+                    pygame.draw.rect(screen, (255, 0, 255),
+                                   scale_rect((screen_x, 0, 50, self.height), s), max(1, round(3 * s)))
+    
+    def render_sky(self, screen, camera_x, s):
+        """Draw the gradient sky, mountains and clouds (used when the background images are missing)"""
         # Cyberpunk sky gradient - dark purple to magenta
+        band_height = math.ceil(20 * s)
         for y in range(0, 400, 20):
             ratio = y / 400
             # Deep purple at top to hot magenta at horizon
             r = int(25 + (138 - 25) * ratio)
             g = int(0 + (43 - 0) * ratio)
             b = int(51 + (226 - 51) * ratio)
-            pygame.draw.rect(screen, (r, g, b), (0, y, SCREEN_WIDTH, 20))
+            pygame.draw.rect(screen, (r, g, b), (0, int(y * s), screen.get_width(), band_height))
         
         # Draw distant mountains (parallax layer 0.2x)
-        for mountain in self.mountains:
-            screen_x = mountain['x'] - (camera_x * 0.2)
-            if -mountain['width'] < screen_x < SCREEN_WIDTH:
-                # Mountain peak as triangle
-                peak_x = screen_x + mountain['width'] // 2
-                peak_y = mountain['y'] - mountain['height']
-                base_left = screen_x
-                base_right = screen_x + mountain['width']
-                base_y = mountain['y']
+        if self.parallax_layers >= 1:
+            for mountain in self.mountains:
+                screen_x = mountain['x'] - (camera_x * 0.2)
+                if -mountain['width'] < screen_x < SCREEN_WIDTH:
+                    # Mountain peak as triangle
+                    peak_x = screen_x + mountain['width'] // 2
+                    peak_y = mountain['y'] - mountain['height']
+                    base_left = screen_x
+                    base_right = screen_x + mountain['width']
+                    base_y = mountain['y']
                 
-                # Mountain silhouette (dark cyan-purple)
-                points = [(peak_x, peak_y), (base_left, base_y), (base_right, base_y)]
-                pygame.draw.polygon(screen, (20, 30, 60), points)
+                    # Mountain silhouette (dark cyan-purple)
+                    points = [(peak_x, peak_y), (base_left, base_y), (base_right, base_y)]
+                    pygame.draw.polygon(screen, (20, 30, 60), scale_points(points, s))
                 
-                # Neon cyan peak glow (top 20% of mountain)
-                snow_height = mountain['height'] * 0.2
-                snow_left_x = peak_x - snow_height * 0.5
-                snow_right_x = peak_x + snow_height * 0.5
-                snow_y = peak_y + snow_height
-                snow_points = [(peak_x, peak_y), (snow_left_x, snow_y), (snow_right_x, snow_y)]
-                pygame.draw.polygon(screen, (0, 255, 255), snow_points)
+                    # Neon cyan peak glow (top 20% of mountain)
+                    snow_height = mountain['height'] * 0.2
+                    snow_left_x = peak_x - snow_height * 0.5
+                    snow_right_x = peak_x + snow_height * 0.5
+                    snow_y = peak_y + snow_height
+                    snow_points = [(peak_x, peak_y), (snow_left_x, snow_y), (snow_right_x, snow_y)]
+                    pygame.draw.polygon(screen, (0, 255, 255), scale_points(snow_points, s))
         
         # Draw clouds with parallax
         for cloud in self.clouds:
+            # Far clouds need 2 parallax layers enabled, near clouds need 3
+            if cloud['layer'] >= self.parallax_layers:
+                continue
+            
             # Different parallax speeds for different layers
             parallax = 0.3 if cloud['layer'] == 1 else 0.5
             screen_x = cloud['x'] - (camera_x * parallax)
@@ -136,16 +212,18 @@ class Level:
                 color = (255, 0, 200) if cloud['layer'] == 1 else (200, 0, 255)
                 # Main cloud body
                 pygame.draw.ellipse(screen, color, 
-                                  (screen_x, cloud['y'], cloud['width'], cloud['height']))
+                                  scale_rect((screen_x, cloud['y'], cloud['width'], cloud['height']), s))
                 # Additional puffs for depth
                 pygame.draw.ellipse(screen, color, 
-                                  (screen_x + cloud['width'] * 0.2, cloud['y'] - cloud['height'] * 0.2, 
-                                   cloud['width'] * 0.5, cloud['height'] * 0.8))
+                                  scale_rect((screen_x + cloud['width'] * 0.2, cloud['y'] - cloud['height'] * 0.2, 
+                                              cloud['width'] * 0.5, cloud['height'] * 0.8), s))
                 pygame.draw.ellipse(screen, color, 
-                                  (screen_x + cloud['width'] * 0.5, cloud['y'] - cloud['height'] * 0.15, 
-                                   cloud['width'] * 0.6, cloud['height'] * 0.9))
-        
-        # Draw platforms
+                                  scale_rect((screen_x + cloud['width'] * 0.5, cloud['y'] - cloud['height'] * 0.15, 
+                                              cloud['width'] * 0.6, cloud['height'] * 0.9), s))
+    
+    def render_platforms(self, screen, camera_x, s):
+        """Draw the platforms procedurally (used when the tile images are missing)"""
+        line_width = max(1, round(2 * s))
         for platform in self.platforms:
             screen_x = platform.x - camera_x
             
@@ -157,26 +235,27 @@ class Level:
                 
                 # Draw dark base
                 pygame.draw.rect(screen, base_dark,
-                               (screen_x, platform.y + 8, platform.width, platform.height - 8))
+                               scale_rect((screen_x, platform.y + 8, platform.width, platform.height - 8), s))
                 
                 # Draw cyan energy layer
                 pygame.draw.rect(screen, (0, 100, 120),
-                               (screen_x, platform.y, platform.width, 8))
+                               scale_rect((screen_x, platform.y, platform.width, 8), s))
                 
                 # Add neon grid lines
-                for i in range(0, platform.width, 8):
-                    # Draw vertical neon lines
-                    blade_x = screen_x + i
-                    pygame.draw.line(screen, neon_cyan, 
-                                   (blade_x + 2, platform.y + 7), 
-                                   (blade_x + 2, platform.y + 2), 2)
-                    pygame.draw.line(screen, neon_cyan,
-                                   (blade_x + 5, platform.y + 7),
-                                   (blade_x + 5, platform.y + 3), 2)
+                if self.platform_detail:
+                    for i in range(0, platform.width, 8):
+                        # Draw vertical neon lines
+                        blade_x = screen_x + i
+                        pygame.draw.line(screen, neon_cyan, 
+                                       ((blade_x + 2) * s, (platform.y + 7) * s), 
+                                       ((blade_x + 2) * s, (platform.y + 2) * s), line_width)
+                        pygame.draw.line(screen, neon_cyan,
+                                       ((blade_x + 5) * s, (platform.y + 7) * s),
+                                       ((blade_x + 5) * s, (platform.y + 3) * s), line_width)
                 
                 # Bright cyan top edge
                 pygame.draw.rect(screen, neon_cyan,
-                               (screen_x, platform.y, platform.width, 2))
+                               scale_rect((screen_x, platform.y, platform.width, 2), s))
             else:
                 # Floating platforms - holographic purple/magenta
                 base_purple = (60, 20, 80)
@@ -185,50 +264,27 @@ class Level:
                 
                 # Main platform body
                 pygame.draw.rect(screen, base_purple,
-                               (screen_x, platform.y, platform.width, platform.height))
+                               scale_rect((screen_x, platform.y, platform.width, platform.height), s))
                 
                 # Neon magenta edge on top
                 pygame.draw.rect(screen, neon_magenta,
-                               (screen_x, platform.y, platform.width, 3))
+                               scale_rect((screen_x, platform.y, platform.width, 3), s))
                 
                 # Dark shadow/depth
-                if platform.height > 10:
+                if platform.height > 10 and self.platform_detail:
                     pygame.draw.rect(screen, dark_purple,
-                                   (screen_x, platform.y + 3, platform.width, platform.height - 3))
+                                   scale_rect((screen_x, platform.y + 3, platform.width, platform.height - 3), s))
                 
                 # Bright magenta highlight
                 highlight_color = (200, 50, 255)
                 pygame.draw.rect(screen, highlight_color,
-                               (screen_x, platform.y, platform.width, 2))
+                               scale_rect((screen_x, platform.y, platform.width, 2), s))
             
             # Platform outline - neon cyan glow
-            pygame.draw.rect(screen, (0, 255, 255),
-                           (screen_x, platform.y, platform.width, platform.height), 2)
-        
-        # Draw boundaries (visual indicators)
-        for boundary in self.boundaries:
-            screen_x = int(boundary.x - camera_x)
-            
-            # Only draw if visible on screen
-            if -100 < screen_x < screen.get_width() + 100:
-                # Left wall (neon magenta barrier)
-                if boundary.x < 0:
-                    # Draw warning stripes
-                    for i in range(0, self.height, 40):
-                        color = (255, 0, 150) if (i // 40) % 2 == 0 else (150, 0, 100)
-                        pygame.draw.rect(screen, color,
-                                       (screen_x, i, 50, 40))
-                    # Outline
-                    pygame.draw.rect(screen, (255, 0, 255),
-                                   (screen_x, 0, 50, self.height), 3)
-                
-                # Right wall (neon magenta barrier)
-                elif boundary.x >= self.width:
-                    # Draw warning stripes
-                    for i in range(0, self.height, 40):
-                        color = (255, 0, 150) if (i // 40) % 2 == 0 else (150, 0, 100)
-                        pygame.draw.rect(screen, color,
-                                       (screen_x, i, 50, 40))
-                    # Outline
-                    pygame.draw.rect(screen, (255, 0, 255),
-                                   (screen_x, 0, 50, self.height), 3)
+            if self.platform_detail:
+                pygame.draw.rect(screen, (0, 255, 255),
+                               scale_rect((screen_x, platform.y, platform.width, platform.height), s), line_width)
+    
+    def unload(self):
+        """Free the level's decoded background images"""
+        self.background.unload()
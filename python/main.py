@@ -4,34 +4,47 @@ Main game entry point
 """
 import pygame
 import sys
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, WINDOW_WIDTH, WINDOW_HEIGHT, FPS
 from game import Game
+from render_target import RenderTarget
+from capture import FrameCapture
 
 def main():
     """Initialize and run the game"""
     pygame.init()
     
-    # Game configuration
-    SCREEN_WIDTH = 1280
-    SCREEN_HEIGHT = 720
-    FPS = 60
-    
-    # Create game window
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    # Create game window (resizable; the game image is letterboxed to fit)
+    window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.RESIZABLE)
     pygame.display.set_caption("Skunk Fu - Ninja Skunk")
     
+    # The game draws at the internal render resolution, scaled once per frame
+    render_target = RenderTarget()
+    
     # Initialize game
-    game = Game(screen, SCREEN_WIDTH, SCREEN_HEIGHT)
+    game = Game(window, SCREEN_WIDTH, SCREEN_HEIGHT, render_target=render_target)
     clock = pygame.time.Clock()
     
+    # Frame capture to disk (F12 toggles)
+    capture = None
+    
     # Game loop
     running = True
     while running:
         dt = clock.tick(FPS) / 1000.0  # Delta time in seconds
+        # Time spent on the previous frame, excluding the tick delay
+        game.record_frame(clock.get_rawtime() / 1000.0, dt)
         
         # Handle events
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F12:
+                if capture is None:
+                    capture = FrameCapture(pygame.display.get_surface().get_size())
+                    print(f"Capturing frames to {capture.out_dir}")
+                else:
+                    print(f"Capture finished: {capture.stop()}")
+                    capture = None
             game.handle_event(event)
         
         # Update game state
@@ -39,8 +52,13 @@ def main():
         
         # Render
         game.render()
+        render_target.present(pygame.display.get_surface())
+        if capture:
+            capture.capture(pygame.display.get_surface())
         pygame.display.flip()
     
+    if capture:
+        capture.stop()
     pygame.quit()
     sys.exit()
 
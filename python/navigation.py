@@ -0,0 +1,192 @@
+"""
+Navigation - Platform graph and cached path queries for ground enemies
+"""
+import heapq
+import math
+from config import *
+
+
+class NavNode:
+    """Walkable top surface of one platform"""
+    __slots__ = ("index", "left", "right", "top")
+
+    def __init__(self, index, platform):
+        self.index = index
+        self.left = platform.left
+        self.right = platform.right
+        self.top = platform.top
+
+
+class NavEdge:
+    """Move from one platform surface to another
+
+    kind is "walk", "drop" or "jump". The agent (left x) goes to takeoff_x on
+    the source surface, then leaves it moving in `direction`; land_x is where
+    it should end up on the target surface, whose height is land_top.
+    """
+    __slots__ = ("index", "source", "target", "land_top", "kind", "direction",
+                 "takeoff_x", "land_x", "cost")
+
+    def __init__(self, source, target, kind, direction, takeoff_x, land_x, cost):
+        self.index = -1
+        self.source = source.index
+        self.target = target.index
+        self.land_top = target.top
+        self.kind = kind
+        self.direction = direction
+        self.takeoff_x = takeoff_x
+        self.land_x = land_x
+        self.cost = cost
+
+
+class NavGraph:
+    """Platform surfaces linked by walk/drop/jump edges, built once per level
+
+    Edges are derived from the movement parameters in config.py, using the
+    slowest ground enemy so every ground enemy can follow them. Path queries
+    return the first edge of the shortest path and are cached per
+    (start, goal) pair, so following a path costs a dict lookup per decision.
+    """
+
+    def __init__(self, platforms, agent_width=48, speed=ENEMY_SPEED,
+                 jump_force=ENEMY_JUMP_FORCE, gravity=GRAVITY):
+        self.agent_width = agent_width
+        self.speed = speed
+        self.jump_force = jump_force
+        self.gravity = gravity
+        self.max_jump_height = jump_force ** 2 / (2 * gravity) - NAV_JUMP_CLEARANCE
+
+        self.nodes = [NavNode(i, platform) for i, platform in enumerate(platforms)
+                      if platform.width >= agent_width]
+        # Surface height -> nodes at that height, for fast node_at() lookups
+        self.nodes_by_top = {}
+        for node in self.nodes:
+            self.nodes_by_top.setdefault(node.top, []).append(node)
+
+        self.edges = []
+        self.adjacency = {node.index: [] for node in self.nodes}
+        self.alternatives = {}  # (source, target) -> edges linking them, e.g. both ends
+        self.build_edges()
+
+        # (start, goal) -> index of the first edge on the path, or -1
+        self.next_edge_cache = {}
+
+    def add_edge(self, edge):
+        edge.index = len(self.edges)
+        self.edges.append(edge)
+        self.adjacency[edge.source].append(edge)
+        self.alternatives.setdefault((edge.source, edge.target), []).append(edge)
+
+    def build_edges(self):
+        for a in self.nodes:
+            for direction in (1, -1):
+                drop = self.drop_edge(a, direction)
+                if drop:
+                    self.add_edge(drop)
+            for b in self.nodes:
+                if b is a:
+                    continue
+                if b.top == a.top and (b.left == a.right or b.right == a.left):
+                    direction = 1 if b.left == a.right else -1
+                    edge_x = a.right - self.agent_width if direction > 0 else a.left
+                    self.add_edge(NavEdge(a, b, "walk", direction, edge_x,
+                                          edge_x + direction * self.agent_width, self.agent_width))
+                elif b.top < a.top:
+                    for jump in self.jump_edges(a, b):
+                        self.add_edge(jump)
+
+    def drop_edge(self, a, direction):
+        """Walk off one end of `a` and land on the first surface below"""
+        w = self.agent_width
+        edge_x = a.right if direction > 0 else a.left - w  # Agent fully off the platform
+        best = None
+        for b in self.nodes:
+            if b.top <= a.top:
+                continue
+            reach = self.speed * math.sqrt(2 * (b.top - a.top) / self.gravity)
+            lo, hi = sorted((edge_x, edge_x + direction * reach))
+            # Overlap of the fall's horizontal sweep with b (at least half the agent on it)
+            lo = max(lo, b.left - w // 2)
+            hi = min(hi, b.right - w // 2)
+            if lo <= hi and (best is None or b.top < best[0].top):
+                best = (b, lo if direction > 0 else hi)
+        if best is None:
+            return None
+        b, land_x = best
+        takeoff_x = a.right - w if direction > 0 else a.left
+        cost = abs(land_x - takeoff_x) + (b.top - a.top) * 0.5
+        return NavEdge(a, b, "drop", direction, takeoff_x, land_x, cost)
+
+    def jump_edges(self, a, b):
+        """Jumps from `a` up onto either end of `b`, rising beside b before moving over it"""
+        w = self.agent_width
+        rise = a.top - b.top
+        if rise > self.max_jump_height:
+            return []
+        # Air time left once the feet are above b, at horizontal speed
+        v = self.jump_force
+        air_time = 2 * math.sqrt(v * v - 2 * self.gravity * rise) / self.gravity
+        reach = self.speed * air_time
+
+        edges = []
+        for direction in (1, -1):
+            if direction > 0:
+                takeoff_x = min(a.right - w, b.left - w - 2)  # Beside b, not under it
+                land_x = b.left
+            else:
+                takeoff_x = max(a.left, b.right + 2)
+                land_x = b.right - w
+            if not a.left <= takeoff_x <= a.right - w:
+                continue
+            distance = abs(land_x - takeoff_x)
+            if distance > reach:
+                continue
+            edges.append(NavEdge(a, b, "jump", direction, takeoff_x, land_x,
+                                 distance + rise + NAV_JUMP_COST))
+        return edges
+
+    def node_at(self, rect):
+        """Index of the surface `rect` is standing on, or None"""
+        x = rect.centerx
+        for top in range(rect.bottom - 2, rect.bottom + 3):
+            for node in self.nodes_by_top.get(top, ()):
+                if node.left <= x <= node.right:
+                    return node.index
+        return None
+
+    def next_edge(self, start, goal):
+        """Index of the first edge on the shortest path from start to goal (-1 if none)"""
+        key = (start, goal)
+        edge = self.next_edge_cache.get(key)
+        if edge is None:
+            self.search(start)
+            edge = self.next_edge_cache.setdefault(key, -1)
+        return edge
+
+    def choose_edge(self, start, goal, x):
+        """Like next_edge(), but of the edges to the same surface picks the one
+        whose takeoff point is closest to the agent at `x`"""
+        first = self.next_edge(start, goal)
+        if first < 0:
+            return first
+        edge = self.edges[first]
+        options = self.alternatives[(edge.source, edge.target)]
+        return min(options, key=lambda option: abs(option.takeoff_x - x)).index
+
+    def search(self, start):
+        """Dijkstra from `start`, caching the first edge towards every reachable node"""
+        dist = {start: 0}
+        first = {start: -1}
+        heap = [(0, start)]
+        while heap:
+            d, node = heapq.heappop(heap)
+            if d > dist[node]:
+                continue
+            for edge in self.adjacency.get(node, ()):
+                nd = d + edge.cost
+                if nd < dist.get(edge.target, math.inf):
+                    dist[edge.target] = nd
+                    first[edge.target] = edge.index if node == start else first[node]
+                    heapq.heappush(heap, (nd, edge.target))
+        for goal, edge in first.items():
+            self.next_edge_cache[(start, goal)] = edge
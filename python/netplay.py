@@ -0,0 +1,250 @@
+"""
+Netplay - Input transports and the rollback session for versus play
+"""
+import socket
+import struct
+import time
+from collections import deque
+from config import *
+
+# Packet: ack tick, first input tick, input count, then one byte of buttons per tick
+PACKET_HEADER = struct.Struct("!iiB")
+MAX_INPUTS_PER_PACKET = 64
+
+
+def encode_inputs(ack, start_tick, inputs):
+    """Pack a run of consecutive inputs starting at `start_tick`"""
+    return PACKET_HEADER.pack(ack, start_tick, len(inputs)) + bytes(inputs)
+
+
+def decode_inputs(packet):
+    """Unpack a packet into (ack, start_tick, inputs); None if malformed"""
+    if len(packet) < PACKET_HEADER.size:
+        return None
+    ack, start_tick, count = PACKET_HEADER.unpack_from(packet)
+    inputs = packet[PACKET_HEADER.size:]
+    if len(inputs) != count:
+        return None
+    return ack, start_tick, inputs
+
+
+class Transport:
+    """Unreliable datagram transport between two peers"""
+
+    def send(self, packet):
+        raise NotImplementedError
+
+    def receive(self):
+        """Return the list of packets that arrived since the last call"""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class LoopbackTransport(Transport):
+    """In-process transport; packets show up after `latency` receive() calls"""
+
+    def __init__(self, latency=0):
+        self.latency = latency
+        self.inbox = deque()  # [frames left, packet]
+        self.peer = None
+
+    @classmethod
+    def pair(cls, latency=VERSUS_LOOPBACK_LATENCY):
+        """Two connected endpoints"""
+        a, b = cls(latency), cls(latency)
+        a.peer, b.peer = b, a
+        return a, b
+
+    def send(self, packet):
+        self.peer.inbox.append([self.peer.latency, packet])
+
+    def receive(self):
+        packets = []
+        for entry in self.inbox:
+            entry[0] -= 1
+        while self.inbox and self.inbox[0][0] < 0:
+            packets.append(self.inbox.popleft()[1])
+        return packets
+
+
+class UdpTransport(Transport):
+    """Non-blocking UDP socket talking to one peer (localhost by default)"""
+
+    def __init__(self, local_port=0, remote=None, host="127.0.0.1"):
+        self.remote = remote
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            self.sock.bind((host, local_port))
+        except OSError:
+            self.sock.close()
+            raise
+        self.sock.setblocking(False)
+        self.address = self.sock.getsockname()
+
+    @classmethod
+    def pair(cls, port=VERSUS_UDP_PORT):
+        """Two sockets on localhost sending to each other; port 0 binds
+        any free port, and each side is pointed at the other's actual address.
+        Raises OSError if the sockets can't be set up."""
+        a = cls(port)
+        try:
+            b = cls(0, remote=a.address)
+        except OSError:
+            a.close()
+            raise
+        a.remote = b.address
+        return a, b
+
+    def send(self, packet):
+        if self.remote is None:
+            return
+        try:
+            self.sock.sendto(packet, self.remote)
+        except OSError:
+            pass  # Dropped, like any other lost datagram
+
+    def receive(self):
+        packets = []
+        while True:
+            try:
+                packet, _ = self.sock.recvfrom(1024)
+            except (BlockingIOError, ConnectionResetError):
+                break
+            packets.append(packet)
+        return packets
+
+    def close(self):
+        self.sock.close()
+
+
+class RollbackSession:
+    """Runs a deterministic match against a remote peer with input delay and rollback
+
+    `match` must provide save_state(), load_state(state), step(inputs) and
+    set_audio(enabled). Local input is scheduled `input_delay` ticks ahead.
+    Missing remote input is predicted by repeating the last confirmed one;
+    when the real input arrives and differs, the match is restored to the
+    state before that tick and the ticks since are simulated again. The
+    session stalls rather than run more than `max_rollback` ticks ahead of
+    the last confirmed remote input, which bounds the cost of a rollback.
+    """
+
+    def __init__(self, match, local_index, transport,
+                 input_delay=VERSUS_INPUT_DELAY, max_rollback=VERSUS_MAX_ROLLBACK):
+        self.match = match
+        self.local_index = local_index
+        self.transport = transport
+        self.input_delay = input_delay
+        self.max_rollback = max_rollback
+
+        self.tick = 0  # Next tick to simulate
+        # Nobody presses anything during the first input_delay ticks
+        self.local_inputs = {t: 0 for t in range(input_delay)}
+        self.remote_inputs = {t: 0 for t in range(input_delay)}
+        self.remote_confirmed = input_delay - 1  # All remote inputs up to here are known
+        self.remote_acked = -1  # Peer has all our inputs up to here
+        self.predicted = {}  # tick -> remote input we guessed
+        self.states = {}  # tick -> match state before that tick
+        self.rollback_to = None
+
+        # Stats
+        self.rollbacks = 0
+        self.resimulated_ticks = 0
+        self.stalls = 0
+        self.last_rollback_time = 0.0
+        self.max_rollback_time = 0.0
+
+    def advance(self, buttons):
+        """Run one frame with the local player's held buttons; False if stalled"""
+        target = self.tick + self.input_delay
+        if target not in self.local_inputs:
+            self.local_inputs[target] = buttons
+        self.send_inputs()
+        self.receive_inputs()
+
+        if self.rollback_to is not None:
+            self.rollback(self.rollback_to)
+            self.rollback_to = None
+
+        if self.tick - self.remote_confirmed > self.max_rollback:
+            self.stalls += 1
+            return False
+        self.simulate_tick()
+        self.discard_confirmed()
+        return True
+
+    def send_inputs(self):
+        """Send every local input the peer hasn't acknowledged yet"""
+        start = self.remote_acked + 1
+        end = min(self.tick + self.input_delay, start + MAX_INPUTS_PER_PACKET - 1)
+        inputs = [self.local_inputs[t] for t in range(start, end + 1)]
+        self.transport.send(encode_inputs(self.remote_confirmed, start, inputs))
+
+    def receive_inputs(self):
+        """Confirm remote inputs and note the earliest misprediction"""
+        for packet in self.transport.receive():
+            decoded = decode_inputs(packet)
+            if decoded is None:
+                continue
+            ack, start_tick, inputs = decoded
+            self.remote_acked = max(self.remote_acked, ack)
+            for offset, buttons in enumerate(inputs):
+                t = start_tick + offset
+                if t != self.remote_confirmed + 1:
+                    continue  # Already known, or a gap the next packet will fill
+                self.remote_inputs[t] = buttons
+                self.remote_confirmed = t
+                guess = self.predicted.pop(t, None)
+                if guess is not None and guess != buttons:
+                    if self.rollback_to is None or t < self.rollback_to:
+                        self.rollback_to = t
+
+    def simulate_tick(self):
+        t = self.tick
+        self.states[t] = self.match.save_state()
+        remote = self.remote_inputs.get(t)
+        if remote is None:
+            remote = self.remote_inputs[self.remote_confirmed]
+            self.predicted[t] = remote
+        local = self.local_inputs[t]
+        self.match.step((local, remote) if self.local_index == 0 else (remote, local))
+        self.tick += 1
+
+    def rollback(self, tick):
+        """Restore the state before `tick` and simulate up to the present again"""
+        start = time.perf_counter()
+        current = self.tick
+        self.match.load_state(self.states[tick])
+        self.match.set_audio(False)  # Sounds were already played the first time
+        self.tick = tick
+        while self.tick < current:
+            self.simulate_tick()
+        self.match.set_audio(True)
+
+        self.rollbacks += 1
+        self.resimulated_ticks += current - tick
+        self.last_rollback_time = time.perf_counter() - start
+        self.max_rollback_time = max(self.max_rollback_time, self.last_rollback_time)
+
+    def discard_confirmed(self):
+        """Drop states and inputs that can no longer be rolled back to or resent"""
+        # Ticks up to here are simulated with confirmed input on both sides
+        settled = min(self.remote_confirmed, self.tick - 1)
+        for t in [t for t in self.states if t <= settled]:
+            del self.states[t]
+        for t in [t for t in self.remote_inputs if t < settled]:
+            del self.remote_inputs[t]
+        for t in [t for t in self.local_inputs if t <= settled and t <= self.remote_acked]:
+            del self.local_inputs[t]
+
+    def telemetry(self):
+        """Session stats for logging/overlays"""
+        return {
+            "tick": self.tick,
+            "rollbacks": self.rollbacks,
+            "resimulated_ticks": self.resimulated_ticks,
+            "stalls": self.stalls,
+            "max_rollback_ms": round(self.max_rollback_time * 1000, 2),
+        }
@@ -0,0 +1,182 @@
+"""
+Pixel cache - sprite frames baked in display format to one memory-mapped file
+
+The first time SpriteLoader cuts (and scales) a sheet, the finished frames'
+raw pixels are stored here; from then on the frames are built straight from
+the mapped file with pygame.image.frombuffer, with no PNG decode, convert or
+scale. Entries are keyed by sprite path and size and carry the SHA-256 of
+the source file (plus, for sheets, a hash of the layout they were cut
+with), so an edited sprite or sheet entry is baked again; a cache made for
+a different display pixel format is ignored as a whole.
+
+File layout: a header (magic, version, index length), the JSON index
+{"format": ..., "entries": {key: {"sha256": ..., "frames": [[offset, w, h], ...]}}},
+then the pixel data, which starts at the next multiple of ALIGN. Frames are
+tightly packed rows in the byte order the format names.
+
+Each save writes a new generation next to CACHE_FILE
+(sprite_pixels-<time>-<pid>.bin) instead of replacing the file in place, so
+it works while the previous generation is mapped (which Windows refuses to
+replace) and several processes baking at exit never write into each
+other's files. Readers map the newest generation; older ones are deleted
+once nothing holds them.
+"""
+import atexit
+import glob
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+import pygame
+
+CACHE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "sprite_pixels.bin")
+MAGIC = b"SKPIXELS"
+VERSION = 1
+HEADER = struct.Struct("<8sII")  # Magic, version, index length
+ALIGN = 64
+BYTE_ORDERS = ("BGRA", "RGBA", "ARGB")  # Layouts frombuffer/tobytes share for 32-bit surfaces with alpha
+
+
+def display_format():
+    """Byte order of the display's per-pixel-alpha surfaces, and whether
+    surfaces built in that order need no convert_alpha (None before the
+    display is set up)"""
+    try:
+        probe = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+    except pygame.error:
+        return None
+    channels = {}
+    for channel, shift in zip("RGBA", probe.get_shifts()):
+        index = shift // 8
+        channels[index if sys.byteorder == "little" else 3 - index] = channel
+    order = "".join(channels.get(i, "?") for i in range(4))
+    native = probe.get_bitsize() == 32 and order in BYTE_ORDERS
+    return {"order": order if native else "RGBA", "native": native, "masks": list(probe.get_masks())}
+
+
+def _aligned(n):
+    return -(-n // ALIGN) * ALIGN
+
+
+def generations(path=CACHE_FILE):
+    """Saved generations of the cache at `path`, newest first"""
+    stem, ext = os.path.splitext(path)
+    return sorted(glob.glob(f"{glob.escape(stem)}-*{ext}"), reverse=True)
+
+
+class PixelCache:
+    """The baked frame file, mapped on first use; new frames are written out at exit"""
+
+    def __init__(self, path=CACHE_FILE):
+        self.path = path
+        self.format = None
+        self._index = None  # Key -> entry, as stored in the mapped file
+        self._map = None
+        self._base = 0  # File offset of the pixel data
+        self._pending = {}  # Key -> (sha256, [(width, height, pixels)]) baked this run
+
+    def _open(self):
+        if self._index is not None:
+            return self.format is not None
+        self._index = {}
+        self.format = display_format()
+        if self.format is None:
+            return False
+        current = generations(self.path)
+        if not current:
+            return True
+        try:
+            with open(current[0], "rb") as f:
+                magic, version, index_length = HEADER.unpack(f.read(HEADER.size))
+                index = json.loads(f.read(index_length))
+                if magic != MAGIC or version != VERSION or index.get("format") != self.format:
+                    return True  # Stale: rebuilt from this run's frames at exit
+                # Copy-on-write, so drawing on a frame never reaches the file. Within this
+                # process every get() of a key wraps the same private pages, so treat frames
+                # as shared and read-only (copy() one before drawing on it)
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+                self._index = index["entries"]
+                self._base = _aligned(HEADER.size + index_length)
+        except (OSError, ValueError, KeyError, struct.error):
+            pass
+        return True
+
+    def get(self, key, sha):
+        """Frames baked for `key` from a source with this SHA-256, or None;
+        they view the mapped pages, which every call for the same key shares"""
+        if not self._open():
+            return None
+        entry = self._index.get(key)
+        if entry is None or entry["sha256"] != sha or self._map is None:
+            return None
+        view = memoryview(self._map)
+        frames = []
+        for offset, width, height in entry["frames"]:
+            start = self._base + offset
+            frame = pygame.image.frombuffer(view[start:start + width * height * 4], (width, height), self.format["order"])
+            frames.append(frame if self.format["native"] else frame.convert_alpha())
+        return frames
+
+    def put(self, key, sha, frames):
+        """Bake finished frames for `key`; the file is rewritten at exit"""
+        if not self._open():
+            return
+        if not self._pending:
+            atexit.register(self.save)
+        order = self.format["order"]
+        self._pending[key] = (sha, [(f.get_width(), f.get_height(), pygame.image.tobytes(f, order)) for f in frames])
+
+    def save(self):
+        """Write every current entry (kept and newly baked) to a new cache file"""
+        if not self._pending:
+            return
+        blobs = {}
+        for key, entry in self._index.items():
+            if key not in self._pending and self._map is not None:
+                frames = [(w, h, self._map[self._base + o:self._base + o + w * h * 4]) for o, w, h in entry["frames"]]
+                blobs[key] = (entry["sha256"], frames)
+        blobs.update(self._pending)
+
+        entries, data, offset = {}, [], 0
+        for key, (sha, frames) in sorted(blobs.items()):
+            records = []
+            for width, height, pixels in frames:
+                records.append([offset, width, height])
+                data.append(pixels)
+                data.append(bytes(_aligned(len(pixels)) - len(pixels)))
+                offset += _aligned(len(pixels))
+            entries[key] = {"sha256": sha, "frames": records}
+        index = json.dumps({"format": self.format, "entries": entries}, separators=(",", ":")).encode()
+        header = HEADER.pack(MAGIC, VERSION, len(index))
+        directory = os.path.dirname(self.path)
+        stem, ext = os.path.splitext(self.path)
+        tmp = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(header + index + bytes(_aligned(len(header) + len(index)) - len(header) - len(index)))
+                f.writelines(data)
+            # A new name, so nothing that maps an older generation is in the way
+            saved = f"{stem}-{time.time_ns():020d}-{os.getpid()}{ext}"
+            os.replace(tmp, saved)
+        except OSError:
+            # Read-only install: bake again next run
+            if tmp is not None:
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+            self._pending = {}
+            return
+        self._pending = {}
+        # Older generations only: another process may have saved a newer one since.
+        # self.path itself is the single file earlier versions wrote
+        for old in [self.path] + [g for g in generations(self.path) if g < saved]:
+            try:
+                os.remove(old)
+            except OSError:
+                pass  # Missing, or still mapped (Windows): removed by a later save
@@ -1,9 +1,14 @@
 """
 Player character class
 """
+import io
 import pygame
 from config import *
 from sprite_loader import sprite_loader, Animation
+from sheet_meta import sha256
+from render_target import render_scale, scale_surface
+from display_list import draw, fill_surface, circle_surface, LAYER_PLAYER
+from collision import move as sweep_move
 
 class Player:
     """Player character with combat and platforming abilities"""
@@ -55,6 +60,7 @@ class Player:
         self.default_attack_height = 40
         self.attack_hitbox = pygame.Rect(0, 0, self.default_attack_width, self.default_attack_height)
         self.hit_enemies = set()  # Track enemies hit in current attack
+        self.current_attack_damage = self.attack_damage  # Combo-scaled damage of the current attack
         
         # Shadow strike state
         self.is_shadow_striking = False
@@ -94,14 +100,17 @@ class Player:
             
             # Load sprite sheets - assuming horizontal sprite sheets
             # For idle, load just the first frame as a static sprite (no animation)
-            import os
-            idle_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'sprites', 'characters', 'ninja_idle.png')
-            idle_img = pygame.image.load(idle_path).convert_alpha()
-            # Extract only the first 64x64 frame as a completely static pose
-            temp_surface = pygame.Surface((64, 64), pygame.SRCALPHA)
-            temp_surface.blit(idle_img, (0, 0), pygame.Rect(0, 0, 64, 64))
             # Scale to 96x96 for good visibility without being too large
-            self.idle_sprite = pygame.transform.scale(temp_surface, (96, 96))
+            idle_data = sprite_loader.read("characters/ninja_idle.png")
+            prescaled = sprite_loader.load_prescaled("characters/ninja_idle.png", (96, 96), sha256(idle_data))
+            if prescaled:
+                self.idle_sprite = prescaled[0]
+            else:
+                idle_img = pygame.image.load(io.BytesIO(idle_data), "ninja_idle.png").convert_alpha()
+                # Extract only the first 64x64 frame as a completely static pose
+                temp_surface = pygame.Surface((64, 64), pygame.SRCALPHA)
+                temp_surface.blit(idle_img, (0, 0), pygame.Rect(0, 0, 64, 64))
+                self.idle_sprite = pygame.transform.scale(temp_surface, (96, 96))
             # Pre-create flipped version to avoid recreating every frame
             self.idle_sprite_flipped = pygame.transform.flip(self.idle_sprite, True, False)
             
@@ -146,9 +155,28 @@ class Player:
             elif event.key == pygame.K_z:
                 self.special_attack()
     
-    def update(self, dt, level):
-        """Update player state"""
-        self.keys = pygame.key.get_pressed()
+    def handle_buttons(self, pressed):
+        """Apply newly pressed INPUT_* buttons (the bitmask form of handle_event)"""
+        if pressed & INPUT_JUMP:
+            self.jump_buffer_timer = self.jump_buffer_time
+        if pressed & INPUT_ATTACK:
+            self.attack()
+        if pressed & INPUT_SPECIAL:
+            self.special_attack()
+    
+    def update(self, dt, level, buttons=None):
+        """Update player state
+        
+        Movement comes from the keyboard unless `buttons` (held INPUT_* bits)
+        is given, which keeps the update deterministic for versus/rollback.
+        """
+        if buttons is None:
+            self.keys = pygame.key.get_pressed()
+            move_left = self.keys[pygame.K_LEFT] or self.keys[pygame.K_a]
+            move_right = self.keys[pygame.K_RIGHT] or self.keys[pygame.K_d]
+        else:
+            move_left = buttons & INPUT_LEFT
+            move_right = buttons & INPUT_RIGHT
         
         # Update timers
         if self.coyote_timer > 0:
@@ -167,10 +195,10 @@ class Player:
         # Determine target velocity based on input (no movement during hit stun)
         self.target_velocity_x = 0
         if self.hit_stun_timer <= 0:
-            if self.keys[pygame.K_LEFT] or self.keys[pygame.K_a]:
+            if move_left:
                 self.target_velocity_x = -self.speed
                 self.facing_right = False
-            if self.keys[pygame.K_RIGHT] or self.keys[pygame.K_d]:
+            if move_right:
                 self.target_velocity_x = self.speed
                 self.facing_right = True
         
@@ -206,20 +234,13 @@ class Player:
         if self.velocity_y > MAX_FALL_SPEED:
             self.velocity_y = MAX_FALL_SPEED
         
-        # Update horizontal position (only if actually moving)
-        if abs(self.velocity_x) > 0:
-            self.x += self.velocity_x * dt
-            self.rect.x = int(self.x)
-        
-        # Check horizontal collisions with platforms
-        for platform in level.platforms:
-            if self.rect.colliderect(platform):
-                # Push out of platform
-                if self.velocity_x > 0:  # Moving right
-                    self.x = platform.left - self.width
-                elif self.velocity_x < 0:  # Moving left
-                    self.x = platform.right
-                self.rect.x = int(self.x)
+        # Move along the velocity, stopping at platform faces (swept, so a
+        # long frame or the shadow-strike dash can't tunnel through platforms)
+        self.x, self.y, _, hit_y = sweep_move(
+            self.x, self.y, self.width, self.height,
+            self.velocity_x * dt, self.velocity_y * dt, level.platforms)
+        self.rect.x = int(self.x)
+        self.rect.y = int(self.y)
         
         # Check boundaries (level edges)
         for boundary in level.boundaries:
@@ -237,38 +258,16 @@ class Player:
                     self.take_damage(999)  # Instant death
                 self.rect.x = int(self.x)
         
-        # Update vertical position
-        self.y += self.velocity_y * dt
-        self.rect.y = int(self.y)
-        
-        # Check vertical collisions with platforms
+        # Landing or head bump
         self.on_ground = False
         just_landed = False
-        
-        for platform in level.platforms:
-            # Check with slight tolerance to prevent flickering
-            feet_rect = pygame.Rect(self.rect.x, self.rect.bottom - 2, self.rect.width, 4)
-            if feet_rect.colliderect(platform) and self.velocity_y >= 0:
-                # We're on or very close to the platform
+        if hit_y is not None:
+            if self.velocity_y > 0:
                 self.on_ground = True
-                
-                if self.rect.colliderect(platform):
-                    if self.velocity_y > 0:  # Falling down
-                        # Land on platform
-                        self.y = platform.top - self.height
-                        self.rect.y = int(self.y)
-                        
-                        # Check if we just landed (for sound)
-                        if not was_on_ground and self.velocity_y > 200:
-                            just_landed = True
-                        
-                        self.velocity_y = 0
-                    break
-                elif self.velocity_y < 0:  # Jumping up
-                    # Hit head on platform
-                    self.y = platform.bottom
-                    self.rect.y = int(self.y)
-                    self.velocity_y = 0
+                # Check if we just landed (for sound)
+                if not was_on_ground and self.velocity_y > 200:
+                    just_landed = True
+            self.velocity_y = 0
         
         # Play landing sound if significant fall
         if just_landed and self.audio_manager:
@@ -455,8 +454,10 @@ class Player:
         self.velocity_y = 0
         self.is_attacking = False
     
-    def render(self, screen, camera_x):
-        """Render the player"""
+    def render(self, screen, camera_x, display_list=None):
+        """Render the player (the sprite goes through the display list when given)"""
+        s = render_scale(screen)
+        
         # Calculate screen position with smooth rounding
         screen_x = round(self.x - camera_x)
         screen_y = round(self.y)
@@ -472,37 +473,34 @@ class Player:
         if self.last_anim_state == "idle" and hasattr(self, 'idle_sprite'):
             # Use pre-cached sprite to avoid any transformations per frame
             sprite = self.idle_sprite_flipped if not self.facing_right else self.idle_sprite
+            sprite = scale_surface(sprite, s)
         elif self.animations and self.current_anim:
-            sprite = self.current_anim.get_current_frame()
             # Flip sprite if facing left
-            if not self.facing_right:
-                sprite = pygame.transform.flip(sprite, True, False)
+            sprite = scale_surface(self.current_anim.get_current_frame(), s, not self.facing_right)
         else:
             sprite = None
         
         if sprite:
             # Center sprite on player position
             sprite_rect = sprite.get_rect()
-            sprite_rect.center = (screen_x + self.width // 2, screen_y + self.height // 2)
-            screen.blit(sprite, sprite_rect)
+            sprite_rect.center = ((screen_x + self.width // 2) * s, (screen_y + self.height // 2) * s)
+            draw(screen, display_list, sprite, sprite_rect, LAYER_PLAYER)
         else:
             # Fallback to colored rectangle
-            pygame.draw.rect(screen, self.color, (screen_x, screen_y, self.width, self.height))
+            body = fill_surface(self.width * s, self.height * s, self.color)
+            draw(screen, display_list, body, (screen_x * s, screen_y * s), LAYER_PLAYER)
             
             # Health indicator overlay
             if self.health < 30:
                 overlay_color = RED if self.health < 15 else YELLOW
-                overlay = pygame.Surface((self.width, self.height))
-                overlay.set_alpha(100)
-                overlay.fill(overlay_color)
-                screen.blit(overlay, (screen_x, screen_y))
+                overlay = fill_surface(self.width * s, self.height * s, overlay_color, alpha=100)
+                draw(screen, display_list, overlay, (screen_x * s, screen_y * s), LAYER_PLAYER)
         
         # Direction indicator (for placeholder mode)
         if not self.animations:
-            if self.facing_right:
-                pygame.draw.circle(screen, BLACK, (screen_x + self.width - 10, screen_y + 20), 5)
-            else:
-                pygame.draw.circle(screen, BLACK, (screen_x + 10, screen_y + 20), 5)
+            dot_x = screen_x + self.width - 10 if self.facing_right else screen_x + 10
+            dot = circle_surface(5 * s, BLACK)
+            draw(screen, display_list, dot, ((dot_x - 5) * s, (screen_y + 15) * s), LAYER_PLAYER)
         
         # Draw attack hitbox (debug - set to True to see hitboxes)
         if self.is_attacking and False:
@@ -0,0 +1,242 @@
+"""
+Post-processing - Full-screen effects applied in place to the rendered frame
+"""
+import time
+import numpy as np
+import pygame
+from config import *
+from capture import channel_bytes
+
+EFFECTS = ("vignette", "flash", "scanlines", "grade")
+
+
+def channel_masks(surface):
+    """(shift, mask) of R, G and B in a 32-bit pixel of `surface`"""
+    shifts = surface.get_shifts()[:3]
+    return [(shift, 0xFF << shift) for shift in shifts]
+
+
+def halve_mask(masks, n):
+    """Bits that survive `pixel >> n` inside each channel, so channels don't bleed"""
+    keep = 0
+    for _, mask in masks:
+        keep |= (mask >> n) & mask
+    return keep
+
+
+def vignette_weights(width, height, inner=POSTFX_VIGNETTE_INNER):
+    """Per-pixel vignette weight, 0 inside `inner` (as a fraction of the half
+    diagonal) rising to 255 at the corners, as a (height, width) uint16 array"""
+    ys, xs = np.ogrid[0:height, 0:width]
+    distance = np.sqrt(((xs - width / 2) / (width / 2)) ** 2 + ((ys - height / 2) / (height / 2)) ** 2)
+    weights = np.clip((distance - inner) / (np.sqrt(2) - inner), 0, 1)
+    return (weights * 255).astype(np.uint16)  # Times a 0-256 strength still fits 16 bits
+
+
+def grade_warm(r, g, b):
+    return r * 1.08 + 0.02, g * 1.0, b * 0.85
+
+
+def grade_cool(r, g, b):
+    return r * 0.88, g * 0.98, b * 1.1 + 0.03
+
+
+def grade_noir(r, g, b):
+    luma = 0.299 * r + 0.587 * g + 0.114 * b
+    luma = (luma - 0.5) * 1.3 + 0.5  # Extra contrast
+    return luma, luma, luma
+
+
+# Colour grades: functions of float RGB arrays in [0, 1]
+GRADES = {"warm": grade_warm, "cool": grade_cool, "noir": grade_noir}
+
+
+def build_lut(grade, masks, bits=POSTFX_LUT_BITS):
+    """3D LUT for `grade` as a flat array of packed pixels, indexed by the top
+    `bits` bits of R, G and B"""
+    levels = 1 << bits
+    # Sample the middle of each bucket so rounding doesn't darken the image
+    values = (np.arange(levels) * (256 // levels) + (128 // levels)) / 255.0
+    r, g, b = np.meshgrid(values, values, values, indexing="ij")
+    graded = GRADES[grade](r.ravel(), g.ravel(), b.ravel())
+    lut = np.zeros(levels ** 3, dtype=np.uint32)
+    for channel, (shift, _) in zip(graded, masks):
+        lut |= (np.clip(channel, 0, 1) * 255 + 0.5).astype(np.uint32) << shift
+    return lut
+
+
+class PostProcess:
+    """Optional effects pass over the frame at the internal render resolution
+
+    Every effect works in place on the packed 32-bit pixels through a
+    surfarray view, with per-channel masks keeping bytes apart, so a frame
+    costs a few whole-array NumPy operations and no allocations. Scratch
+    buffers, the vignette weights and colour grade LUTs are built once per
+    render size. Each effect can be toggled; its average cost in ms is kept
+    for the on-screen readout.
+    """
+
+    def __init__(self):
+        self.enabled = {name: POSTFX_EFFECTS.get(name, False) for name in EFFECTS}
+        self.grade = POSTFX_GRADE
+        self.allowed = EFFECTS  # Set by the quality tier
+        self.show_costs = False
+        self.costs = {name: 0.0 for name in EFFECTS}
+
+        self.damage_timer = 0
+        self.flash_timer = 0
+        self.health_ratio = 1.0
+
+        self.size = None
+        self.masks = None
+        self.luts = {}
+
+    def toggle(self, name):
+        self.enabled[name] = not self.enabled[name]
+
+    def cycle_grade(self):
+        """Step through the colour grades, then off"""
+        names = list(GRADES)
+        if not self.enabled["grade"]:
+            self.enabled["grade"] = True
+            self.grade = names[0]
+        elif self.grade == names[-1]:
+            self.enabled["grade"] = False
+        else:
+            self.grade = names[names.index(self.grade) + 1]
+
+    def damage(self):
+        """The player got hurt: pulse the vignette"""
+        self.damage_timer = POSTFX_VIGNETTE_TIME
+
+    def flash(self):
+        """An attack landed: flash the screen"""
+        self.flash_timer = POSTFX_FLASH_TIME
+
+    def update(self, dt, health_ratio):
+        self.damage_timer = max(0, self.damage_timer - dt)
+        self.flash_timer = max(0, self.flash_timer - dt)
+        self.health_ratio = health_ratio
+
+    def clear(self):
+        """Drop running effects (new game, restore)"""
+        self.damage_timer = 0
+        self.flash_timer = 0
+
+    def active(self, name):
+        return self.enabled[name] and name in self.allowed
+
+    def prepare(self, surface):
+        """(Re)build buffers that depend on the surface size or pixel format"""
+        width, height = surface.get_size()
+        masks = channel_masks(surface)
+        if (width, height) == self.size and masks == self.masks:
+            return
+        if masks != self.masks:
+            self.luts = {}
+        self.size = (width, height)
+        self.masks = masks
+        self.offsets = channel_bytes(surface)
+        self.scratch = np.empty((height, width), dtype=np.uint32)
+        self.lut_temp = np.empty((height, width), dtype=np.uint32)
+        self.weights = vignette_weights(width, height)
+        self.factors = np.empty((height, width), dtype=np.uint16)
+        self.products = np.empty((height, width), dtype=np.uint16)
+
+    def apply(self, surface):
+        """Run the enabled effects over `surface` in place"""
+        if not any(self.active(name) for name in EFFECTS):
+            return
+        if surface.get_bitsize() != 32:
+            return  # The render target is converted to the display format, normally 32-bit
+        self.prepare(surface)
+        pixels = pygame.surfarray.pixels2d(surface).T  # (height, width) view, locks the surface
+
+        if self.active("grade"):
+            self.timed("grade", self.apply_grade, pixels)
+        if self.active("vignette"):
+            self.timed("vignette", self.apply_vignette, pixels)
+        if self.active("flash"):
+            self.timed("flash", self.apply_flash, pixels)
+        if self.active("scanlines"):
+            self.timed("scanlines", self.apply_scanlines, pixels)
+        del pixels
+
+    def timed(self, name, effect, pixels):
+        start = time.perf_counter()
+        effect(pixels)
+        elapsed = (time.perf_counter() - start) * 1000
+        self.costs[name] += (elapsed - self.costs[name]) * 0.05
+
+    def apply_grade(self, pixels):
+        """Look every pixel up in the grade's 3D LUT"""
+        lut = self.luts.get(self.grade)
+        if lut is None:
+            lut = self.luts[self.grade] = build_lut(self.grade, self.masks)
+        bits = POSTFX_LUT_BITS
+        index = self.scratch
+        temp = self.lut_temp
+        index.fill(0)
+        for position, (shift, _) in enumerate(self.masks):
+            # Top `bits` bits of the channel, placed at its slot in the LUT index
+            offset = shift + 8 - bits - (2 - position) * bits
+            if offset >= 0:
+                np.right_shift(pixels, offset, out=temp)
+            else:
+                np.left_shift(pixels, -offset, out=temp)
+            np.bitwise_and(temp, ((1 << bits) - 1) << ((2 - position) * bits), out=temp)
+            np.bitwise_or(index, temp, out=index)
+        np.take(lut, index, out=pixels, mode="clip")
+
+    def apply_vignette(self, pixels):
+        """Darken green and blue towards the edges: a red border while hurt or low on health"""
+        strength = self.damage_timer / POSTFX_VIGNETTE_TIME
+        if self.health_ratio < POSTFX_LOW_HEALTH:
+            strength = max(strength, 0.6 * (1 - self.health_ratio / POSTFX_LOW_HEALTH))
+        if strength <= 0:
+            return
+        amount = int(min(strength, 1) * 192)  # At most 3/4 darker in the corners
+        factors = self.factors
+        np.multiply(self.weights, amount, out=factors)
+        np.right_shift(factors, 8, out=factors)
+        np.subtract(256, factors, out=factors)
+
+        channels = pixels.view(np.uint8).reshape(pixels.shape + (4,))
+        for offset in self.offsets[1:]:
+            channel = channels[..., offset]
+            np.multiply(channel, factors, out=self.products)
+            np.right_shift(self.products, 8, out=self.products)
+            np.copyto(channel, self.products, casting="unsafe")
+
+    def apply_flash(self, pixels):
+        """Move every channel part of the way to white, fading over the flash"""
+        if self.flash_timer <= 0:
+            return
+        # 1/2 of the way to white at the start, then 1/4, 1/8
+        n = 1 + int((1 - self.flash_timer / POSTFX_FLASH_TIME) * 3)
+        rgb = sum(mask for _, mask in self.masks)
+        scratch = self.scratch
+        np.bitwise_xor(pixels, rgb, out=scratch)  # 255 - channel, per channel
+        np.right_shift(scratch, n, out=scratch)
+        np.bitwise_and(scratch, halve_mask(self.masks, n), out=scratch)
+        np.add(pixels, scratch, out=pixels)
+
+    def apply_scanlines(self, pixels):
+        """Darken every other row, like a CRT"""
+        rows = pixels[1::2]
+        scratch = self.scratch[1::2]
+        n = POSTFX_SCANLINE_SHIFT
+        np.right_shift(rows, n, out=scratch)
+        np.bitwise_and(scratch, halve_mask(self.masks, n), out=scratch)
+        np.subtract(rows, scratch, out=rows)
+
+    def readout(self):
+        """Cost lines for the enabled effects"""
+        lines = []
+        for name in EFFECTS:
+            if self.active(name):
+                label = f"{name} ({self.grade})" if name == "grade" else name
+                lines.append(f"{label}: {self.costs[name]:.2f} ms")
+            elif self.enabled[name]:
+                lines.append(f"{name}: off at this quality")
+        return lines
@@ -0,0 +1,85 @@
+"""
+Quality governor - Trades visual detail for frame time on slow machines
+"""
+from collections import deque
+from config import *
+
+
+class QualityGovernor:
+    """Steps through QUALITY_TIERS based on a rolling frame-time window
+
+    Frame times fed in should be the time spent working on a frame (not
+    including the sleep in Clock.tick), otherwise a capped frame rate would
+    always look like it has no headroom. Separate downgrade/upgrade
+    thresholds plus a hold time after every change keep the tier from
+    oscillating.
+    """
+
+    def __init__(self, fps=FPS, tiers=QUALITY_TIERS):
+        self.tiers = tiers
+        self.tier = 0
+        self.frame_budget = 1.0 / fps
+        self.frame_times = deque(maxlen=QUALITY_WINDOW)
+        self.frame_time_total = 0.0
+        self.hold_timer = QUALITY_HOLD_TIME
+        self.tier_changes = 0
+
+    @property
+    def settings(self):
+        """Settings dict of the current tier"""
+        return self.tiers[self.tier]
+
+    @property
+    def tier_name(self):
+        return self.tiers[self.tier]["name"]
+
+    @property
+    def avg_frame_time(self):
+        if not self.frame_times:
+            return 0.0
+        return self.frame_time_total / len(self.frame_times)
+
+    def record_frame(self, frame_time, dt=None):
+        """Add one frame's work time (seconds); returns True if the tier changed
+
+        Args:
+            frame_time: Time spent updating and rendering the frame
+            dt: Wall-clock time since the last frame (defaults to frame_time)
+        """
+        if len(self.frame_times) == self.frame_times.maxlen:
+            self.frame_time_total -= self.frame_times[0]
+        self.frame_times.append(frame_time)
+        self.frame_time_total += frame_time
+
+        if self.hold_timer > 0:
+            self.hold_timer -= dt if dt is not None else frame_time
+            return False
+        if len(self.frame_times) < self.frame_times.maxlen:
+            return False
+
+        average = self.avg_frame_time
+        if average > self.frame_budget * QUALITY_DOWNGRADE_RATIO and self.tier < len(self.tiers) - 1:
+            self.set_tier(self.tier + 1)
+            return True
+        if average < self.frame_budget * QUALITY_UPGRADE_RATIO and self.tier > 0:
+            self.set_tier(self.tier - 1)
+            return True
+        return False
+
+    def set_tier(self, tier):
+        """Switch to a tier and restart measuring from a clean window"""
+        self.tier = max(0, min(tier, len(self.tiers) - 1))
+        self.frame_times.clear()
+        self.frame_time_total = 0.0
+        self.hold_timer = QUALITY_HOLD_TIME
+        self.tier_changes += 1
+
+    def telemetry(self):
+        """Snapshot of governor state for logging/overlays"""
+        return {
+            "tier": self.tier,
+            "tier_name": self.tier_name,
+            "avg_frame_ms": round(self.avg_frame_time * 1000, 2),
+            "budget_ms": round(self.frame_budget * 1000, 2),
+            "tier_changes": self.tier_changes,
+        }
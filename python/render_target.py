@@ -0,0 +1,143 @@
+"""
+Render target - Offscreen surface at the internal render resolution
+"""
+import pygame
+from config import *
+
+
+def render_scale(surface):
+    """Scale factor from logical coordinates to pixels on `surface`"""
+    return surface.get_width() / SCREEN_WIDTH
+
+
+def scale_rect(rect, scale):
+    """Scale a logical (x, y, w, h) rect to render-target pixels"""
+    if scale == 1:
+        return rect
+    x, y, w, h = rect
+    return (x * scale, y * scale, w * scale, h * scale)
+
+
+def scale_points(points, scale):
+    """Scale a list of logical (x, y) points to render-target pixels"""
+    if scale == 1:
+        return points
+    return [(x * scale, y * scale) for x, y in points]
+
+
+# (surface, scale, flip_x) -> scaled copy; cleared whenever the render scale changes
+_scaled_surfaces = {}
+
+
+def scale_surface(surface, scale, flip_x=False):
+    """Return `surface` resized by `scale` (and mirrored if flip_x), cached per source
+
+    Only pass long-lived surfaces (animation frames, pre-rendered sprites);
+    per-frame temporaries would just fill the cache.
+    """
+    if scale == 1 and not flip_x:
+        return surface
+    key = (surface, scale, flip_x)
+    scaled = _scaled_surfaces.get(key)
+    if scaled is None:
+        scaled = surface
+        if scale != 1:
+            w, h = surface.get_size()
+            scaled = pygame.transform.scale(surface, (max(1, round(w * scale)), max(1, round(h * scale))))
+        if flip_x:
+            scaled = pygame.transform.flip(scaled, True, False)
+        _scaled_surfaces[key] = scaled
+    return scaled
+
+
+# Scaled surface -> white hit-flash copy; cleared along with _scaled_surfaces
+_flash_surfaces = {}
+
+
+def flash_surface(surface):
+    """Return `surface` brightened for the hit flash, cached per source
+
+    Same rule as scale_surface: only long-lived surfaces.
+    """
+    flashed = _flash_surfaces.get(surface)
+    if flashed is None:
+        flashed = surface.copy()
+        flashed.fill((255, 255, 255, 180), special_flags=pygame.BLEND_RGB_ADD)
+        _flash_surfaces[surface] = flashed
+    return flashed
+
+
+class RenderTarget:
+    """Offscreen surface the game draws into, presented to the window once per frame
+
+    The internal size is RENDER_WIDTH x RENDER_HEIGHT multiplied by the
+    quality governor's render_scale. present() does the only full-frame scale,
+    fitting the image to the window with letterboxing and optional integer
+    scaling.
+    """
+
+    def __init__(self, size=(RENDER_WIDTH, RENDER_HEIGHT), smooth=RENDER_SMOOTH,
+                 integer_scaling=RENDER_INTEGER_SCALING):
+        self.base_size = size
+        self.smooth = smooth
+        self.integer_scaling = integer_scaling
+        self.render_scale = None
+        self.surface = None
+        self.dest_rect = None
+        self._window_size = None
+        self.set_render_scale(1.0)
+
+    @property
+    def scale(self):
+        """Scale factor from logical coordinates to internal pixels"""
+        return render_scale(self.surface)
+
+    def set_render_scale(self, render_scale):
+        """Resize the internal surface to base size * render_scale"""
+        if render_scale == self.render_scale:
+            return
+        self.render_scale = render_scale
+        width = max(1, int(self.base_size[0] * render_scale))
+        height = max(1, int(self.base_size[1] * render_scale))
+        self.surface = pygame.Surface((width, height))
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+        self._window_size = None  # Recompute the layout on the next present
+        _scaled_surfaces.clear()
+        _flash_surfaces.clear()
+
+    def layout(self, window_size):
+        """Compute where the internal image lands in a window of the given size"""
+        src_w, src_h = self.surface.get_size()
+        win_w, win_h = window_size
+        factor = min(win_w / src_w, win_h / src_h)
+        if self.integer_scaling and factor >= 1:
+            factor = int(factor)
+        dest_w = int(src_w * factor)
+        dest_h = int(src_h * factor)
+        return pygame.Rect((win_w - dest_w) // 2, (win_h - dest_h) // 2, dest_w, dest_h)
+
+    def present(self, window):
+        """Scale the internal surface onto the window, letterboxing the rest"""
+        window_size = window.get_size()
+        if window_size != self._window_size:
+            self._window_size = window_size
+            self.dest_rect = self.layout(window_size)
+
+        dest = self.dest_rect
+        self._fill_letterbox(window, dest)
+        if dest.size == self.surface.get_size():
+            window.blit(self.surface, dest)
+        elif self.smooth:
+            pygame.transform.smoothscale(self.surface, dest.size, window.subsurface(dest))
+        else:
+            pygame.transform.scale(self.surface, dest.size, window.subsurface(dest))
+
+    def _fill_letterbox(self, window, dest):
+        win_w, win_h = window.get_size()
+        if dest.x > 0:
+            window.fill(LETTERBOX_COLOR, (0, 0, dest.x, win_h))
+            window.fill(LETTERBOX_COLOR, (dest.right, 0, win_w - dest.right, win_h))
+        if dest.y > 0:
+            window.fill(LETTERBOX_COLOR, (0, 0, win_w, dest.y))
+            window.fill(LETTERBOX_COLOR, (0, dest.bottom, win_w, win_h - dest.bottom))
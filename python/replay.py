@@ -0,0 +1,128 @@
+"""
+Replay - Record gameplay inputs and render them back to frames headlessly
+
+Usage:
+    python replay.py <recording.replay> <out_dir> [--workers N] [--size WxH]
+"""
+import argparse
+import os
+import pickle
+import sys
+import time
+from config import *
+from snapshot import capture, restore
+
+REPLAY_VERSION = 1
+REPLAY_DIR = "replays"
+
+
+class ReplayRecorder:
+    """Start snapshot plus one (dt, held, pressed, quality tier) entry per update
+
+    The quality tier is recorded because it changes how many random numbers
+    hit sparks and screen shake draw, which the simulation shares.
+    """
+
+    def __init__(self, game):
+        self.snapshot = capture(game)
+        self.frames = []
+
+    def record(self, dt, held, pressed, tier):
+        self.frames.append((dt, held, pressed, tier))
+
+    def save(self, out_dir=REPLAY_DIR):
+        """Write the recording; returns its path"""
+        os.makedirs(out_dir, exist_ok=True)
+        path = os.path.join(out_dir, time.strftime("%Y%m%d-%H%M%S") + ".replay")
+        with open(path, "wb") as f:
+            pickle.dump((REPLAY_VERSION, self.snapshot, self.frames), f, protocol=pickle.HIGHEST_PROTOCOL)
+        return path
+
+
+def load_replay(path):
+    """(snapshot, frames) from a saved recording"""
+    with open(path, "rb") as f:
+        version, snapshot, frames = pickle.load(f)
+    if version != REPLAY_VERSION:
+        raise ValueError(f"Unsupported replay version {version}")
+    return snapshot, frames
+
+
+def replay_game(game, snapshot, frames):
+    """Restore the recording into `game` and step it; yields after each frame"""
+    restore(game, snapshot)
+    for index, (dt, held, pressed, tier) in enumerate(frames):
+        if tier != game.quality.tier:
+            game.quality.tier = tier
+            game.apply_quality()
+        if pressed:
+            game.player.handle_buttons(pressed)
+        game.update(dt, held)
+        yield index
+
+
+def render_range(path, out_dir, start, end, size):
+    """Simulate a recording from the start and save frames [start, end) as PNGs
+
+    Simulation is cheap next to rendering, so every worker replays from the
+    beginning and only renders its own range. Runs headless.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+    from game import Game
+    from capture import frame_buffer, copy_surface, encode_png
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    screen = pygame.Surface(size).convert()
+    game = Game(screen, SCREEN_WIDTH, SCREEN_HEIGHT)
+    game.start_game()
+    snapshot, frames = load_replay(path)
+
+    scanlines, pixels = frame_buffer(*size)
+    written = 0
+    for index in replay_game(game, snapshot, frames[:end]):
+        if index < start:
+            continue
+        game.render()
+        copy_surface(screen, pixels)
+        with open(os.path.join(out_dir, f"frame_{index:06d}.png"), "wb") as f:
+            f.write(encode_png(scanlines, size[0], size[1]))
+        written += 1
+    pygame.quit()
+    return written
+
+
+def render_parallel(path, out_dir, workers=None, size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+    """Render a recording to PNG frames split across worker processes"""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    os.makedirs(out_dir, exist_ok=True)
+    _, frames = load_replay(path)
+    workers = workers or os.cpu_count() or 1
+    chunk = -(-len(frames) // workers)
+    ranges = [(start, min(start + chunk, len(frames))) for start in range(0, len(frames), chunk)]
+    # Spawn so every worker gets a fresh pygame/SDL
+    with ProcessPoolExecutor(len(ranges), mp_context=multiprocessing.get_context("spawn")) as pool:
+        jobs = [pool.submit(render_range, path, out_dir, start, end, size) for start, end in ranges]
+        return sum(job.result() for job in jobs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a Skunk Fu replay to PNG frames")
+    parser.add_argument("replay")
+    parser.add_argument("out_dir")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--size", default=f"{SCREEN_WIDTH}x{SCREEN_HEIGHT}")
+    args = parser.parse_args()
+
+    size = tuple(int(n) for n in args.size.lower().split("x"))
+    start = time.perf_counter()
+    written = render_parallel(args.replay, args.out_dir, args.workers, size)
+    print(f"Wrote {written} frames to {args.out_dir} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
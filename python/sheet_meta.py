@@ -0,0 +1,146 @@
+"""
+Sheet metadata - frame layout and visible bounds of sprite sheets, cached per file content
+
+assets/sprites/sheets.json maps each sheet (path relative to assets/sprites)
+to the SHA-256 of the file it describes and its layout: frame count and
+size, stride and offset of the first frame, gutter, and each frame's
+visible bounds [x, y, w, h]. toolshed/sheet_layout.py writes it for every
+sheet it builds. When the game meets a sheet that is missing or has
+changed since, it measures it once with detect_layout() and saves the
+entry to .cache/sheets.json (never the tracked file), so the layout is
+only ever worked out once per file content. The toolshed scripts use the
+same frame_layout() heuristic and read the same file.
+"""
+import hashlib
+import json
+import os
+import asset_bundle
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SHEETS_FILE = os.path.join(ROOT, "assets", "sprites", "sheets.json")
+CACHE_FILE = os.path.join(ROOT, ".cache", "sheets.json")  # Entries the game measured itself
+MAX_PAD = 8  # Widest gutter between frames the loaders recognise
+
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def layout_digest(meta):
+    """Short hash of the fields that decide how frames are cut from a sheet"""
+    fields = [meta[field] for field in ("frames", "frame_width", "frame_height", "stride", "offset")]
+    return sha256(json.dumps(fields).encode())[:16]
+
+
+def frame_layout(width, frames, frame_width):
+    """(pad, trailing) for a sheet of `frames` frames `frame_width` wide: a
+    uniform gutter between frames (trailing False) or after each frame
+    (trailing True). None if neither fits."""
+    extra = width - frames * frame_width
+    if extra == 0:
+        return 0, False
+    if frames > 1 and extra % (frames - 1) == 0 and 0 < extra // (frames - 1) <= MAX_PAD:
+        return extra // (frames - 1), False
+    if extra % frames == 0 and 0 < extra // frames <= MAX_PAD:
+        return extra // frames, True
+    return None
+
+
+def detect_layout(width, height, frames, frame_width=None):
+    """Layout of a horizontal strip of `frames` frames: square frames with any
+    uniform gutter, else an even split, else `frame_width` frames (the
+    caller's hint) centred in the sheet"""
+    candidates = [height] + ([width // frames] if width % frames == 0 else [])
+    for candidate in candidates:
+        layout = frame_layout(width, frames, candidate)
+        if layout is not None:
+            pad, trailing = layout
+            return {"frames": frames, "frame_width": candidate, "frame_height": height,
+                    "stride": candidate + pad, "offset": 0, "pad": pad, "trailing": trailing}
+    frame_width = min(frame_width or width // frames, width // frames)
+    return {"frames": frames, "frame_width": frame_width, "frame_height": height, "stride": frame_width,
+            "offset": (width - frames * frame_width) // 2, "pad": 0, "trailing": False}
+
+
+class SheetIndex:
+    """sheets.json, loaded on first use
+
+    The tools read and update the tracked file at `path`. The game
+    (runtime=True) reads it through asset_bundle and writes what it measures
+    only to CACHE_FILE. The tracked file always wins: a cached entry is only
+    used for a sheet it doesn't describe (missing, or made from other bytes),
+    and is dropped once it does.
+    """
+
+    def __init__(self, path=SHEETS_FILE, runtime=False):
+        self.path = path
+        self.runtime = runtime
+        self._sheets = None
+        self._cached = None  # Runtime measurements from CACHE_FILE
+
+    @property
+    def sheets(self):
+        """The tracked index"""
+        if self._sheets is None:
+            if self.runtime:
+                try:
+                    self._sheets = json.loads(bytes(asset_bundle.read("sprites/sheets.json")))
+                except (OSError, ValueError):
+                    self._sheets = {}
+            else:
+                self._sheets = self._load(self.path)
+        return self._sheets
+
+    @property
+    def cached(self):
+        """Runtime measurements the tracked index doesn't cover"""
+        if self._cached is None:
+            saved = self._load(CACHE_FILE) if self.runtime else {}
+            self._cached = {name: entry for name, entry in saved.items() if not self.covers(name, entry.get("sha256"))}
+            if len(self._cached) < len(saved):
+                self._save(CACHE_FILE, self._cached)
+        return self._cached
+
+    def covers(self, name, digest):
+        """Whether the tracked index describes sheet `name` with these contents"""
+        entry = self.sheets.get(name)
+        return entry is not None and entry.get("sha256") == digest
+
+    @staticmethod
+    def _load(path):
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _save(path, sheets):
+        """Write an index (best effort: a read-only install just measures again next time)"""
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                json.dump(dict(sorted(sheets.items())), f, indent=2)
+        except OSError:
+            pass
+
+    def lookup(self, name, data):
+        """Entry for sheet `name` if it describes exactly these file bytes, else None"""
+        digest = sha256(data)
+        cached = self.cached  # Loading it drops entries the tracked index now covers
+        if self.covers(name, digest):
+            return self.sheets[name]
+        entry = cached.get(name)
+        if entry is None or entry.get("sha256") != digest:
+            return None
+        return entry
+
+    def update(self, entries):
+        """Merge {name: entry} into the index and write it back: the tracked
+        file for the tools, CACHE_FILE for the game"""
+        if self.runtime:
+            self.cached.update(entries)
+            self._save(CACHE_FILE, self.cached)
+        else:
+            self.sheets.update(entries)
+            self._save(self.path, self.sheets)
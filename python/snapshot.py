@@ -0,0 +1,214 @@
+"""
+Snapshots - Capture and restore the full simulation state
+"""
+import io
+import pickle
+import random
+from collections import deque
+
+SNAPSHOT_VERSION = 2
+
+# Plain attributes copied verbatim (numbers, bools and short strings only)
+GAME_FIELDS = (
+    "state", "score", "lives", "camera_x",
+    "screen_shake_timer", "screen_shake_intensity", "hit_pause_timer",
+)
+PLAYER_FIELDS = (
+    "x", "y", "health", "velocity_x", "velocity_y", "target_velocity_x",
+    "facing_right", "on_ground", "coyote_timer", "jump_buffer_timer",
+    "is_attacking", "attack_timer", "attack_cooldown_timer", "is_shadow_striking",
+    "combo_count", "combo_timer", "hit_stun_timer", "invulnerable_timer",
+    "current_attack_damage", "last_anim_state",
+)
+ENEMY_FIELDS = (
+    "x", "y", "health", "max_health", "speed", "velocity_x", "velocity_y",
+    "facing_right", "start_x", "start_y", "is_attacking", "attack_timer",
+    "attack_cooldown_timer", "hit_stun_timer", "knockback_velocity_x", "state",
+    "last_anim_state", "nav_node", "nav_goal", "nav_edge",
+)
+FLYING_FIELDS = ("hover_time", "dive_cooldown", "is_diving")
+MANAGER_FIELDS = ("player_node",)
+DIRECTOR_FIELDS = ("spawn_timer", "flying_spawn_timer", "avg_frame_time", "rate_scale")
+
+
+def _rect(rect):
+    return (rect.x, rect.y, rect.width, rect.height)
+
+
+def _anim_state(obj):
+    """(animation name, frame, timer, finished) of the object's current animation"""
+    anim = obj.current_anim
+    if anim is None or not obj.animations:
+        return None
+    for name, candidate in obj.animations.items():
+        if candidate is anim:
+            return (name, anim.current_frame, anim.timer, anim.finished)
+    return None
+
+
+def _restore_anim(obj, state):
+    if state is None or not obj.animations or state[0] not in obj.animations:
+        obj.current_anim = None
+        return
+    name, frame, timer, finished = state
+    anim = obj.animations[name]
+    anim.current_frame = frame
+    anim.timer = timer
+    anim.finished = finished
+    obj.current_anim = anim
+
+
+def capture_player(player):
+    """Plain-value state of a player (fields, rects and animation position)"""
+    return (
+        tuple(getattr(player, name) for name in PLAYER_FIELDS),
+        _rect(player.rect),
+        _rect(player.attack_hitbox),
+        _anim_state(player),
+    )
+
+
+def restore_player(player, state):
+    """Apply a capture_player() state to `player` in place"""
+    values, rect, hitbox, anim_state = state
+    for name, value in zip(PLAYER_FIELDS, values):
+        setattr(player, name, value)
+    player.rect.update(rect)
+    player.attack_hitbox.update(hitbox)
+    _restore_anim(player, anim_state)
+
+
+def capture(game):
+    """Serialise the simulation state of `game` into a bytes buffer
+
+    Only plain values are stored (no surfaces or sounds), so restoring never
+    touches assets. Visual-only state (damage numbers, sparks) is not kept.
+    """
+    player = game.player
+    manager = game.enemy_manager
+    enemies = manager.enemies
+
+    enemy_records = []
+    for enemy in enemies:
+        fields = ENEMY_FIELDS + FLYING_FIELDS if enemy.enemy_type == "FLYING" else ENEMY_FIELDS
+        enemy_records.append((
+            enemy.enemy_type,
+            tuple(getattr(enemy, name) for name in fields),
+            _rect(enemy.rect),
+            _rect(enemy.attack_hitbox),
+            _anim_state(enemy),
+        ))
+
+    # Enemies already hit by the current attack, stored by slot
+    hit_slots = tuple(sorted(enemy.pool_index for enemy in player.hit_enemies
+                      if 0 <= enemy.pool_index < len(enemies) and enemies[enemy.pool_index] is enemy))
+
+    player_state = capture_player(player) + (hit_slots,)
+
+    state = (
+        SNAPSHOT_VERSION,
+        tuple(getattr(game, name) for name in GAME_FIELDS),
+        player_state,
+        tuple(enemy_records),
+        tuple(getattr(manager, name) for name in MANAGER_FIELDS),
+        tuple(getattr(manager.director, name) for name in DIRECTOR_FIELDS),
+        random.getstate(),
+    )
+    # Memoisation off: the memo depends on object identity, so equal states
+    # could otherwise pickle to different bytes and break byte-wise diffing
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.fast = True
+    pickler.dump(state)
+    return buffer.getvalue()
+
+
+def restore(game, data, restore_rng=True):
+    """Restore a buffer from capture() into `game` in place
+
+    Enemies are taken from the enemy pool, so no sprites are loaded.
+    """
+    (version, game_values, player_state, enemy_records, manager_values, director_values,
+     rng_state) = pickle.loads(data)
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version {version}")
+
+    for name, value in zip(GAME_FIELDS, game_values):
+        setattr(game, name, value)
+
+    manager = game.enemy_manager
+    for enemy in manager.enemies:
+        manager.pool.release(enemy)
+    manager.enemies.clear()
+    for enemy_type, values, rect, hitbox, anim_state in enemy_records:
+        enemy = manager.spawn_enemy(values[0], values[1], enemy_type)
+        fields = ENEMY_FIELDS + FLYING_FIELDS if enemy_type == "FLYING" else ENEMY_FIELDS
+        for name, value in zip(fields, values):
+            setattr(enemy, name, value)
+        enemy.rect.update(rect)
+        enemy.attack_hitbox.update(hitbox)
+        _restore_anim(enemy, anim_state)
+
+    player = game.player
+    restore_player(player, player_state[:-1])
+    hit_slots = player_state[-1]
+    player.hit_enemies.clear()
+    player.hit_enemies.update(manager.enemies[slot] for slot in hit_slots)
+    player._current_enemies = manager.enemies
+
+    for name, value in zip(MANAGER_FIELDS, manager_values):
+        setattr(manager, name, value)
+    for name, value in zip(DIRECTOR_FIELDS, director_values):
+        setattr(manager.director, name, value)
+
+    if restore_rng:
+        random.setstate(rng_state)
+
+    game.damage_numbers.clear()
+    game.hit_sparks.clear()
+
+
+class SnapshotRing:
+    """Ring of recent snapshots for rewinding, plus a quick-save checkpoint"""
+
+    def __init__(self, capacity=50, interval=0.1):
+        self.snapshots = deque(maxlen=capacity)
+        self.interval = interval  # Seconds of game time between snapshots
+        self.timer = 0
+        self.checkpoint = None
+
+    def record(self, game, dt):
+        """Capture a snapshot every `interval` seconds of game time"""
+        self.timer += dt
+        if self.timer >= self.interval or not self.snapshots:
+            self.timer = 0
+            self.snapshots.append(capture(game))
+
+    def rewind(self, game, steps=10):
+        """Step back up to `steps` snapshots; returns False if there is nothing to rewind to"""
+        if not self.snapshots:
+            return False
+        data = None
+        for _ in range(min(steps, len(self.snapshots))):
+            data = self.snapshots.pop()
+        # Keep the restored point so repeated rewinds continue from there
+        self.snapshots.append(data)
+        restore(game, data)
+        self.timer = 0
+        return True
+
+    def save_checkpoint(self, game):
+        self.checkpoint = capture(game)
+
+    def load_checkpoint(self, game):
+        """Restore the checkpoint; returns False if none was saved"""
+        if self.checkpoint is None:
+            return False
+        restore(game, self.checkpoint)
+        self.snapshots.clear()
+        self.timer = 0
+        return True
+
+    def clear(self):
+        self.snapshots.clear()
+        self.timer = 0
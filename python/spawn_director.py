@@ -0,0 +1,118 @@
+"""
+Spawn director - Decides when and where enemies spawn and despawn
+"""
+import random
+from config import *
+
+
+class SpawnDirector:
+    """Timed spawning bounded by population budgets
+
+    Spawns are drawn from the level's spawn points just outside the visible
+    screen, limited by per-type and global caps. Enemies that end up far
+    outside the screen are despawned so the population stays bounded no
+    matter where the player goes.
+    """
+
+    def __init__(self, screen_width=SCREEN_WIDTH, adaptive=SPAWN_ADAPTIVE):
+        self.screen_width = screen_width
+        self.spawn_timer = 0
+        self.spawn_interval = 5.0  # Seconds between ground spawns
+        self.flying_spawn_timer = 0
+        self.flying_spawn_interval = 8.0  # Spawn flying enemies less frequently
+
+        # Population budgets
+        self.global_cap = SPAWN_GLOBAL_CAP
+        self.type_caps = dict(SPAWN_TYPE_CAPS)
+        self.despawn_distance = DESPAWN_DISTANCE
+
+        # Frame-time adaptation: spawn timers run slower while over budget
+        self.adaptive = adaptive
+        self.frame_budget = 1.0 / FPS
+        self.avg_frame_time = self.frame_budget
+        self.rate_scale = 1.0
+
+        # Telemetry
+        self.spawned = 0
+        self.despawned = 0
+
+    def reset(self):
+        """Reset timers at level start"""
+        self.spawn_timer = 0
+        self.flying_spawn_timer = 0
+        self.avg_frame_time = self.frame_budget
+        self.rate_scale = 1.0
+
+    def update(self, dt, manager, level, camera_x):
+        """Despawn distant enemies, then spawn new ones when timers allow"""
+        if self.adaptive:
+            # Exponential moving average of frame time
+            self.avg_frame_time += (dt - self.avg_frame_time) * 0.1
+            self.rate_scale = min(1.0, self.frame_budget * 1.25 / self.avg_frame_time)
+
+        self.despawn_distant(manager, camera_x)
+
+        self.spawn_timer += dt * self.rate_scale
+        if self.spawn_timer >= self.spawn_interval:
+            self.spawn_timer = 0
+            enemy_type = "BASIC" if random.random() < 0.7 else "FAST_BASIC"
+            if not self.can_spawn(manager, enemy_type):
+                enemy_type = "FAST_BASIC" if enemy_type == "BASIC" else "BASIC"
+            self.try_spawn(manager, level, camera_x, enemy_type, "ground")
+
+        self.flying_spawn_timer += dt * self.rate_scale
+        if self.flying_spawn_timer >= self.flying_spawn_interval:
+            self.flying_spawn_timer = 0
+            self.try_spawn(manager, level, camera_x, "FLYING", "air")
+
+    def can_spawn(self, manager, enemy_type):
+        """Check the global and per-type population caps"""
+        if len(manager.enemies) >= self.global_cap:
+            return False
+        cap = self.type_caps.get(enemy_type)
+        if cap is None:
+            return True
+        count = 0
+        for enemy in manager.enemies:
+            if enemy.enemy_type == enemy_type:
+                count += 1
+        return count < cap
+
+    def try_spawn(self, manager, level, camera_x, enemy_type, kind):
+        """Spawn an enemy at an off-screen spawn point if the budget allows"""
+        if not self.can_spawn(manager, enemy_type):
+            return None
+        point = self.pick_spawn_point(level, camera_x, kind)
+        if point is None:
+            return None
+        self.spawned += 1
+        return manager.spawn_enemy(point['x'], point['y'], enemy_type)
+
+    def pick_spawn_point(self, level, camera_x, kind):
+        """Pick a spawn point just off-screen, preferring ahead of the camera"""
+        right_min = camera_x + self.screen_width + SPAWN_MARGIN
+        left_max = camera_x - SPAWN_MARGIN
+        ahead = []
+        behind = []
+        for point in level.spawn_points:
+            if point['kind'] != kind:
+                continue
+            if right_min <= point['x'] <= right_min + SPAWN_WINDOW:
+                ahead.append(point)
+            elif left_max - SPAWN_WINDOW <= point['x'] <= left_max:
+                behind.append(point)
+        candidates = ahead or behind
+        if not candidates:
+            return None
+        return random.choice(candidates)
+
+    def despawn_distant(self, manager, camera_x):
+        """Recycle enemies that are far outside the visible screen"""
+        left = camera_x - self.despawn_distance
+        right = camera_x + self.screen_width + self.despawn_distance
+        enemies = manager.enemies
+        for i in range(len(enemies) - 1, -1, -1):
+            enemy = enemies[i]
+            if enemy.x + enemy.width < left or enemy.x > right:
+                manager.remove_enemy(enemy)
+                self.despawned += 1
@@ -1,8 +1,13 @@
 """
 Sprite loader and animation handler
 """
+import io
+import json
 import pygame
 import os
+import asset_bundle
+from pixel_cache import PixelCache
+from sheet_meta import SheetIndex, detect_layout, layout_digest, sha256
 
 class SpriteLoader:
     """Utility class for loading and managing sprites"""
@@ -10,16 +15,67 @@ class SpriteLoader:
     def __init__(self):
         self.sprites = {}
         self.base_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "sprites")
+        self._prescaled = None  # Sprite path -> {"WxH": entry}, from scaled/manifest.json
+        self.sheet_index = SheetIndex(runtime=True)
+        self.pixel_cache = PixelCache()
+
+    def load_prescaled(self, path, scale, source_digest):
+        """Frames of `path` pre-scaled to `scale` by toolshed/pixel_scale.py, or None
+
+        Pre-scaled sheets hold the frames packed side by side at their final
+        size, so they are sliced without any runtime scaling. They are only
+        used while they were made from the current source (SHA-256
+        `source_digest`); otherwise the caller scales at runtime."""
+        if self._prescaled is None:
+            try:
+                self._prescaled = json.load(asset_bundle.open_asset("sprites/scaled/manifest.json"))
+            except (OSError, ValueError):
+                self._prescaled = {}
+        width, height = scale
+        entry = self._prescaled.get(path, {}).get(f"{width}x{height}")
+        if entry is None:
+            return None
+        if entry.get("source_sha256") != source_digest:
+            print(f"Pre-scaled {entry['file']} is out of date with {path}, scaling at runtime "
+                  f"(rerun toolshed/pixel_scale.py)")
+            return None
+        key = f"scaled/{entry['file']}"
+        try:
+            data = self.read(key)
+            digest = sha256(data)
+            frames = self.pixel_cache.get(key, digest)
+            if frames is None:
+                sheet = pygame.image.load(io.BytesIO(data), os.path.basename(key)).convert_alpha()
+                frames = [sheet.subsurface((i * width, 0, width, height)) for i in range(entry["frames"])]
+                self.pixel_cache.put(key, digest, frames)
+        except (pygame.error, OSError) as e:
+            print(f"Warning: Could not load pre-scaled sprite {entry['file']}: {e}")
+            return None
+        return frames
+
+    def read(self, path):
+        """Bytes of a file under assets/sprites, from the asset bundle when there is one"""
+        return asset_bundle.read("sprites/" + path)
     
     def load_sprite(self, path, scale=None):
         """Load a single sprite image"""
         try:
-            full_path = os.path.join(self.base_path, path)
-            image = pygame.image.load(full_path).convert_alpha()
+            data = self.read(path)
+            digest = sha256(data)
+            if scale:
+                frames = self.load_prescaled(path, scale, digest)
+                if frames:
+                    return frames[0]
+            key = f"{path}:{scale[0]}x{scale[1]}" if scale else path
+            cached = self.pixel_cache.get(key, digest)
+            if cached:
+                return cached[0]
+            image = pygame.image.load(io.BytesIO(data), os.path.basename(path)).convert_alpha()
             if scale:
                 image = pygame.transform.scale(image, scale)
+            self.pixel_cache.put(key, digest, [image])
             return image
-        except pygame.error as e:
+        except (pygame.error, OSError) as e:
             print(f"Warning: Could not load sprite {path}: {e}")
             # Return a colored rectangle as fallback
             surf = pygame.Surface((50, 50))
@@ -28,63 +84,47 @@ class SpriteLoader:
     
     def load_spritesheet(self, path, frame_width, frame_height, num_frames, scale=None):
         """Load a sprite sheet and split it into frames
-        
-        This loader attempts to detect uniform padding between frames (1..8px)
-        and will compute the effective frame width/stride when sheets include
-        padding between frames. If no padding is found, it falls back to using
-        a simple division of sheet width by frame count.
+
+        The layout (frame size, stride, offset and gutter) comes from
+        assets/sprites/sheets.json when its entry matches the file's
+        contents, so nothing is detected at load. A sheet without one is
+        measured once with sheet_meta.detect_layout() and its entry cached in
+        .cache/sheets.json. The finished frames are baked into the pixel
+        cache under the file's hash and the layout's, so later runs build
+        them from it without decoding or scaling anything.
 
         Args:
             path: Path to sprite sheet image
-            frame_width: Hint width of each frame in pixels (used as fallback)
-            frame_height: Height of each frame in pixels
-            num_frames: Number of frames in the sheet (horizontal)
-            scale: Optional tuple (width, height) to scale each frame
+            frame_width: Width hint for sheets that have to be measured
+            frame_height: Height of each frame in pixels (for the placeholder)
+            num_frames: Number of frames for sheets that have to be measured;
+                the metadata's count wins for known sheets
+            scale: Optional tuple (width, height) to scale each frame; sheets
+                pre-scaled to that size by toolshed/pixel_scale.py are used as is
         """
         try:
-            full_path = os.path.join(self.base_path, path)
-            sheet = pygame.image.load(full_path).convert_alpha()
-            frames = []
-
-            sheet_w, sheet_h = sheet.get_size()
-
-            # Try to detect uniform padding between frames (1..8 px)
-            detected_pad = 0
-            detected_frame_w = None
-            for pad in range(1, 9):
-                adjusted = sheet_w - pad * (num_frames - 1)
-                if adjusted > 0 and (adjusted % num_frames) == 0:
-                    detected_pad = pad
-                    detected_frame_w = adjusted // num_frames
-                    break
-
-            if detected_pad > 0:
-                src_frame_w = detected_frame_w
-                frame_stride = src_frame_w + detected_pad
-                print(f"SpriteLoader (py): sprite {path} -> detected pad={detected_pad}, frameWidth={src_frame_w}, stride={frame_stride}")
-            elif sheet_w % num_frames == 0:
-                src_frame_w = sheet_w // num_frames
-                frame_stride = src_frame_w
-                # If src_frame_w differs from provided hint, prefer the detected one
-                if src_frame_w != frame_width:
-                    print(f"SpriteLoader (py): sprite {path} width {sheet_w} divisible by {num_frames}; using frameWidth={src_frame_w}")
-            else:
-                # Fall back to using provided hint/frame_width and assume frames are packed
-                src_frame_w = frame_width
-                frame_stride = frame_width
-                print(f"SpriteLoader (py): sprite {path} width {sheet_w} not divisible and no pad found; falling back to hint frameWidth={frame_width}")
-
-            # Compute optional centering offset if total used width is smaller
-            total_used = (num_frames - 1) * frame_stride + src_frame_w
-            frame_offset = 0
-            if sheet_w > total_used:
-                frame_offset = (sheet_w - total_used) // 2
+            data = self.read(path)
+            digest = sha256(data)
+            if scale:
+                frames = self.load_prescaled(path, scale, digest)
+                if frames and len(frames) == num_frames:
+                    return frames
+            key = f"{path}:{num_frames}" + (f":{scale[0]}x{scale[1]}" if scale else "")
+            # Baked frames depend on the layout they were cut with as well as the file
+            meta = self.sheet_index.lookup(path, data)
+            if meta is not None:
+                frames = self.pixel_cache.get(key, f"{digest}:{layout_digest(meta)}")
+                if frames is not None:
+                    return frames
+            sheet = pygame.image.load(io.BytesIO(data), os.path.basename(path)).convert_alpha()
+            if meta is None:
+                meta = self.measure_sheet(path, data, sheet, num_frames, frame_width)
 
-            # Extract frames using computed stride/width
-            for i in range(num_frames):
-                sx = frame_offset + i * frame_stride
-                source_rect = pygame.Rect(sx, 0, src_frame_w, frame_height)
-                frame = pygame.Surface((src_frame_w, frame_height), pygame.SRCALPHA)
+            frames = []
+            width, height = meta["frame_width"], meta["frame_height"]
+            for i in range(meta["frames"]):
+                source_rect = pygame.Rect(meta["offset"] + i * meta["stride"], 0, width, height)
+                frame = pygame.Surface((width, height), pygame.SRCALPHA)
                 frame.blit(sheet, (0, 0), source_rect)
 
                 # Scale if requested
@@ -92,8 +132,9 @@ class SpriteLoader:
                     frame = pygame.transform.scale(frame, scale)
                 frames.append(frame)
 
+            self.pixel_cache.put(key, f"{digest}:{layout_digest(meta)}", frames)
             return frames
-        except pygame.error as e:
+        except (pygame.error, OSError) as e:
             print(f"Warning: Could not load spritesheet {path}: {e}")
             # Return placeholder frames
             size = scale if scale else (frame_width, frame_height)
@@ -101,6 +142,18 @@ class SpriteLoader:
             surf.fill((255, 0, 255))
             return [surf]
 
+    def measure_sheet(self, path, data, sheet, num_frames, frame_width):
+        """Work out and record the layout of a sheet sheets.json does not describe"""
+        meta = detect_layout(*sheet.get_size(), num_frames, frame_width)
+        bounds = []
+        for i in range(num_frames):
+            rect = pygame.Rect(meta["offset"] + i * meta["stride"], 0, meta["frame_width"], meta["frame_height"])
+            visible = sheet.subsurface(rect.clip(sheet.get_rect())).get_bounding_rect()
+            bounds.append(list(visible) if visible.width and visible.height else None)
+        meta = dict(meta, sha256=sha256(data), bounds=bounds)
+        self.sheet_index.update({path: meta})
+        return meta
+
 
 class Animation:
     """Handles sprite animation"""
@@ -0,0 +1,142 @@
+"""
+Tilemap - Platforms rasterised from tile images into cached chunk surfaces
+"""
+import math
+import pygame
+import asset_bundle
+from config import *
+from render_target import render_scale
+
+
+def load_tile(name):
+    """Load a tile image by name, or None if it is missing"""
+    try:
+        image = pygame.image.load(asset_bundle.open_asset(f"sprites/backgrounds/tiles/{name}.png"), name + ".png")
+    except (pygame.error, FileNotFoundError) as e:
+        print(f"Warning: Could not load tile {name}: {e}")
+        return None
+    if pygame.display.get_surface() is not None:
+        image = image.convert_alpha()
+    return image
+
+
+def blend_rect(target, rect, color):
+    """Alpha-blend a solid RGBA rect onto `target` (draw.rect would overwrite)"""
+    rect = pygame.Rect(rect)
+    if rect.width <= 0 or rect.height <= 0:
+        return
+    overlay = pygame.Surface(rect.size, pygame.SRCALPHA)
+    overlay.fill(color)
+    target.blit(overlay, rect)
+
+
+class TileMap:
+    """Static platforms pre-rendered into vertical strips of the level
+
+    Each platform is filled with its tile image repeated from the world
+    origin (so neighbouring platforms line up), outlined and given a top
+    highlight, like the JS tile renderer. The results are cached per chunk
+    of TILE_CHUNK_WIDTH logical pixels at the current render scale; a frame
+    draws one blit per visible chunk. Chunks are rebuilt only when
+    mark_dirty() touches them or the render scale changes.
+    """
+
+    def __init__(self, platforms, tile_names, level_width, chunk_width=TILE_CHUNK_WIDTH):
+        self.platforms = list(zip(platforms, tile_names))
+        self.chunk_width = chunk_width
+        self.chunk_count = math.ceil(level_width / chunk_width)
+        self.tiles = {}
+        for name in set(tile_names):
+            self.tiles[name] = load_tile(name)
+        # Usable only if every tile the platforms name could be loaded
+        self.ready = all(tile is not None for tile in self.tiles.values())
+
+        self.top = min(platform.top for platform in platforms)
+        self.bottom = max(platform.bottom for platform in platforms)
+        self.scale = None
+        self.scaled_tiles = {}
+        self.chunks = [None] * self.chunk_count
+        self.dirty = [True] * self.chunk_count
+        self.chunk_builds = 0
+
+    def mark_dirty(self, rect):
+        """Rebuild the chunks overlapping `rect` (logical coordinates) on next use"""
+        first = max(0, rect.left // self.chunk_width)
+        last = min(self.chunk_count - 1, (rect.right - 1) // self.chunk_width)
+        for index in range(first, last + 1):
+            self.dirty[index] = True
+
+    def set_scale(self, scale):
+        """Drop every chunk when the render scale changes"""
+        if scale == self.scale:
+            return
+        self.scale = scale
+        self.scaled_tiles = {}
+        for name, tile in self.tiles.items():
+            w, h = tile.get_size()
+            self.scaled_tiles[name] = tile if scale == 1 else pygame.transform.scale(
+                tile, (max(1, round(w * scale)), max(1, round(h * scale))))
+        self.chunks = [None] * self.chunk_count
+        self.dirty = [True] * self.chunk_count
+
+    def build(self, scale):
+        """Rasterise every chunk now (at level load), instead of on first sight"""
+        self.set_scale(scale)
+        for index in range(self.chunk_count):
+            self.chunk(index)
+
+    def chunk(self, index):
+        """The chunk surface, rebuilt first if it is dirty"""
+        if self.dirty[index]:
+            self.chunks[index] = self.build_chunk(index)
+            self.dirty[index] = False
+            self.chunk_builds += 1
+        return self.chunks[index]
+
+    def build_chunk(self, index):
+        s = self.scale
+        left = index * self.chunk_width
+        area = pygame.Rect(left, self.top, self.chunk_width, self.bottom - self.top)
+        surface = pygame.Surface((math.ceil(area.width * s), math.ceil(area.height * s)), pygame.SRCALPHA)
+
+        def local(rect):
+            """Logical world rect -> pixel rect inside this chunk"""
+            x = round((rect.x - area.x) * s)
+            y = round((rect.y - area.y) * s)
+            return pygame.Rect(x, y, round((rect.right - area.x) * s) - x, round((rect.bottom - area.y) * s) - y)
+
+        for platform, name in self.platforms:
+            if not platform.colliderect(area):
+                continue
+            tile = self.scaled_tiles[name]
+            tile_w, tile_h = self.tiles[name].get_size()
+            target = local(platform)
+            surface.set_clip(target)
+            # Tiles are anchored to the world origin, not to each platform
+            for ty in range(platform.top // tile_h * tile_h, platform.bottom, tile_h):
+                for tx in range(max(platform.left, area.left) // tile_w * tile_w,
+                                min(platform.right, area.right), tile_w):
+                    surface.blit(tile, local(pygame.Rect(tx, ty, tile_w, tile_h)))
+
+            border = max(1, round(2 * s))
+            blend_rect(surface, (target.x, target.y, target.width, border), (0, 0, 0, 153))
+            blend_rect(surface, (target.x, target.bottom - border, target.width, border), (0, 0, 0, 153))
+            blend_rect(surface, (target.x, target.y + border, border, target.height - 2 * border), (0, 0, 0, 153))
+            blend_rect(surface, (target.right - border, target.y + border, border, target.height - 2 * border),
+                       (0, 0, 0, 153))
+            blend_rect(surface, (target.x, target.y, target.width, round(4 * s)), (255, 255, 255, 64))
+            surface.set_clip(None)
+
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
+
+    def render(self, screen, camera_x):
+        """Blit the chunks that intersect the view"""
+        s = render_scale(screen)
+        self.set_scale(s)
+        first = max(0, int(camera_x // self.chunk_width))
+        last = min(self.chunk_count - 1, int((camera_x + SCREEN_WIDTH) // self.chunk_width))
+        y = round(self.top * s)
+        for index in range(first, last + 1):
+            screen.blit(self.chunk(index), (round((index * self.chunk_width - camera_x) * s), y))
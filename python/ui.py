@@ -3,6 +3,8 @@ UI - User interface and HUD
 """
 import pygame
 from config import *
+from render_target import render_scale
+from display_list import draw, health_bar_surface, LAYER_HUD
 
 class UI:
     """Handles all UI rendering"""
@@ -11,109 +13,191 @@ class UI:
         self.width = width
         self.height = height
         
-        # Fonts
+        # Fonts (rebuilt when the render target scale changes)
         pygame.font.init()
-        self.title_font = pygame.font.Font(None, 72)
-        self.menu_font = pygame.font.Font(None, 48)
-        self.hud_font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        self.scale = None
+        self.set_scale(1.0)
+        
+        # HUD slot -> (key, rendered text); re-rendered only when the text changes
+        self.hud_text_cache = {}
+    
+    def set_scale(self, scale):
+        """Create fonts sized for the render target scale"""
+        if scale == self.scale:
+            return
+        self.scale = scale
+        self.title_font = pygame.font.Font(None, round(72 * scale))
+        self.menu_font = pygame.font.Font(None, round(48 * scale))
+        self.hud_font = pygame.font.Font(None, round(36 * scale))
+        self.small_font = pygame.font.Font(None, round(24 * scale))
+        self.hud_text_cache = {}
+    
+    def hud_text(self, slot, font, text, color):
+        """Render HUD text, reusing the last surface for this slot if unchanged"""
+        key = (text, color)
+        cached = self.hud_text_cache.get(slot)
+        if cached is None or cached[0] != key:
+            cached = (key, font.render(text, True, color))
+            self.hud_text_cache[slot] = cached
+        return cached[1]
     
     def render_menu(self, screen):
         """Render main menu"""
+        s = render_scale(screen)
+        self.set_scale(s)
+        
         # Title
         title = self.title_font.render("SKUNK FU", True, WHITE)
-        title_rect = title.get_rect(center=(self.width // 2, 150))
+        title_rect = title.get_rect(center=((self.width // 2) * s, 150 * s))
         screen.blit(title, title_rect)
         
         # Subtitle
         subtitle = self.menu_font.render("Ninja Skunk - Shadow Strike", True, YELLOW)
-        subtitle_rect = subtitle.get_rect(center=(self.width // 2, 230))
+        subtitle_rect = subtitle.get_rect(center=((self.width // 2) * s, 230 * s))
         screen.blit(subtitle, subtitle_rect)
         
         # Character info
         char_info = self.small_font.render("Fast & Agile Ninja Fighter", True, WHITE)
-        char_rect = char_info.get_rect(center=(self.width // 2, 270))
+        char_rect = char_info.get_rect(center=((self.width // 2) * s, 270 * s))
         screen.blit(char_info, char_rect)
         
         # Instructions
         instructions = [
-            "Press ENTER to Start",
+            "Press ENTER to Start, V for 2P Versus",
             "",
             "Controls:",
             "Arrow Keys / A-D: Move",
             "SPACE: Jump",
             "X: Attack",
             "Z: Special Ability",
+            "BACKSPACE: Rewind   F11: Record Replay",
+            "F5 / F9: Save / Load Checkpoint",
+            "F1-F4: Screen Effects   F6: Effect Costs",
             "ESC: Pause"
         ]
         
         y_offset = 320
         for line in instructions:
             text = self.small_font.render(line, True, WHITE)
-            text_rect = text.get_rect(center=(self.width // 2, y_offset))
+            text_rect = text.get_rect(center=((self.width // 2) * s, y_offset * s))
             screen.blit(text, text_rect)
             y_offset += 35
     
-    def render_hud(self, screen, health, lives, score, player=None):
+    def render_hud(self, screen, health, lives, score, player=None, display_list=None):
         """Render HUD during gameplay"""
+        s = render_scale(screen)
+        self.set_scale(s)
+        
         # Health bar scaled to player's real max health
-        health_text = self.hud_font.render("Health:", True, WHITE)
-        screen.blit(health_text, (20, 20))
+        health_text = self.hud_text('health', self.hud_font, "Health:", WHITE)
+        draw(screen, display_list, health_text, (20 * s, 20 * s), LAYER_HUD)
 
         max_health = player.max_health if player and hasattr(player, "max_health") else 100
         clamped_health = max(0, min(health, max_health))
         health_ratio = clamped_health / max_health if max_health else 0
 
-        pygame.draw.rect(screen, RED, (140, 25, 200, 30))
-        pygame.draw.rect(screen, GREEN, (140, 25, int(200 * health_ratio), 30))
-        pygame.draw.rect(screen, WHITE, (140, 25, 200, 30), 2)
+        health_bar = health_bar_surface(200 * s, 30 * s, int(200 * health_ratio) * s,
+                                        border=max(1, round(2 * s)))
+        draw(screen, display_list, health_bar, (140 * s, 25 * s), LAYER_HUD)
         
         # Lives
-        lives_text = self.hud_font.render(f"Lives: {lives}", True, WHITE)
-        screen.blit(lives_text, (20, 70))
+        lives_text = self.hud_text('lives', self.hud_font, f"Lives: {lives}", WHITE)
+        draw(screen, display_list, lives_text, (20 * s, 70 * s), LAYER_HUD)
         
         # Score
-        score_text = self.hud_font.render(f"Score: {score}", True, YELLOW)
-        score_rect = score_text.get_rect(topright=(self.width - 20, 20))
-        screen.blit(score_text, score_rect)
+        score_text = self.hud_text('score', self.hud_font, f"Score: {score}", YELLOW)
+        score_rect = score_text.get_rect(topright=((self.width - 20) * s, 20 * s))
+        draw(screen, display_list, score_text, score_rect, LAYER_HUD)
         
         # Combo counter
         if player and player.combo_count > 1:
             combo_color = YELLOW if player.combo_count == 2 else RED
-            combo_text = self.menu_font.render(f"{player.combo_count}x COMBO!", True, combo_color)
-            combo_rect = combo_text.get_rect(center=(self.width // 2, 60))
-            screen.blit(combo_text, combo_rect)
+            combo_text = self.hud_text('combo', self.menu_font, f"{player.combo_count}x COMBO!", combo_color)
+            combo_rect = combo_text.get_rect(center=((self.width // 2) * s, 60 * s))
+            draw(screen, display_list, combo_text, combo_rect, LAYER_HUD)
+    
+    def render_versus_hud(self, screen, match, camera_x, display_list=None):
+        """Render both players' health bars, round wins and name tags"""
+        s = render_scale(screen)
+        self.set_scale(s)
+        
+        for index, player in enumerate(match.players):
+            ratio = max(0, min(player.health, player.max_health)) / player.max_health
+            bar_x = 20 if index == 0 else self.width - 320
+            health_bar = health_bar_surface(300 * s, 24 * s, int(300 * ratio) * s,
+                                            border=max(1, round(2 * s)))
+            draw(screen, display_list, health_bar, (bar_x * s, 20 * s), LAYER_HUD)
+            
+            wins_text = self.hud_text(f'wins{index}', self.small_font,
+                                      f"P{index + 1}  Wins: {match.wins[index]}", WHITE)
+            draw(screen, display_list, wins_text, (bar_x * s, 50 * s), LAYER_HUD)
+            
+            tag_color = YELLOW if index == 0 else RED
+            tag = self.hud_text(f'tag{index}', self.small_font, f"P{index + 1}", tag_color)
+            tag_rect = tag.get_rect(midbottom=((player.x - camera_x + player.width // 2) * s,
+                                               (player.y - 10) * s))
+            draw(screen, display_list, tag, tag_rect, LAYER_HUD)
+        
+        if match.match_winner is not None:
+            message = f"PLAYER {match.match_winner + 1} WINS!  ENTER: Rematch  ESC: Menu"
+        elif match.round_winner == -1:
+            message = "DOUBLE KO"
+        elif match.round_winner is not None:
+            message = f"PLAYER {match.round_winner + 1} TAKES THE ROUND"
+        else:
+            message = None
+        if message:
+            banner = self.hud_text('banner', self.menu_font, message, YELLOW)
+            banner_rect = banner.get_rect(center=((self.width // 2) * s, (self.height // 2) * s))
+            draw(screen, display_list, banner, banner_rect, LAYER_HUD)
+    
+    def render_postfx_costs(self, screen, lines):
+        """Render the post-processing cost readout in the bottom-left corner"""
+        s = render_scale(screen)
+        self.set_scale(s)
+        
+        y = self.height - 20 - 22 * len(lines)
+        for index, line in enumerate(lines):
+            text = self.hud_text(f'postfx{index}', self.small_font, line, WHITE)
+            screen.blit(text, (20 * s, y * s))
+            y += 22
     
     def render_pause(self, screen):
         """Render pause overlay"""
+        s = render_scale(screen)
+        self.set_scale(s)
+        
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height))
+        overlay = pygame.Surface(screen.get_size())
         overlay.set_alpha(128)
         overlay.fill(BLACK)
         screen.blit(overlay, (0, 0))
         
         # Pause text
         pause_text = self.title_font.render("PAUSED", True, WHITE)
-        pause_rect = pause_text.get_rect(center=(self.width // 2, self.height // 2))
+        pause_rect = pause_text.get_rect(center=((self.width // 2) * s, (self.height // 2) * s))
         screen.blit(pause_text, pause_rect)
         
         resume_text = self.menu_font.render("Press ESC to Resume", True, WHITE)
-        resume_rect = resume_text.get_rect(center=(self.width // 2, self.height // 2 + 80))
+        resume_rect = resume_text.get_rect(center=((self.width // 2) * s, (self.height // 2 + 80) * s))
         screen.blit(resume_text, resume_rect)
     
     def render_game_over(self, screen, score):
         """Render game over screen"""
+        s = render_scale(screen)
+        self.set_scale(s)
+        
         # Title
         game_over_text = self.title_font.render("GAME OVER", True, RED)
-        game_over_rect = game_over_text.get_rect(center=(self.width // 2, self.height // 2 - 50))
+        game_over_rect = game_over_text.get_rect(center=((self.width // 2) * s, (self.height // 2 - 50) * s))
         screen.blit(game_over_text, game_over_rect)
         
         # Final score
         score_text = self.menu_font.render(f"Final Score: {score}", True, YELLOW)
-        score_rect = score_text.get_rect(center=(self.width // 2, self.height // 2 + 50))
+        score_rect = score_text.get_rect(center=((self.width // 2) * s, (self.height // 2 + 50) * s))
         screen.blit(score_text, score_rect)
         
         # Restart prompt
         restart_text = self.small_font.render("Press ENTER to Restart", True, WHITE)
-        restart_rect = restart_text.get_rect(center=(self.width // 2, self.height // 2 + 120))
+        restart_rect = restart_text.get_rect(center=((self.width // 2) * s, (self.height // 2 + 120) * s))
         screen.blit(restart_text, restart_rect)
@@ -0,0 +1,185 @@
+"""
+Versus - Local two-player mode built on a deterministic, rollback-capable tick
+"""
+import pygame
+from config import *
+from player import Player
+from level import Level
+from netplay import RollbackSession, LoopbackTransport, UdpTransport
+from snapshot import capture_player, restore_player
+from controls import VERSUS_KEYS, read_buttons
+
+# Fixed simulation step; every peer must use the same one
+TICK = 1.0 / FPS
+
+
+class VersusMatch:
+    """Two players fighting on one level, advanced only by step(inputs)
+
+    Everything step() touches is plain state captured by save_state(), so
+    the match can be rolled back and re-simulated; it reads no clock,
+    keyboard or random numbers.
+    """
+
+    def __init__(self, level, audio_manager=None):
+        self.level = level
+        self.audio_manager = audio_manager
+        self.players = [Player(x, y, audio_manager=audio_manager) for x, y in VERSUS_SPAWNS]
+        self.wins = [0, 0]
+        self.prev_buttons = [0, 0]
+        self.round_over_timer = 0
+        self.round_winner = None
+        self.match_winner = None
+        self.tick = 0
+        self.start_round()
+
+    def start_round(self):
+        """Put both players back at their spawns with full health"""
+        for index, (player, (x, y)) in enumerate(zip(self.players, VERSUS_SPAWNS)):
+            player.reset()
+            player.x, player.y = x, y
+            player.rect.topleft = (x, y)
+            player.facing_right = index == 0
+            player.is_shadow_striking = False
+            player.attack_timer = 0
+            player.attack_cooldown_timer = 0
+            player.combo_count = 0
+            player.combo_timer = 0
+            player.hit_stun_timer = 0
+            player.invulnerable_timer = 0
+            player.hit_enemies.clear()
+        self.round_winner = None
+
+    def step(self, inputs):
+        """Advance one tick with each player's held INPUT_* buttons"""
+        self.tick += 1
+        if self.match_winner is not None:
+            return
+        if self.round_over_timer > 0:
+            self.round_over_timer -= TICK
+            if self.round_over_timer <= 0:
+                self.start_round()
+            return
+
+        # Actions trigger on the tick their button goes down
+        for index, player in enumerate(self.players):
+            buttons = inputs[index]
+            player.handle_buttons(buttons & ~self.prev_buttons[index])
+            self.prev_buttons[index] = buttons
+
+        p1, p2 = self.players
+        p1._current_enemies = [p2]  # Lets upward strikes target the opponent
+        p2._current_enemies = [p1]
+        p1.update(TICK, self.level, inputs[0])
+        p2.update(TICK, self.level, inputs[1])
+
+        self.check_hits(p1, p2)
+        self.check_hits(p2, p1)
+        self.check_knockout()
+
+    def check_hits(self, attacker, defender):
+        """Attack hitbox vs opponent, once per attack"""
+        if not attacker.is_attacking or defender in attacker.hit_enemies:
+            return
+        if attacker.attack_hitbox.colliderect(defender.rect):
+            attacker.hit_enemies.add(defender)
+            defender.take_damage(attacker.current_attack_damage)
+
+    def check_knockout(self):
+        knocked_out = [player.health <= 0 for player in self.players]
+        if not any(knocked_out):
+            return
+        if all(knocked_out):
+            self.round_winner = -1  # Double KO, nobody scores
+        else:
+            self.round_winner = knocked_out.index(False)
+            self.wins[self.round_winner] += 1
+            if self.wins[self.round_winner] >= VERSUS_ROUNDS_TO_WIN:
+                self.match_winner = self.round_winner
+        self.round_over_timer = 1.5
+
+    def save_state(self):
+        """Plain-value state of the match (cheap enough to take every tick)"""
+        p1, p2 = self.players
+        return (
+            self.tick, tuple(self.wins), tuple(self.prev_buttons),
+            self.round_over_timer, self.round_winner, self.match_winner,
+            capture_player(p1), capture_player(p2),
+            p2 in p1.hit_enemies, p1 in p2.hit_enemies,
+        )
+
+    def load_state(self, state):
+        (self.tick, wins, prev_buttons, self.round_over_timer, self.round_winner,
+         self.match_winner, p1_state, p2_state, p1_hit, p2_hit) = state
+        self.wins = list(wins)
+        self.prev_buttons = list(prev_buttons)
+        p1, p2 = self.players
+        restore_player(p1, p1_state)
+        restore_player(p2, p2_state)
+        p1.hit_enemies.clear()
+        p2.hit_enemies.clear()
+        if p1_hit:
+            p1.hit_enemies.add(p2)
+        if p2_hit:
+            p2.hit_enemies.add(p1)
+
+    def set_audio(self, enabled):
+        """Mute the players while ticks are re-simulated"""
+        for player in self.players:
+            player.audio_manager = self.audio_manager if enabled else None
+
+
+class VersusMode:
+    """Local versus: both players' peers run in this process over a transport
+
+    Player 1's session is the one shown on screen; player 2's session plays
+    the remote peer, so every tick goes through the same input delay,
+    prediction and rollback path a networked match would.
+    """
+
+    def __init__(self, width, height, audio_manager=None, transport=VERSUS_TRANSPORT):
+        self.width = width
+        self.level = Level(width, height, background=VERSUS_BACKGROUND)
+        self.transports = None
+        if transport == "udp":
+            try:
+                self.transports = UdpTransport.pair()
+            except OSError as e:
+                print(f"UDP transport unavailable ({e}), using loopback")
+        if self.transports is None:
+            self.transports = LoopbackTransport.pair()
+        # Only the displayed match plays sounds
+        matches = [VersusMatch(self.level, audio_manager), VersusMatch(self.level)]
+        self.sessions = [RollbackSession(match, index, transport)
+                         for index, (match, transport) in enumerate(zip(matches, self.transports))]
+        self.match = matches[0]
+        self.accumulator = 0
+        self.camera_x = 0
+
+    def update(self, dt):
+        """Run as many fixed ticks as real time calls for (at most 4 per frame)"""
+        self.accumulator = min(self.accumulator + dt, TICK * 4)
+        while self.accumulator >= TICK:
+            self.accumulator -= TICK
+            keys = pygame.key.get_pressed()
+            for session, keymap in zip(self.sessions, VERSUS_KEYS):
+                session.advance(read_buttons(keys, keymap))
+        self.update_camera()
+
+    def update_camera(self):
+        """Center the camera between the two players"""
+        p1, p2 = self.match.players
+        target_x = (p1.x + p2.x + p1.width) / 2 - self.width // 2
+        self.camera_x = max(0, min(target_x, self.level.width - self.width))
+
+    def render(self, screen, ui, display_list):
+        self.level.render(screen, self.camera_x)
+        for player in self.match.players:
+            player.render(screen, self.camera_x, display_list)
+        ui.render_versus_hud(screen, self.match, self.camera_x, display_list)
+        display_list.flush(screen)
+
+    def close(self):
+        for transport in self.transports:
+            transport.close()
+        self.level.unload()
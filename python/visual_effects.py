@@ -3,6 +3,33 @@ Visual effects for combat - damage numbers, hit sparks, etc.
 """
 import pygame
 from config import *
+from render_target import render_scale
+from display_list import draw, LAYER_EFFECTS, LAYER_TEXT
+
+# Font size -> Font, shared by all damage numbers
+_fonts = {}
+
+
+def get_font(size):
+    """Return a cached default font of the given size"""
+    font = _fonts.get(size)
+    if font is None:
+        font = _fonts[size] = pygame.font.Font(None, size)
+    return font
+
+
+# Radius in pixels -> pre-drawn particle surface
+_particle_surfaces = {}
+
+
+def particle_surface(radius):
+    """Return a cached spark particle (filled circle) of the given radius"""
+    surface = _particle_surfaces.get(radius)
+    if surface is None:
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (255, 200, 100), (radius, radius), radius)  # Orange/yellow
+        _particle_surfaces[radius] = surface
+    return surface
 
 class DamageNumber:
     """Floating damage number that appears on hit"""
@@ -16,6 +43,10 @@ class DamageNumber:
         self.timer = 0
         self.velocity_y = -100  # Float upward
         
+        # Rendered text and outline, built on first render for a given scale
+        self.text_surfaces = None
+        self.text_scale = None
+        
     def update(self, dt):
         """Update position and lifetime"""
         self.timer += dt
@@ -26,14 +57,33 @@ class DamageNumber:
         """Check if should still be displayed"""
         return self.timer < self.lifetime
         
-    def render(self, screen, camera_x, font):
-        """Render the damage number"""
+    def render(self, screen, camera_x, font, outline=True, display_list=None):
+        """Render the damage number (outline can be skipped on low quality)"""
         if not self.is_alive():
             return
             
         # Fade out over time
         alpha = int(255 * (1 - self.timer / self.lifetime))
         
+        s = render_scale(screen)
+        if self.text_surfaces is None or self.text_scale != s:
+            self.text_surfaces = self.render_text(s)
+            self.text_scale = s
+        text, outline_text = self.text_surfaces
+        
+        screen_x = int(self.x - camera_x) * s
+        screen_y = int(self.y) * s
+        
+        # Draw outline first, then main text
+        if outline:
+            outline_text.set_alpha(alpha)
+            draw(screen, display_list, outline_text, outline_text.get_rect(center=(screen_x, screen_y)), LAYER_TEXT)
+        
+        text.set_alpha(alpha)
+        draw(screen, display_list, text, text.get_rect(center=(screen_x, screen_y)), LAYER_TEXT)
+    
+    def render_text(self, s):
+        """Render the text and its black outline once (only alpha changes per frame)"""
         # Color based on damage value/type
         if self.is_critical:
             color = (255, 100, 100)  # Bright red for crits
@@ -51,31 +101,17 @@ class DamageNumber:
             color = (255, 255, 255)  # White for normal hits
             size = 18
         
-        # Render bold text with outline for pop
-        pop_font = pygame.font.Font(None, size + 8)
-        outline_font = pygame.font.Font(None, size + 12)
+        # Bold text with outline for pop
         text_str = str(self.damage)
-        # Black outline
-        outline = outline_font.render(text_str, True, (0, 0, 0))
-        outline.set_alpha(alpha)
-        # Main colored text
-        text = pop_font.render(text_str, True, color)
-        text.set_alpha(alpha)
-
-        screen_x = int(self.x - camera_x)
-        screen_y = int(self.y)
-
-        text_rect = text.get_rect(center=(screen_x, screen_y))
-        outline_rect = outline.get_rect(center=(screen_x, screen_y))
-        # Draw outline first, then main text
-        screen.blit(outline, outline_rect)
-        screen.blit(text, text_rect)
+        text = get_font(round((size + 8) * s)).render(text_str, True, color)
+        outline = get_font(round((size + 12) * s)).render(text_str, True, (0, 0, 0))
+        return text, outline
 
 
 class HitSpark:
     """Small particle effect on hit"""
     
-    def __init__(self, x, y):
+    def __init__(self, x, y, particle_count=8):
         self.x = x
         self.y = y
         self.lifetime = 0.2
@@ -84,7 +120,7 @@ class HitSpark:
         
         # Create particles
         import random
-        for _ in range(8):
+        for _ in range(particle_count):
             angle = random.uniform(0, 2 * 3.14159)
             speed = random.uniform(100, 200)
             self.particles.append({
@@ -108,17 +144,18 @@ class HitSpark:
         """Check if should still be displayed"""
         return self.timer < self.lifetime
     
-    def render(self, screen, camera_x):
+    def render(self, screen, camera_x, display_list=None):
         """Render particles"""
         if not self.is_alive():
             return
             
-        alpha = int(255 * (1 - self.timer / self.lifetime))
+        s = render_scale(screen)
         
         for p in self.particles:
-            screen_x = int(p['x'] - camera_x)
-            screen_y = int(p['y'])
+            screen_x = int(p['x'] - camera_x) * s
+            screen_y = int(p['y']) * s
             
             # Draw particle as small circle
-            color = (255, 200, 100, alpha)  # Orange/yellow
-            pygame.draw.circle(screen, color[:3], (screen_x, screen_y), p['size'])
+            radius = max(1, round(p['size'] * s))
+            draw(screen, display_list, particle_surface(radius),
+                 (screen_x - radius, screen_y - radius), LAYER_EFFECTS)
@@ -6,6 +6,10 @@ const ROOT = path.resolve(__dirname, '..');
 const DIST = path.join(ROOT, 'dist');
 const JS_DIR = path.join(ROOT, 'js');
 
+// Build outputs under assets/ that only the Python version loads; left out
+// of dist (keep in sync with WEB_EXCLUDED in toolshed/audit_assets.py)
+const PYTHON_ONLY_ASSETS = ['audio/sfx_mixer', 'sprites/scaled'];
+
 // Order of scripts as they appear in index.html (keeps globals initialization order)
 const filesInOrder = [
   'config.js',
@@ -64,9 +68,11 @@ async function build({ minify = true, sourcemap = false } = {}) {
       }
     }
     // Copy assets/ and js/ folders to dist (shallow copy)
-    const cp = (srcDir, destDir) => {
+    const cp = (srcDir, destDir, skip = []) => {
       if (!fs.existsSync(srcDir)) return;
+      const skipped = new Set(skip.map(p => path.join(srcDir, p)));
       const copyRecursive = (s, d) => {
+        if (skipped.has(s)) return;
         const stat = fs.statSync(s);
         if (stat.isDirectory()) {
           if (!fs.existsSync(d)) fs.mkdirSync(d, { recursive: true });
@@ -79,7 +85,7 @@ async function build({ minify = true, sourcemap = false } = {}) {
       };
       copyRecursive(srcDir, destDir);
     };
-    cp(path.join(ROOT, 'assets'), path.join(DIST, 'assets'));
+    cp(path.join(ROOT, 'assets'), path.join(DIST, 'assets'), PYTHON_ONLY_ASSETS);
     cp(path.join(ROOT, 'js'), path.join(DIST, 'js'));
     console.log('Copied static files into dist');
   } catch (e) { console.warn('Static copy to dist failed', e); }
@@ -1,41 +1,29 @@
 import math
-import wave
-import struct
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'toolshed'))
+from synth import note, write_wav
 
 out_path = 'assets/audio/sfx/shadow_strike.wav'
 rate = 44100
 length = 0.45
-samples = int(rate * length)
-
-# Metal-ish: bright noisy transient + descending tone + ring mod
-start_freq = 720.0
-end_freq = 220.0
-
-frames = []
-for i in range(samples):
-    t = i / rate
-    freq = start_freq * ((end_freq / start_freq) ** (t / length))
-    phase = 2 * math.pi * freq * t
-    base = math.sin(phase) + 0.4 * math.sin(phase * 2.0)
-    ring = math.sin(phase * 0.5) * math.sin(phase * 1.7)
-    # short metallic noise burst
-    noise = (math.sin(phase * 3.1 + 1.1) + math.sin(phase * 5.3 + 0.4)) * 0.08
-
-    # envelope: sharp attack, fast decay
-    attack = min(1.0, t / 0.015)
-    decay = max(0.0, 1.0 - (t / length))
-    env = attack * (decay ** 1.6)
-
-    sample = (base * 0.7 + ring * 0.35 + noise) * env
-    val = int(max(-1.0, min(1.0, sample)) * 32767)
-    frames.append(val)
 
-os.makedirs(os.path.dirname(out_path), exist_ok=True)
-with wave.open(out_path, 'wb') as wf:
-    wf.setnchannels(1)
-    wf.setsampwidth(2)
-    wf.setframerate(rate)
-    wf.writeframes(b''.join(struct.pack('<h', s) for s in frames))
+# Metal-ish: descending tone + ring mod + bright metallic partials.
+# The ring mod sin(0.5p) * sin(1.7p) is written as its two sidebands,
+# 0.5 * (cos(1.2p) - cos(2.2p)).
+half_pi = math.pi / 2
+patch = {
+    'partials': [
+        (1.0, 0.7), (2.0, 0.4 * 0.7),
+        (1.2, 0.35 * 0.5, half_pi), (2.2, -0.35 * 0.5, half_pi),
+        (3.1, 0.08, 1.1), (5.3, 0.08, 0.4),
+    ],
+    'sweep': 220.0 / 720.0,
+    'sweep_curve': 'exp',
+    # Sharp attack, fast decay
+    'envelope': ('power', 0.015, 1.6),
+}
 
+samples = write_wav(out_path, [note(0, patch, 720.0, length)], rate)
 print('Wrote', out_path, 'samples', samples)
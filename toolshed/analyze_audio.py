@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""Level report for every audio file under assets/audio.
+
+Sample data is never read into memory whole: each WAV's data chunk (and
+each raw .pcm clip built by build_audio.py) is memory-mapped with np.memmap
+and streamed in blocks, so a long music stem is analysed in constant
+memory. All sums are accumulated in float64.
+
+Per file the report gives peak, RMS, crest factor, the loudest short-term
+(3 s sliding window) RMS level and the number of clipped samples, all in
+dBFS. Levels are unweighted: this is for spotting hot, quiet or clipped
+assets, not a broadcast loudness meter. Files are analysed in parallel.
+
+Usage:
+    python toolshed/analyze_audio.py [--root assets/audio] [--out audio_report.json]
+"""
+import argparse
+import json
+import math
+import struct
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+BLOCK_SECONDS = 0.1  # Loudness is tracked per 100 ms block
+SHORT_TERM_BLOCKS = 30  # 3 s short-term window
+CHUNK_BLOCKS = 50  # Blocks streamed from the memmap at a time (5 s)
+
+WAVE_FORMAT_PCM = 1
+WAVE_FORMAT_FLOAT = 3
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+def wav_layout(path: Path):
+    """Sample format and data chunk position of a WAV, from its RIFF header"""
+    with open(path, "rb") as f:
+        riff, _, kind = struct.unpack("<4sI4s", f.read(12))
+        if riff != b"RIFF" or kind != b"WAVE":
+            raise ValueError("not a RIFF/WAVE file")
+        fmt = None
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                raise ValueError("no data chunk")
+            chunk_id, size = struct.unpack("<4sI", header)
+            if chunk_id == b"fmt ":
+                body = f.read(size)
+                tag, channels, rate, _, _, bits = struct.unpack("<HHIIHH", body[:16])
+                if tag == WAVE_FORMAT_EXTENSIBLE and len(body) >= 26:
+                    tag = struct.unpack("<H", body[24:26])[0]  # First bytes of the sub-format GUID
+                fmt = {"tag": tag, "channels": channels, "rate": rate, "bits": bits}
+                f.seek(size % 2, 1)
+            elif chunk_id == b"data":
+                if fmt is None:
+                    raise ValueError("data chunk before fmt chunk")
+                offset = f.tell()
+                f.seek(0, 2)
+                size = min(size, f.tell() - offset)  # Truncated files
+                return dict(fmt, offset=offset, size=size)
+            else:
+                f.seek(size + size % 2, 1)
+
+
+def pcm_layout(path: Path):
+    """Layout of a raw clip from build_audio.py, described by its manifest"""
+    with open(path.parent / "manifest.json") as f:
+        fmt = json.load(f)["format"]
+    return {"tag": WAVE_FORMAT_PCM, "channels": fmt["channels"], "rate": fmt["frequency"],
+            "bits": abs(fmt["size"]), "offset": 0, "size": path.stat().st_size}
+
+
+def sample_dtype(layout):
+    width = layout["bits"] // 8
+    if layout["tag"] == WAVE_FORMAT_FLOAT:
+        return {4: "<f4", 8: "<f8"}[width]
+    if layout["tag"] == WAVE_FORMAT_PCM:
+        return {1: "u1", 2: "<i2", 3: "u1", 4: "<i4"}[width]
+    raise ValueError(f"unsupported format tag {layout['tag']:#x}")
+
+
+def iter_chunks(path: Path, layout, chunk_frames):
+    """Memmapped windows of the sample data shaped (frames, channels[, 3 bytes
+    for 24-bit]). Each window is mapped on its own and released before the
+    next, so resident memory stays at one window however long the file is."""
+    channels = layout["channels"]
+    width = layout["bits"] // 8
+    frames = layout["size"] // (width * channels)
+    dtype = sample_dtype(layout)
+    for start in range(0, frames, chunk_frames):
+        count = min(chunk_frames, frames - start)
+        shape = (count, channels, 3) if width == 3 else (count, channels)
+        yield np.memmap(path, dtype=dtype, mode="r", offset=layout["offset"] + start * width * channels,
+                        shape=shape)
+
+
+def to_float(block, layout):
+    """Samples in [-1, 1] as float64, plus the magnitude counted as clipped"""
+    bits = layout["bits"]
+    if layout["tag"] == WAVE_FORMAT_FLOAT:
+        return block.astype(np.float64), 1.0
+    if bits == 8:
+        data = block.astype(np.float64) - 128
+    elif bits == 24:
+        b = block.astype(np.int32)
+        data = ((b[..., 0] | (b[..., 1] << 8) | (b[..., 2] << 16)) << 8 >> 8).astype(np.float64)
+    else:
+        data = block.astype(np.float64)
+    scale = float(1 << (bits - 1))
+    return data / scale, (scale - 1) / scale  # The top code is full scale
+
+
+def to_db(value):
+    return round(20 * math.log10(value), 2) if value > 0 else None
+
+
+def analyse(path: Path):
+    """Level statistics of one file, streamed block by block"""
+    layout = pcm_layout(path) if path.suffix == ".pcm" else wav_layout(path)
+    rate, channels = layout["rate"], layout["channels"]
+    block = max(1, int(rate * BLOCK_SECONDS))
+    chunk = block * CHUNK_BLOCKS
+
+    total_sq = np.zeros(channels)
+    total_sum = np.zeros(channels)
+    peak = 0.0
+    clipped = 0
+    window = deque()  # Mean squares of the last SHORT_TERM_BLOCKS blocks
+    window_sum = 0.0
+    short_term = 0.0
+    frames = 0
+    for samples in iter_chunks(path, layout, chunk):
+        frames += len(samples)
+        data, full_scale = to_float(samples, layout)
+        del samples
+        square = np.square(data)
+        total_sq += square.sum(axis=0)
+        total_sum += data.sum(axis=0)
+        magnitude = np.abs(data)
+        peak = max(peak, float(magnitude.max()))
+        clipped += int(np.count_nonzero(magnitude >= full_scale))
+
+        # Per-block mean square over all channels (a partial last block counts too)
+        per_frame = square.mean(axis=1)
+        edges = np.arange(0, len(per_frame), block)
+        energies = np.add.reduceat(per_frame, edges) / np.diff(np.append(edges, len(per_frame)))
+        for energy in energies:
+            window.append(energy)
+            window_sum += energy
+            if len(window) > SHORT_TERM_BLOCKS:
+                window_sum -= window.popleft()
+            if len(window) == SHORT_TERM_BLOCKS:
+                short_term = max(short_term, window_sum / SHORT_TERM_BLOCKS)
+
+    mean_sq = float(total_sq.sum() / max(1, frames * channels))
+    if len(window) < SHORT_TERM_BLOCKS:
+        short_term = mean_sq  # Shorter than the window: the whole clip is one window
+    rms = math.sqrt(mean_sq)
+    return {
+        "format": "float" if layout["tag"] == WAVE_FORMAT_FLOAT else "pcm",
+        "bits": layout["bits"],
+        "sample_rate": rate,
+        "channels": channels,
+        "frames": frames,
+        "duration": round(frames / rate, 3) if rate else 0,
+        "size": path.stat().st_size,
+        "peak_db": to_db(peak),
+        "rms_db": to_db(rms),
+        "crest_db": round(20 * math.log10(peak / rms), 2) if rms > 0 else None,
+        "short_term_max_db": to_db(math.sqrt(short_term)),
+        "clipped_samples": clipped,
+        "dc_offset": [round(float(s) / frames, 6) for s in total_sum] if frames else [],
+    }
+
+
+def _analyse_job(path):
+    try:
+        return analyse(path)
+    except (OSError, ValueError, KeyError, struct.error) as e:
+        return {"error": str(e)}
+
+
+def main():
+    p = argparse.ArgumentParser(description="Peak/RMS/loudness/clipping report for every audio file.")
+    p.add_argument("--root", default="assets/audio", help="Folder searched recursively for .wav and .pcm files")
+    p.add_argument("--out", default="audio_report.json", help="JSON report path ('-' for stdout)")
+    p.add_argument("--workers", type=int, default=None, help="Processes to use (default: one per CPU)")
+    p.add_argument("--clip-warning", type=float, default=-1.0, help="Flag files peaking above this dBFS")
+    args = p.parse_args()
+
+    root = Path(args.root)
+    files = sorted(f for f in root.rglob("*") if f.suffix.lower() in (".wav", ".pcm"))
+    if not files:
+        print(f"No audio files found in {root}")
+        return 0
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        results = dict(zip((f.relative_to(root).as_posix() for f in files), pool.map(_analyse_job, files)))
+
+    failed = [name for name, r in results.items() if "error" in r]
+    clipping = [name for name, r in results.items() if r.get("clipped_samples")]
+    hot = [name for name, r in results.items()
+           if r.get("peak_db") is not None and r["peak_db"] > args.clip_warning]
+    report = {
+        "root": root.as_posix(),
+        "files": results,
+        "summary": {
+            "files": len(files),
+            "failed": failed,
+            "clipping": clipping,
+            "hot": hot,
+            "total_duration": round(sum(r.get("duration", 0) for r in results.values()), 3),
+        },
+    }
+    if args.out == "-":
+        print(json.dumps(report, indent=2))
+        return 0
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+
+    for name, r in results.items():
+        if "error" in r:
+            print(f"✗ {name}: {r['error']}")
+        else:
+            flag = "  CLIPPING" if r["clipped_samples"] else ""
+            print(f"✓ {name}: peak {r['peak_db']} dB, RMS {r['rms_db']} dB, "
+                  f"short-term max {r['short_term_max_db']} dB{flag}")
+    print(f"Analysed {len(files)} files ({len(clipping)} clipping, {len(failed)} failed) -> {args.out}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
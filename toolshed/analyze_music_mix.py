@@ -3,8 +3,10 @@ Analyze and optimize the music mix for a metal guitar focused feel
 Creates a cleaner version without the original background elements
 """
 import wave
-import numpy as np
 import os
+from pathlib import Path
+
+from analyze_audio import analyse
 
 def analyze_audio_file(filepath):
     """Analyze an audio file for properties"""
@@ -23,13 +25,12 @@ def analyze_audio_file(filepath):
             print(f"   Duration: {duration:.2f} seconds")
             print(f"   Bit depth: {sample_width * 8} bit")
             
-            # Read audio data
-            frames = wav_file.readframes(n_frames)
-            audio_data = np.frombuffer(frames, dtype=np.int16)
-            
-            # Calculate RMS (loudness)
-            rms = np.sqrt(np.mean(audio_data ** 2))
+            # Calculate RMS (loudness), streamed from a memmap and summed
+            # in float64 (squaring int16 samples overflows)
+            levels = analyse(Path(filepath))
+            rms = 10 ** (levels['rms_db'] / 20) * 32767 if levels['rms_db'] is not None else 0.0
             print(f"   RMS Level: {rms:.0f} (0-32767 scale)")
+            print(f"   Peak: {levels['peak_db']} dBFS, clipped samples: {levels['clipped_samples']}")
             
             return {
                 'channels': n_channels,
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""Find duplicate, leftover and unused files in assets/ and check the deploy size.
+
+The web build copies the assets/ tree into dist/ (all but the Python-only
+build outputs in WEB_EXCLUDED), so every byte in it is downloaded by
+mobile players. This audit:
+
+* content-hashes every file (SHA-256) to find exact duplicates;
+* finds near-duplicate images with a 64-bit difference hash (dHash) of
+  the alpha-composited, contrast-stretched luminance, compared by Hamming
+  distance between images of similar aspect ratio;
+* finds near-duplicate sounds with a small fingerprint (a 64-step RMS
+  envelope plus a 32-band magnitude spectrum of a ~4 kHz decimated mono
+  mix), compared by cosine similarity between files of the same type;
+* cross-references which files the Python (python/) and web (js/,
+  index.html, CSS) loaders mention, including templated paths such as
+  f"enemies/{prefix}_idle.png" and `backgrounds/${base}_bg` (a bare name
+  like "jump" only counts for a loader that mentions the file's folder);
+* flags leftovers (*.opt.png, *.bak, *_original.*, backup folders).
+
+The report lists the bytes that could be removed (unreferenced files,
+leftovers and unreferenced extra copies of exact duplicates), duplicates
+that code still loads and should be repointed at the kept copy, and the
+bytes only the Python build needs, against a deploy budget. Hashing and
+fingerprinting run in parallel.
+
+Usage:
+    python toolshed/audit_assets.py [--root assets] [--budget-mb 10] [--out asset_report.json]
+Exits 1 if the deploy size is over budget.
+"""
+import argparse
+import hashlib
+import json
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageOps
+
+from analyze_audio import iter_chunks, pcm_layout, to_float, wav_layout
+
+IMAGE_TYPES = {".png", ".jpg", ".jpeg", ".gif", ".webp"}
+AUDIO_TYPES = {".wav", ".pcm"}
+ASSET_TYPES = IMAGE_TYPES | AUDIO_TYPES | {".svg", ".ogg", ".mp3", ".json"}
+
+# Where each loader's code lives (relative to the repo root)
+LOADERS = {
+    "python": ["python/**/*.py"],
+    "web": ["js/**/*.js", "index.js", "index.html", "*.css"],
+}
+# Folders scripts/build.js leaves out of the web build (its PYTHON_ONLY_ASSETS):
+# Python-only build outputs, not counted in the deploy size
+WEB_EXCLUDED = ("audio/sfx_mixer", "sprites/scaled")
+LEFTOVER = re.compile(r"(\.opt\.png$|\.bak$|~$|_original\.[^.]+$|(^|/)backups?/)")
+LITERAL = re.compile(r"""(['"`])((?:\\.|(?!\1).)*?)\1""")
+PLACEHOLDER = re.compile(r"\$?\{[^}]*\}")
+VARIANT = re.compile(r"@\w+(?=(\.[^./]+)?$)")
+
+AUDIO_RATE = 4000  # Approximate rate audio is decimated to before fingerprinting
+ENVELOPE_STEPS = 64
+SPECTRUM_BANDS = 32
+
+
+def sha256(path: Path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def image_hash(path: Path):
+    """(64-bit dHash of the image composited onto black, as an int; aspect ratio)
+
+    The luminance is contrast-stretched first, so dark images (night skies,
+    tiles) still produce a meaningful hash rather than all zeros."""
+    with Image.open(path) as img:
+        rgba = img.convert("RGBA")
+    flat = Image.new("RGBA", rgba.size, (0, 0, 0, 255))
+    flat.alpha_composite(rgba)
+    luma = ImageOps.autocontrast(flat.convert("L"))
+    small = np.asarray(luma.resize((9, 8), Image.BILINEAR), dtype=np.int16)
+    bits = (small[:, 1:] > small[:, :-1]).ravel()
+    return int(np.packbits(bits).view(">u8")[0]), rgba.width / rgba.height
+
+
+def audio_fingerprint(path: Path):
+    """(unit fingerprint vector, duration) from a streamed, decimated mono mix"""
+    layout = pcm_layout(path) if path.suffix == ".pcm" else wav_layout(path)
+    factor = max(1, layout["rate"] // AUDIO_RATE)
+    parts = []
+    for samples in iter_chunks(path, layout, factor * 16384):
+        data, _ = to_float(samples, layout)
+        mono = data.mean(axis=1)
+        usable = len(mono) // factor * factor
+        if usable:
+            parts.append(mono[:usable].reshape(-1, factor).mean(axis=1))
+    signal = np.concatenate(parts) if parts else np.zeros(0)
+    duration = len(signal) * factor / layout["rate"] if layout["rate"] else 0
+    if len(signal) < ENVELOPE_STEPS:
+        return None, duration
+
+    envelope = np.array([np.sqrt(np.mean(np.square(s))) for s in np.array_split(signal, ENVELOPE_STEPS)])
+    spectrum = np.abs(np.fft.rfft(signal))
+    bands = np.log1p(np.array([b.mean() for b in np.array_split(spectrum, SPECTRUM_BANDS)]))
+    vectors = []
+    for v in (envelope, bands):
+        norm = np.linalg.norm(v)
+        vectors.append(v / norm if norm else v)
+    return np.concatenate(vectors) / np.sqrt(2), duration
+
+
+def describe(job):
+    """Hash and fingerprint one file"""
+    path, rel = job
+    entry = {"path": rel, "bytes": path.stat().st_size, "sha256": sha256(path)}
+    try:
+        if path.suffix.lower() in IMAGE_TYPES:
+            entry["dhash"], entry["aspect"] = image_hash(path)
+            entry["aspect"] = round(entry["aspect"], 4)
+        elif path.suffix.lower() in AUDIO_TYPES:
+            fingerprint, duration = audio_fingerprint(path)
+            entry["duration"] = round(duration, 3)
+            if fingerprint is not None:
+                entry["fingerprint"] = fingerprint.tolist()
+    except Exception as e:  # Unreadable media still gets its content hash
+        entry["error"] = str(e)
+    return entry
+
+
+def code_literals(repo: Path, patterns):
+    """(exact strings, compiled templated-path regexes, folders) quoted in the
+    loader's code; folders are the directories of the paths it mentions"""
+    exact, templates, folders = set(), set(), set()
+    for pattern in patterns:
+        for source in repo.glob(pattern):
+            if "node_modules" in source.parts:
+                continue
+            text = source.read_text(encoding="utf-8", errors="ignore")
+            for _, literal in LITERAL.findall(text):
+                literal = literal.strip().lstrip("./")
+                if not literal or len(literal) > 200:
+                    continue
+                if PLACEHOLDER.search(literal):
+                    fixed = PLACEHOLDER.sub("", literal)
+                    if len(re.sub(r"\.\w+$", "", fixed)) >= 3:  # Too vague to mean anything otherwise
+                        pieces = PLACEHOLDER.split(literal)
+                        templates.add("[^/]*".join(re.escape(p) for p in pieces))
+                        folders.add(pieces[0].rpartition("/")[0])
+                else:
+                    exact.add(literal)
+                    folders.add(literal.rstrip("/") if literal.endswith("/") else literal.rpartition("/")[0])
+    folders.discard("")
+    return exact, [re.compile(t) for t in templates], folders
+
+
+def candidates(rel):
+    """Ways code can name the file at `rel` (repo-relative): each path suffix,
+    with and without its extension, down to the bare stem. Size variants
+    (name@720.png, name@2x.png) are named by their base name, which the
+    loaders resolve to a variant. Returns (names with a folder or extension,
+    bare stems)."""
+    parts = rel.split("/")
+    names = set()
+    for i in range(len(parts)):
+        suffix = "/".join(parts[i:])
+        names.add(suffix)
+        names.add(re.sub(r"\.[^./]+$", "", suffix))
+        base = VARIANT.sub("", suffix)
+        names.update((base, re.sub(r"\.[^./]+$", "", base)))
+    stems = {name for name in names if "/" not in name and "." not in name}
+    return names - stems, stems
+
+
+def referenced(rel, literals):
+    """Whether a loader names the file. A bare stem ("jump") only counts if
+    the loader also mentions the file's folder, since the same stem is
+    often used for files in other folders (sfx/jump.wav, sfx_mixer/jump.pcm)."""
+    exact, templates, folders = literals
+    qualified, stems = candidates(rel)
+    parent = "/" + rel.rpartition("/")[0]
+    if any(parent.endswith("/" + folder) for folder in folders):
+        qualified |= stems
+    if qualified & exact:
+        return True
+    return any(t.fullmatch(name) for t in templates for name in qualified)
+
+
+def excluded_from_web(rel, root):
+    """Whether the file at `rel` (repo-relative) is left out of the web build"""
+    return any(rel.startswith(f"{root.strip('/')}/{folder}/") for folder in WEB_EXCLUDED)
+
+
+def near_images(entries, threshold):
+    # Flat images hash to all zeros or ones and would match each other
+    images = [e for e in entries if "dhash" in e and e["dhash"] not in (0, (1 << 64) - 1)]
+    if len(images) < 2:
+        return []
+    hashes = np.array([e["dhash"] for e in images], dtype=np.uint64)
+    xor = hashes[:, None] ^ hashes[None, :]
+    distance = np.unpackbits(xor.view(np.uint8), axis=-1).reshape(len(images), len(images), 64).sum(axis=2)
+    aspect = np.array([e["aspect"] for e in images])
+    similar_shape = np.minimum.outer(aspect, aspect) / np.maximum.outer(aspect, aspect) >= 0.9
+    pairs = []
+    for i, j in zip(*np.nonzero(np.triu((distance <= threshold) & similar_shape, k=1))):
+        if images[i]["sha256"] != images[j]["sha256"]:
+            pairs.append({"files": [images[i]["path"], images[j]["path"]], "distance": int(distance[i, j])})
+    return pairs
+
+
+def near_sounds(entries, threshold):
+    pairs = []
+    by_type = {}
+    for e in entries:
+        if "fingerprint" in e:
+            by_type.setdefault(Path(e["path"]).suffix, []).append(e)
+    for group in by_type.values():
+        if len(group) < 2:
+            continue
+        vectors = np.array([e["fingerprint"] for e in group])
+        durations = np.array([e["duration"] for e in group])
+        similarity = vectors @ vectors.T
+        ratio = np.minimum.outer(durations, durations) / np.maximum(np.maximum.outer(durations, durations), 1e-9)
+        close = np.triu((similarity >= threshold) & (ratio >= 0.9), k=1)
+        for i, j in zip(*np.nonzero(close)):
+            if group[i]["sha256"] != group[j]["sha256"]:
+                pairs.append({"files": [group[i]["path"], group[j]["path"]],
+                              "similarity": round(float(similarity[i, j]), 4)})
+    return pairs
+
+
+def main():
+    p = argparse.ArgumentParser(description="Audit assets for duplicates, leftovers, unused files and deploy size.")
+    p.add_argument("--root", default="assets", help="Asset folder (relative to the repo root)")
+    p.add_argument("--budget-mb", type=float, default=10.0, help="Deploy size budget for the asset folder, in MB")
+    p.add_argument("--image-distance", type=int, default=4, help="Max dHash bit difference for near-duplicate images")
+    p.add_argument("--audio-similarity", type=float, default=0.98, help="Min fingerprint similarity for near-duplicate sounds")
+    p.add_argument("--out", default="asset_report.json", help="JSON report path ('-' for stdout)")
+    p.add_argument("--workers", type=int, default=None, help="Processes to use (default: one per CPU)")
+    args = p.parse_args()
+
+    repo = Path(__file__).resolve().parents[1]
+    root = (repo / args.root).resolve()
+    files = sorted(f for f in root.rglob("*") if f.is_file())
+    jobs = [(f, f.relative_to(repo).as_posix()) for f in files]
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        entries = list(pool.map(describe, jobs, chunksize=4))
+
+    literals = {name: code_literals(repo, patterns) for name, patterns in LOADERS.items()}
+    for e in entries:
+        e["referenced_by"] = [name for name, lits in literals.items() if referenced(e["path"], lits)]
+        e["leftover"] = bool(LEFTOVER.search(e["path"]))
+
+    groups = {}
+    for e in entries:
+        groups.setdefault(e["sha256"], []).append(e)
+    exact = [[e["path"] for e in group] for group in groups.values() if len(group) > 1]
+
+    # Bytes that could go: leftovers, unused assets, and unreferenced extra
+    # copies of exact duplicates. Extra copies code still loads only go once
+    # that code points at the kept copy, so they are listed separately.
+    removable, repoint = {}, {}
+    for e in entries:
+        is_asset = Path(e["path"]).suffix.lower() in ASSET_TYPES
+        if e["leftover"]:
+            removable[e["path"]] = ("leftover", e["bytes"])
+        elif is_asset and not e["referenced_by"]:
+            removable[e["path"]] = ("unreferenced", e["bytes"])
+    for group in groups.values():
+        if len(group) > 1:
+            keep = max(group, key=lambda e: (len(e["referenced_by"]), not e["leftover"]))
+            for e in group:
+                if e is keep or e["path"] in removable:
+                    continue
+                if e["referenced_by"]:
+                    repoint[e["path"]] = {"path": e["path"], "same_as": keep["path"], "bytes": e["bytes"],
+                                          "referenced_by": e["referenced_by"]}
+                else:
+                    removable[e["path"]] = ("duplicate", e["bytes"])
+    python_only = [e for e in entries if e["referenced_by"] == ["python"] and e["path"] not in removable
+                   and not excluded_from_web(e["path"], args.root)]
+
+    near = {"images": near_images(entries, args.image_distance),
+            "sounds": near_sounds(entries, args.audio_similarity)}
+    for e in entries:
+        e.pop("fingerprint", None)  # Only needed for the comparison
+
+    shipped = [e for e in entries if not excluded_from_web(e["path"], args.root)]
+    total = sum(e["bytes"] for e in shipped)
+    removable_bytes = sum(size for _, size in removable.values())
+    budget = int(args.budget_mb * 1024 * 1024)
+    by_reason = {}
+    for reason, size in removable.values():
+        by_reason[reason] = by_reason.get(reason, 0) + size
+    summary = {
+        "files": len(entries),
+        "deploy_bytes": total,
+        # Kept out of the web build by scripts/build.js
+        "python_build_bytes": sum(e["bytes"] for e in entries) - total,
+        "budget_bytes": budget,
+        "over_budget": total > budget,
+        "removable_bytes": removable_bytes,
+        "removable_by_reason": by_reason,
+        "after_removal_bytes": total - removable_bytes,
+        # Duplicates still loaded by code: dedupe by repointing it at the kept copy
+        "repoint_bytes": sum(item["bytes"] for item in repoint.values()),
+        # Shipped to the web build but only loaded by the Python version
+        "python_only_bytes": sum(e["bytes"] for e in python_only),
+    }
+    report = {
+        "root": args.root,
+        "summary": summary,
+        "removable": [{"path": path, "reason": reason, "bytes": size}
+                      for path, (reason, size) in sorted(removable.items())],
+        "repoint": [repoint[path] for path in sorted(repoint)],
+        "python_only": [e["path"] for e in python_only],
+        "exact_duplicates": exact,
+        "near_duplicates": near,
+        "files": entries,
+    }
+    if args.out == "-":
+        print(json.dumps(report, indent=2))
+    else:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        for item in report["removable"]:
+            print(f"  {item['reason']:<12} {item['bytes'] / 1024:8.1f} KB  {item['path']}")
+        for item in report["repoint"]:
+            print(f"  {'repoint':<12} {item['bytes'] / 1024:8.1f} KB  {item['path']} "
+                  f"(dedupe by repointing code to {item['same_as']})")
+        for pair in near["images"]:
+            print(f"  near-duplicate images (distance {pair['distance']}): {' <-> '.join(pair['files'])}")
+        for pair in near["sounds"]:
+            print(f"  near-duplicate sounds (similarity {pair['similarity']}): {' <-> '.join(pair['files'])}")
+        mb = 1024 * 1024
+        print(f"Deploy size {total / mb:.2f} MB of {budget / mb:.2f} MB budget"
+              f"{' (OVER BUDGET)' if total > budget else ''}; "
+              f"{removable_bytes / mb:.2f} MB removable, {summary['python_only_bytes'] / mb:.2f} MB Python-only "
+              f"-> {args.out}")
+    return 1 if total > budget else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
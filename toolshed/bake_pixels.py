@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Bake the game's sprite frames into the pixel cache before the first launch.
+
+Builds the player and every enemy type the way the game does, so each
+sheet SpriteLoader cuts and scales is baked into the pixel cache in .cache/
+(see python/pixel_cache.py), and the first real launch already starts
+from the mapped file. The game bakes the same frames itself on its first
+run; this only moves that work to build time. Entries are tied to the
+display's pixel format: if the machine running the game converts to a
+different one, the cache is ignored and re-baked there automatically.
+
+Usage:
+    python toolshed/bake_pixels.py [--clear] [--headless]
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "python"))
+
+BAKED_ENEMY_TYPES = ("BASIC", "FAST_BASIC", "FLYING", "BOSS")
+
+
+def main():
+    p = argparse.ArgumentParser(description="Pre-bake display-format sprite frames for fast startup.")
+    p.add_argument("--clear", action="store_true", help="Delete the existing cache first")
+    p.add_argument("--headless", action="store_true",
+                   help="Use SDL's dummy video driver (its pixel format may not match the real display's)")
+    args = p.parse_args()
+    if args.headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+    import pygame
+    from config import SCREEN_HEIGHT, SCREEN_WIDTH
+    from enemy import Enemy
+    from pixel_cache import generations
+    from player import Player
+    from sprite_loader import sprite_loader
+
+    if args.clear:
+        for path in generations():
+            os.remove(path)
+    pygame.init()
+    # Frames are baked in the display's format, so there has to be one
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    start = time.perf_counter()
+    Player(0, 0)
+    for enemy_type in BAKED_ENEMY_TYPES:
+        Enemy(0, 0, enemy_type=enemy_type)
+    sprite_loader.pixel_cache.save()
+    pygame.quit()
+
+    saved = generations()
+    if not saved:
+        print("✗ Could not write the pixel cache")
+        return 1
+    print(f"✓ Baked sprite frames in {time.perf_counter() - start:.2f}s -> {saved[0]} "
+          f"({os.path.getsize(saved[0]) / 1024:.0f} KB)")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""Convert sound effects to the game's mixer format ahead of time.
+
+Every WAV in assets/audio/sfx the Python game loads (SOUND_EFFECTS in
+python/config.py, plus the LOOPS) is resampled to the mixer rate, converted to
+the mixer's channel count, loudness-normalised and trimmed of leading and
+trailing silence, then written as raw 16-bit PCM next to a manifest.json.
+The Python AudioManager loads these buffers with pygame.mixer.Sound(buffer=...)
+so SDL has nothing to convert at startup. Loops (e.g. metal_pad) are not
+trimmed, so they still loop seamlessly.
+
+Usage:
+    python toolshed/build_audio.py [--src assets/audio/sfx] [--out assets/audio/sfx_mixer]
+"""
+import argparse
+import json
+import math
+import sys
+import wave
+import zlib
+from fractions import Fraction
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "python"))
+from config import MIXER_CHANNELS, MIXER_FREQUENCY, SOUND_EFFECTS  # noqa: E402
+
+MANIFEST_VERSION = 1
+LOOPS = {"metal_pad"}  # Played with loops=-1; keep their exact length
+# Clips the runtime loads; the web-only sounds stay as WAVs
+USED = {Path(filename).stem for filename in SOUND_EFFECTS.values()} | LOOPS
+
+
+def read_wav(path: Path):
+    """Return (float32 samples shaped (frames, channels) in [-1, 1], sample rate)"""
+    with wave.open(str(path), "rb") as w:
+        channels = w.getnchannels()
+        width = w.getsampwidth()
+        rate = w.getframerate()
+        raw = w.readframes(w.getnframes())
+    if width == 1:
+        data = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128) / 128
+    elif width == 2:
+        data = np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768
+    elif width == 3:
+        b = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        data = ((b[:, 0] | (b[:, 1] << 8) | (b[:, 2] << 16)) << 8 >> 8).astype(np.float32) / 8388608
+    elif width == 4:
+        data = np.frombuffer(raw, dtype="<i4").astype(np.float32) / 2147483648
+    else:
+        raise ValueError(f"Unsupported sample width {width}")
+    return data.reshape(-1, channels), rate
+
+
+def lowpass_filter(cutoff, taps_per_phase, phases):
+    """Kaiser-windowed sinc for a polyphase resampler (cutoff as a fraction of
+    the upsampled Nyquist), with unity gain per phase"""
+    n = taps_per_phase * phases - 1  # Odd, so the centre falls on a sample
+    t = np.arange(n) - (n - 1) / 2
+    h = cutoff * np.sinc(cutoff * t / phases) * np.kaiser(n, 8.0)
+    h = h / h.sum() * phases
+    return np.append(h, 0).astype(np.float32)  # Pad to taps_per_phase * phases
+
+
+def resample(data, src_rate, dst_rate, taps_per_phase=32):
+    """Polyphase windowed-sinc resampling of (frames, channels) float data
+
+    Only the output samples are computed: each one is a dot product of
+    taps_per_phase input samples with one phase of the filter, done as
+    taps_per_phase whole-array operations.
+    """
+    if src_rate == dst_rate:
+        return data
+    ratio = Fraction(dst_rate, src_rate).limit_denominator(1000)
+    up, down = ratio.numerator, ratio.denominator
+    h = lowpass_filter(min(1.0, up / down), taps_per_phase, up)
+    half = (len(h) - 2) // 2
+
+    out_len = int(math.ceil(len(data) * up / down))
+    # Position of each output sample on the upsampled grid, centred on the filter
+    pos = np.arange(out_len, dtype=np.int64) * down + half
+    base = pos // up
+    phase = pos % up
+    padded = np.concatenate([np.zeros((taps_per_phase, data.shape[1]), np.float32), data,
+                             np.zeros((taps_per_phase, data.shape[1]), np.float32)])
+    out = np.zeros((out_len, data.shape[1]), dtype=np.float32)
+    for j in range(taps_per_phase):
+        index = np.clip(base - j + taps_per_phase, 0, len(padded) - 1)
+        out += padded[index] * h[phase + j * up][:, None]
+    return out
+
+
+def convert_channels(data, channels):
+    if data.shape[1] == channels:
+        return data
+    mono = data.mean(axis=1, keepdims=True)
+    return np.repeat(mono, channels, axis=1)
+
+
+def trim_silence(data, rate, threshold_db, pad_ms=5.0):
+    """Drop leading/trailing frames quieter than threshold_db (dBFS), keeping a
+    few ms of padding and fading out the new end to avoid a click"""
+    level = np.abs(data).max(axis=1)
+    loud = np.flatnonzero(level > 10 ** (threshold_db / 20))
+    if len(loud) == 0:
+        return data[:0]
+    pad = int(rate * pad_ms / 1000)
+    start = max(0, loud[0] - pad)
+    end = min(len(data), loud[-1] + 1 + pad)
+    data = data[start:end].copy()
+    fade = min(pad, len(data))
+    if fade and end < len(level):
+        data[-fade:] *= np.linspace(1, 0, fade, dtype=np.float32)[:, None]
+    return data
+
+
+def normalise(data, target_rms_db, peak_db):
+    """Gain towards target_rms_db (dBFS) without the peak going over peak_db"""
+    if len(data) == 0:
+        return data, 1.0
+    rms = float(np.sqrt(np.mean(np.square(data, dtype=np.float64))))
+    peak = float(np.abs(data).max())
+    if rms == 0 or peak == 0:
+        return data, 1.0
+    gain = min(10 ** (target_rms_db / 20) / rms, 10 ** (peak_db / 20) / peak)
+    return data * gain, gain
+
+
+def to_db(value):
+    return round(20 * math.log10(value), 2) if value > 0 else None
+
+
+def build_clip(path: Path, out_dir: Path, rate, channels, target_rms_db, peak_db, silence_db):
+    data, src_rate = read_wav(path)
+    src_channels = data.shape[1]
+    src_frames = len(data)
+    data = resample(data, src_rate, rate)
+    data = convert_channels(data, channels)
+    loop = path.stem in LOOPS
+    if not loop:
+        data = trim_silence(data, rate, silence_db)
+    data, gain = normalise(data, target_rms_db, peak_db)
+
+    pcm = np.clip(np.round(data * 32767), -32768, 32767).astype("<i2")
+    out_file = out_dir / (path.stem + ".pcm")
+    out_file.write_bytes(pcm.tobytes())
+    return {
+        "file": out_file.name,
+        "frames": len(pcm),
+        "duration": round(len(pcm) / rate, 3),
+        "loop": loop,
+        "gain_db": to_db(gain),
+        "peak_db": to_db(float(np.abs(data).max()) if len(data) else 0),
+        "source": path.name,
+        "source_rate": src_rate,
+        "source_channels": src_channels,
+        "source_duration": round(src_frames / src_rate, 3),
+        # AudioManager and --check fall back to / rebuild from the WAV if its checksum no longer matches
+        "source_size": path.stat().st_size,
+        "source_crc32": zlib.crc32(path.read_bytes()),
+    }
+
+
+def check(files, out_dir: Path):
+    """Report sources that are new, changed or missing their built clip"""
+    try:
+        with open(out_dir / "manifest.json") as f:
+            clips = json.load(f)["clips"]
+    except (OSError, ValueError, KeyError):
+        clips = {}
+    stale = []
+    for f in files:
+        clip = clips.get(f.stem)
+        if (clip is None or clip["source_crc32"] != zlib.crc32(f.read_bytes())
+                or not (out_dir / clip["file"]).exists()):
+            stale.append(f.name)
+    for name in stale:
+        print(f"Needs rebuild: {name}")
+    print(f"{len(stale)} of {len(files)} clips need rebuilding")
+    return 1 if stale else 0
+
+
+def main():
+    p = argparse.ArgumentParser(description="Convert SFX to the game's mixer format with a manifest.")
+    p.add_argument("--src", default="assets/audio/sfx", help="Folder of source WAVs")
+    p.add_argument("--out", default="assets/audio/sfx_mixer", help="Output folder for .pcm files and manifest.json")
+    p.add_argument("--rate", type=int, default=MIXER_FREQUENCY, help="Mixer frequency (default: config MIXER_FREQUENCY)")
+    p.add_argument("--channels", type=int, default=MIXER_CHANNELS, help="Mixer channels (default: config MIXER_CHANNELS)")
+    p.add_argument("--target-rms", type=float, default=-18.0, help="Loudness target in dBFS RMS")
+    p.add_argument("--peak", type=float, default=-1.0, help="Peak ceiling in dBFS")
+    p.add_argument("--silence", type=float, default=-60.0, help="Trim threshold in dBFS")
+    p.add_argument("--check", action="store_true", help="Only report clips that need rebuilding (exit 1 if any)")
+    args = p.parse_args()
+
+    src = Path(args.src)
+    out_dir = Path(args.out)
+    files = sorted(f for f in src.glob("*.wav") if f.stem in USED)
+    if not files:
+        print(f"No WAV files found in {src}")
+        return 0
+    if args.check:
+        return check(files, out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    clips = {}
+    for f in files:
+        try:
+            clips[f.stem] = build_clip(f, out_dir, args.rate, args.channels,
+                                       args.target_rms, args.peak, args.silence)
+            clip = clips[f.stem]
+            print(f"Built {f.name}: {clip['source_rate']} Hz x{clip['source_channels']} "
+                  f"{clip['source_duration']}s -> {clip['duration']}s, gain {clip['gain_db']} dB")
+        except Exception as e:
+            print(f"Failed to build {f}: {e}")
+
+    # Drop outputs of sources that no longer exist
+    for stale in out_dir.glob("*.pcm"):
+        if stale.stem not in clips:
+            stale.unlink()
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "format": {"frequency": args.rate, "size": -16, "channels": args.channels},
+        "target_rms_db": args.target_rms,
+        "peak_db": args.peak,
+        "clips": clips,
+    }
+    with open(out_dir / "manifest.json", "w") as f:
+        json.dump(manifest, f, indent=2)
+    total = sum(c["frames"] for c in clips.values()) * args.channels * 2
+    print(f"Wrote {len(clips)} clips ({total / 1024:.0f} KB) and {out_dir / 'manifest.json'}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -1,111 +1,416 @@
 #!/usr/bin/env python3
-"""Generate placeholder background and tile images used by the game.
+"""Generate the placeholder level backgrounds and tiles used by the game.
 
-Creates 1920x1080 backgrounds for `forest`, `city`, `mountains`, `cave` and
-32x32 tiles for `ground_tile`, `platform_tile`, `wall_tile`.
+Backgrounds are described in SCENES as lists of shapes in 1920x1080 design
+coordinates and rendered with NumPy: each shape is evaluated as an array
+(gradient rows, value noise, anti-aliased triangles and rectangles from
+edge coverage, radial glows, star discs) over its bounding box and
+composited into a premultiplied float buffer, which is quantised once.
+
+Each scene has a far layer (opaque sky and distant detail) and a near layer
+(transparent silhouettes). Every background is written as:
+
+* `<name>.png`: both layers flattened, plus `<name>_far.png` and
+  `<name>_near.png` for parallax scrolling when the Python game draws the
+  scene in layers (LEVEL_BACKGROUND / VERSUS_BACKGROUND in python/config.py);
+* the same at each size in RESOLUTIONS, rendered natively rather than
+  scaled, with an `@<height>` suffix (e.g. `neon_bg_near@720.png`).
+
+`manifest.json` lists the files per image and height so the game can load
+the smallest one that covers its screen. Scenes are rendered in parallel
+and are deterministic (seeded), so every size shows the same picture.
+
+Also creates the 32x32 `ground_tile`, `platform_tile` and `wall_tile`.
+
+Usage:
+    python toolshed/generate_backgrounds.py [--only forest_bg ...] [--workers N]
 """
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from PIL import Image, ImageDraw
 
+import numpy as np
+from PIL import Image
+
+from optimize_sprites import lossless_candidates
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "python"))
+from config import LEVEL_BACKGROUND, VERSUS_BACKGROUND  # noqa: E402
 
 OUT_DIR = Path("assets/sprites/backgrounds")
 
+DESIGN = (1920, 1080)
+# Suffix: output size. "" is the design size, written under the plain name
+RESOLUTIONS = {"": (1920, 1080), "@720": (1280, 720), "@480": (854, 480)}
+LAYERS = ("far", "near")
+# Scenes the game draws as separate layers; the rest only get the flattened image
+LAYERED = {image.rsplit("_", 1)[0] for image, _ in LEVEL_BACKGROUND + VERSUS_BACKGROUND}
 
-def gradient(size, top_color, bottom_color):
-    w, h = size
-    base = Image.new("RGB", size, top_color)
-    draw = ImageDraw.Draw(base)
-    for y in range(h):
-        ratio = y / (h - 1)
-        r = int(top_color[0] + (bottom_color[0] - top_color[0]) * ratio)
-        g = int(top_color[1] + (bottom_color[1] - top_color[1]) * ratio)
-        b = int(top_color[2] + (bottom_color[2] - top_color[2]) * ratio)
-        draw.line([(0, y), (w, y)], fill=(r, g, b))
-    return base
 
+class Canvas:
+    """Premultiplied RGBA float buffer with design-to-pixel scaling"""
+
+    def __init__(self, size):
+        self.width, self.height = size
+        self.scale = self.height / DESIGN[1]
+        self.pixels = np.zeros((self.height, self.width, 4), np.float32)
+
+    def bounds(self, x0, y0, x1, y1):
+        """Pixel slice covering a design-space box, clipped to the canvas (None if empty)"""
+        s = self.scale
+        left, top = max(0, int(np.floor(x0 * s))), max(0, int(np.floor(y0 * s)))
+        right, bottom = min(self.width, int(np.ceil(x1 * s)) + 1), min(self.height, int(np.ceil(y1 * s)) + 1)
+        if left >= right or top >= bottom:
+            return None
+        return slice(top, bottom), slice(left, right)
+
+    def centres(self, rows, cols):
+        """Design-space coordinates of the pixel centres in a slice, as (x row, y column)"""
+        xs = (np.arange(cols.start, cols.stop, dtype=np.float32) + 0.5) / self.scale
+        ys = (np.arange(rows.start, rows.stop, dtype=np.float32) + 0.5) / self.scale
+        return xs[None, :], ys[:, None]
+
+    def paint(self, rows, cols, colour, alpha):
+        """Composite `colour` with per-pixel coverage `alpha` over the region"""
+        region = self.pixels[rows, cols]
+        alpha = np.asarray(alpha, np.float32)[..., None]
+        colour = np.asarray(colour, np.float32) / 255
+        region[..., :3] = colour * alpha + region[..., :3] * (1 - alpha)
+        region[..., 3:] = alpha + region[..., 3:] * (1 - alpha)
+
+    def image(self):
+        """Straight-alpha RGBA uint8 array"""
+        alpha = self.pixels[..., 3:]
+        rgb = np.divide(self.pixels[..., :3], alpha, out=np.zeros_like(self.pixels[..., :3]), where=alpha > 0)
+        return np.round(np.concatenate([rgb, alpha], axis=2) * 255).astype(np.uint8)
+
+
+# Shapes: each draws itself onto a Canvas. Coordinates are design pixels.
+
+def gradient(canvas, stops):
+    """Opaque vertical gradient through (position 0..1, colour) stops"""
+    _, ys = canvas.centres(slice(0, canvas.height), slice(0, 1))
+    t = ys[:, 0] / DESIGN[1]
+    positions = [p for p, _ in stops]
+    rows = np.stack([np.interp(t, positions, [c[i] for _, c in stops]) for i in range(3)], axis=1)
+    # Quantise the rows the way the line-by-line version did, then fill
+    rows = np.floor(rows)
+    canvas.pixels[..., :3] = rows[:, None, :] / 255
+    canvas.pixels[..., 3] = 1
+
+
+def noise(canvas, colour, strength, cell, seed, top=0.0, bottom=1.0, levels=4):
+    """Value noise (bilinear over a `cell`-sized random grid) tinting a band of the image.
+
+    The noise is posterised to `levels` steps: flat bands suit the pixel-art
+    look and keep the PNGs a fraction of the size of smooth noise."""
+    grid = np.random.default_rng(seed).random((int(DESIGN[1] / cell) + 2, int(DESIGN[0] / cell) + 2))
+    area = canvas.bounds(0, top * DESIGN[1], DESIGN[0], bottom * DESIGN[1])
+    if area is None:
+        return
+    rows, cols = area
+    xs, ys = canvas.centres(rows, cols)
+    gx, gy = xs[0] / cell, ys[:, 0] / cell
+    x0, y0 = gx.astype(int), gy.astype(int)
+    fx, fy = (gx - x0)[None, :], (gy - y0)[:, None]
+    top_row = grid[y0][:, x0] * (1 - fx) + grid[y0][:, x0 + 1] * fx
+    bottom_row = grid[y0 + 1][:, x0] * (1 - fx) + grid[y0 + 1][:, x0 + 1] * fx
+    value = top_row * (1 - fy) + bottom_row * fy
+    # Feather band edges that are inside the image
+    feather = 0.1 * DESIGN[1]
+    edge = np.full_like(ys, feather)
+    if top > 0:
+        edge = np.minimum(edge, ys - top * DESIGN[1])
+    if bottom < 1:
+        edge = np.minimum(edge, bottom * DESIGN[1] - ys)
+    value = np.round(value * np.clip(edge / feather, 0, 1) * levels) / levels
+    canvas.paint(rows, cols, colour, value * strength)
+
+
+def polygon(canvas, points, colour):
+    """Anti-aliased convex polygon: coverage from the signed distance to each edge"""
+    pts = np.asarray(points, np.float32)
+    area = canvas.bounds(*pts.min(axis=0), *pts.max(axis=0))
+    if area is None:
+        return
+    rows, cols = area
+    xs, ys = canvas.centres(rows, cols)
+    d1, d2 = pts[1] - pts[0], pts[2] - pts[0]
+    if d1[0] * d2[1] - d1[1] * d2[0] < 0:
+        pts = pts[::-1]
+    inside = None
+    for a, b in zip(pts, np.roll(pts, -1, axis=0)):
+        edge = b - a
+        distance = (edge[0] * (ys - a[1]) - edge[1] * (xs - a[0])) / np.hypot(*edge)
+        inside = distance if inside is None else np.minimum(inside, distance)
+    canvas.paint(rows, cols, colour, np.clip(inside * canvas.scale + 0.5, 0, 1))
+
+
+def rect(canvas, x0, y0, x1, y1, colour, alpha=1.0):
+    """Anti-aliased rectangle: exact pixel overlap on each axis"""
+    area = canvas.bounds(x0, y0, x1, y1)
+    if area is None:
+        return
+    rows, cols = area
+    s = canvas.scale
+    px = np.arange(cols.start, cols.stop, dtype=np.float32)
+    py = np.arange(rows.start, rows.stop, dtype=np.float32)
+    cover_x = np.clip(np.minimum(x1 * s, px + 1) - np.maximum(x0 * s, px), 0, 1)
+    cover_y = np.clip(np.minimum(y1 * s, py + 1) - np.maximum(y0 * s, py), 0, 1)
+    canvas.paint(rows, cols, colour, cover_y[:, None] * cover_x[None, :] * alpha)
+
+
+def glow(canvas, x, y, radius, colour, alpha, levels=5):
+    """Disc fading from `alpha` at the centre to nothing at `radius` in `levels` rings"""
+    area = canvas.bounds(x - radius, y - radius, x + radius, y + radius)
+    if area is None:
+        return
+    rows, cols = area
+    xs, ys = canvas.centres(rows, cols)
+    falloff = np.ceil(np.clip(1 - np.hypot(xs - x, ys - y) / radius, 0, 1) * levels) / levels
+    canvas.paint(rows, cols, colour, falloff * alpha)
+
+
+def stars(canvas, count, seed, colour=(255, 255, 255), bottom=0.6):
+    """Small anti-aliased discs of random size and brightness"""
+    rng = np.random.default_rng(seed)
+    xs = rng.uniform(0, DESIGN[0], count)
+    ys = rng.uniform(0, DESIGN[1] * bottom, count)
+    radii = rng.uniform(0.8, 2.2, count)
+    brightness = rng.uniform(0.3, 1.0, count)
+    for x, y, r, b in zip(xs, ys, radii, brightness):
+        area = canvas.bounds(x - r, y - r, x + r, y + r)
+        if area is None:
+            continue
+        rows, cols = area
+        px, py = canvas.centres(rows, cols)
+        # At least one pixel wide at every resolution
+        edge = max(r * canvas.scale, 0.5)
+        cover = np.clip(edge - np.hypot(px - x, py - y) * canvas.scale + 0.5, 0, 1)
+        canvas.paint(rows, cols, colour, cover * b)
 
-def save_background(name, img):
-    OUT_DIR.mkdir(parents=True, exist_ok=True)
-    path = OUT_DIR / f"{name}.png"
-    img.save(path, optimize=True)
-    print(f"Created {path}")
 
+# Randomised scenery from the old tmp/gen_backgrounds.py, drawn from a seeded generator
 
-def make_forest():
-    img = gradient((1920, 1080), (20, 40, 20), (120, 200, 120))
-    draw = ImageDraw.Draw(img)
+def crystals(rng, colour_a, colour_b, count):
+    shapes = []
+    for _ in range(count):
+        cx = rng.integers(0, DESIGN[0], endpoint=True)
+        cy = rng.integers(int(DESIGN[1] * 0.2), int(DESIGN[1] * 0.9), endpoint=True)
+        size = rng.integers(40, 140, endpoint=True)
+        points = [(cx, cy - size), (cx + size * 0.6, cy + size * 0.8), (cx - size * 0.6, cy + size * 0.8)]
+        shapes.append((polygon, points, colour_a if rng.random() < 0.5 else colour_b))
+    return shapes
+
+
+def glow_orbs(rng, colour, count):
+    shapes = []
+    for _ in range(count):
+        r = rng.integers(80, 180, endpoint=True)
+        x = rng.integers(-r, DESIGN[0] + r, endpoint=True)
+        y = rng.integers(-r, DESIGN[1] + r, endpoint=True)
+        shapes.append((glow, x, y, r, colour, rng.integers(20, 60, endpoint=True) / 255))
+    return shapes
+
+
+def neon_lines(rng, count=24):
+    colours = [((80, 255, 244), 90), ((255, 80, 160), 90), ((120, 220, 255), 80)]
+    shapes = []
+    for _ in range(count):
+        y = rng.integers(int(DESIGN[1] * 0.3), int(DESIGN[1] * 0.9), endpoint=True)
+        x1 = rng.integers(0, DESIGN[0] - 200, endpoint=True)
+        x2 = x1 + rng.integers(200, 600, endpoint=True)
+        width = rng.integers(2, 5, endpoint=True)
+        colour, alpha = colours[rng.integers(len(colours))]
+        shapes.append((rect, x1, y - width / 2, x2, y + width / 2, colour, alpha / 255))
+    return shapes
+
+
+def city_blocks(rng, count=60):
+    shapes = []
+    for _ in range(count):
+        w = rng.integers(60, 220, endpoint=True)
+        h = rng.integers(80, 380, endpoint=True)
+        x = rng.integers(0, DESIGN[0] - w, endpoint=True)
+        y = DESIGN[1] - h - rng.integers(0, 60, endpoint=True)
+        shade = int(rng.integers(10, 35, endpoint=True))
+        shapes.append((rect, x, y, x + w + 1, y + h + 1, (shade, shade, shade)))
+    return shapes
+
+
+def forest():
+    far = [(gradient, [(0, (20, 40, 20)), (1, (120, 200, 120))]),
+           (noise, (200, 230, 200), 0.12, 90, 1, 0.5, 1.0)]  # Low mist
     # Simple tree silhouettes
-    for i in range(30):
-        x = 100 + i * 60
-        draw.polygon([(x, 900), (x - 40, 980), (x + 40, 980)], fill=(20, 60, 30))
-    save_background("forest_bg", img)
+    near = [(polygon, [(x, 900), (x - 40, 980), (x + 40, 980)], (20, 60, 30))
+            for x in range(100, 100 + 30 * 60, 60)]
+    return far, near
 
 
-def make_city():
-    img = gradient((1920, 1080), (10, 10, 25), (40, 10, 60))
-    draw = ImageDraw.Draw(img)
+def city():
+    far = [(gradient, [(0, (10, 10, 25)), (1, (40, 10, 60))]),
+           (stars, 140, 2)]
     # Simple blocky buildings
-    for i in range(40):
-        x = i * 48
-        h = 200 + (i % 7) * 40
-        draw.rectangle([x, 1080 - h, x + 40, 1080], fill=(30, 30, 60))
-    save_background("city_bg", img)
+    near = [(rect, i * 48, DESIGN[1] - (200 + (i % 7) * 40), i * 48 + 41, DESIGN[1], (30, 30, 60))
+            for i in range(40)]
+    return far, near
 
 
-def make_mountains():
-    img = gradient((1920, 1080), (50, 70, 90), (180, 190, 220))
-    draw = ImageDraw.Draw(img)
-    # Add mountains as triangles
+def mountains():
+    far = [(gradient, [(0, (50, 70, 90)), (1, (180, 190, 220))]),
+           (noise, (255, 255, 255), 0.15, 160, 3, 0.0, 0.6)]  # Haze
+    near = []
     for i in range(6):
         x = i * 360 - 100
-        draw.polygon([(x, 900), (x + 180, 600 - (i % 3) * 40), (x + 360, 900)], fill=(30 + i * 10, 50 + i * 8, 70 + i * 6))
-    save_background("mountains_bg", img)
+        near.append((polygon, [(x, 900), (x + 180, 600 - (i % 3) * 40), (x + 360, 900)],
+                     (30 + i * 10, 50 + i * 8, 70 + i * 6)))
+    return far, near
 
 
-def make_cave():
-    img = gradient((1920, 1080), (10, 10, 10), (45, 30, 20))
-    draw = ImageDraw.Draw(img)
+def cave():
+    far = [(gradient, [(0, (10, 10, 10)), (1, (45, 30, 20))]),
+           (noise, (70, 55, 40), 0.3, 64, 4)]  # Rock texture
     # Cave stalactites
-    for i in range(25):
-        x = i * 80 + 20
-        draw.polygon([(x, 0), (x + 20, 140), (x - 20, 140)], fill=(40, 30, 20))
-    save_background("cave_bg", img)
+    near = [(polygon, [(x, 0), (x + 20, 140), (x - 20, 140)], (40, 30, 20)) for x in range(20, 20 + 25 * 80, 80)]
+    return far, near
+
+
+def cave_crystal():
+    rng = np.random.default_rng(5)
+    far = [(gradient, [(0, (18, 16, 40)), (0.5, (28, 22, 70)), (1, (10, 8, 24))])]
+    far += glow_orbs(rng, (120, 220, 255), 18)
+    near = crystals(rng, (80, 200, 255), (140, 120, 255), 28)
+    return far, near
+
+
+def cave_depths():
+    rng = np.random.default_rng(6)
+    far = [(gradient, [(0, (10, 8, 18)), (0.5, (16, 12, 30)), (1, (5, 4, 12))])]
+    far += glow_orbs(rng, (90, 160, 220), 10)
+    near = crystals(rng, (60, 120, 200), (100, 80, 180), 16)
+    return far, near
+
+
+def neon():
+    rng = np.random.default_rng(7)
+    far = [(gradient, [(0, (6, 8, 20)), (0.5, (12, 18, 40)), (1, (5, 6, 16))]),
+           (stars, 90, 8, (200, 220, 255), 0.4)]
+    far += glow_orbs(rng, (255, 80, 160), 8)
+    near = city_blocks(rng) + neon_lines(rng)
+    return far, near
+
+
+# Background name: function returning its (far, near) shape lists
+SCENES = {
+    "forest_bg": forest,
+    "city_bg": city,
+    "mountains_bg": mountains,
+    "cave_bg": cave,
+    "cave_crystal_bg": cave_crystal,
+    "cave_depths_bg": cave_depths,
+    "neon_bg": neon,
+}
+
+
+def render_layer(shapes, size):
+    canvas = Canvas(size)
+    for draw, *args in shapes:
+        draw(canvas, *args)
+    return canvas.image()
+
+
+def flatten(far, near):
+    """`near` composited over the opaque `far` layer"""
+    alpha = near[..., 3:].astype(np.float32) / 255
+    rgb = near[..., :3] * alpha + far[..., :3] * (1 - alpha)
+    return np.round(rgb).astype(np.uint8)
+
+
+def render_background(job):
+    """Write one background's flattened image and layers at one resolution"""
+    name, suffix = job
+    size = RESOLUTIONS[suffix]
+    far_shapes, near_shapes = SCENES[name]()
+    far = render_layer(far_shapes, size)
+    near = render_layer(near_shapes, size)
+    flat = far.copy()
+    flat[..., :3] = flatten(far, near)
+    files = {name: flat}
+    if name in LAYERED:
+        files.update({f"{name}_far": far, f"{name}_near": near})
+    written = {}
+    for image_name, pixels in files.items():
+        path = OUT_DIR / f"{image_name}{suffix}.png"
+        # Smallest lossless encoding (truecolour or exact palette), as optimize_sprites.py picks
+        path.write_bytes(min((make() for _, make in lossless_candidates(pixels)), key=len))
+        written[image_name] = path.name
+    return name, size[1], written
 
 
 def make_tiles():
     tiles_dir = OUT_DIR / "tiles"
     tiles_dir.mkdir(parents=True, exist_ok=True)
     # ground_tile - dark with cyan energy line
-    g = Image.new("RGBA", (32, 32), (30, 30, 35, 255))
-    d = ImageDraw.Draw(g)
-    d.rectangle([0, 26, 31, 31], fill=(0, 100, 120))
-    g.save(tiles_dir / "ground_tile.png", optimize=True)
-    print(f"Created {tiles_dir / 'ground_tile.png'}")
-
+    g = np.full((32, 32, 4), (30, 30, 35, 255), np.uint8)
+    g[26:] = (0, 100, 120, 255)
     # platform_tile - purple base
-    p = Image.new("RGBA", (32, 32), (60, 20, 80, 255))
-    dp = ImageDraw.Draw(p)
-    dp.rectangle([0, 0, 31, 28], fill=(180, 50, 230))
-    p.save(tiles_dir / "platform_tile.png", optimize=True)
-    print(f"Created {tiles_dir / 'platform_tile.png'}")
-
-    # wall_tile - brick-like
-    w = Image.new("RGBA", (32, 32), (50, 20, 20, 255))
-    dw = ImageDraw.Draw(w)
-    for y in range(0, 32, 8):
-        for x in range(0, 32, 8):
-            dw.rectangle([x, y, x + 7, y + 7], fill=(70, 30, 30))
-    w.save(tiles_dir / "wall_tile.png", optimize=True)
-    print(f"Created {tiles_dir / 'wall_tile.png'}")
+    p = np.full((32, 32, 4), (60, 20, 80, 255), np.uint8)
+    p[:29] = (180, 50, 230, 255)
+    # wall_tile - brick-like (the 8x8 bricks have always covered the whole tile)
+    w = np.full((32, 32, 4), (70, 30, 30, 255), np.uint8)
+    for name, pixels in (("ground_tile", g), ("platform_tile", p), ("wall_tile", w)):
+        path = tiles_dir / f"{name}.png"
+        Image.fromarray(pixels, "RGBA").save(path, optimize=True)
+        print(f"Created {path}")
+
+
+def write_manifest(results):
+    """Merge this run's files into manifest.json: image name -> {height: file}"""
+    path = OUT_DIR / "manifest.json"
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    images = manifest.setdefault("images", {})
+    layers = manifest.setdefault("layers", {})
+    for name, height, written in results:
+        for image_name, filename in written.items():
+            images.setdefault(image_name, {})[str(height)] = filename
+        if name in LAYERED:
+            layers[name] = [f"{name}_{layer}" for layer in LAYERS]
+        else:
+            layers.pop(name, None)
+            for layer in LAYERS:
+                images.pop(f"{name}_{layer}", None)
+    manifest["images"] = {name: dict(sorted(sizes.items(), key=lambda item: int(item[0])))
+                          for name, sizes in sorted(images.items())}
+    manifest["layers"] = dict(sorted(layers.items()))
+    with open(path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    print(f"Wrote {path}")
 
 
 def main():
-    make_forest()
-    make_city()
-    make_mountains()
-    make_cave()
-    make_tiles()
+    p = argparse.ArgumentParser(description="Render the placeholder backgrounds at every resolution, plus tiles.")
+    p.add_argument("--only", nargs="+", choices=sorted(SCENES), help="Backgrounds to render (default: all)")
+    p.add_argument("--workers", type=int, default=None, help="Processes to use (default: one per CPU)")
+    p.add_argument("--no-tiles", action="store_true", help="Skip the 32x32 tiles")
+    args = p.parse_args()
+
+    OUT_DIR.mkdir(parents=True, exist_ok=True)
+    jobs = [(name, suffix) for name in (args.only or SCENES) for suffix in RESOLUTIONS]
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        results = list(pool.map(render_background, jobs))
+    for name, height, written in results:
+        print(f"Created {name} at {height}p: {', '.join(written.values())}")
+    write_manifest(results)
+    if not args.no_tiles:
+        make_tiles()
+    return 0
 
 
 if __name__ == '__main__':
-    main()
+    raise SystemExit(main())
@@ -1,203 +1,102 @@
 """
 Generate Placeholder Sound Effects
-Creates simple procedural sounds for the game using pygame's mixer
+Creates simple procedural sounds for the game with the toolshed synth engine
 """
-import pygame
-import numpy as np
 import os
 
-# Initialize pygame mixer
-pygame.mixer.init(frequency=22050, size=-16, channels=1, buffer=512)
-
-def generate_tone(frequency, duration, sample_rate=22050, volume=0.3):
-    """Generate a simple sine wave tone"""
-    num_samples = int(duration * sample_rate)
-    t = np.linspace(0, duration, num_samples, False)
-    
-    # Create sine wave
-    wave = np.sin(frequency * 2 * np.pi * t)
-    
-    # Apply envelope (fade in/out to avoid clicks)
-    envelope = np.ones(num_samples)
-    fade_samples = int(0.01 * sample_rate)  # 10ms fade
-    envelope[:fade_samples] = np.linspace(0, 1, fade_samples)
-    envelope[-fade_samples:] = np.linspace(1, 0, fade_samples)
-    
-    wave = wave * envelope * volume
-    
-    # Convert to 16-bit integer
-    wave = (wave * 32767).astype(np.int16)
-    
-    return wave
-
-def generate_sweep(start_freq, end_freq, duration, sample_rate=22050, volume=0.3):
-    """Generate a frequency sweep"""
-    num_samples = int(duration * sample_rate)
-    t = np.linspace(0, duration, num_samples, False)
-    
-    # Linear frequency sweep
-    freq = np.linspace(start_freq, end_freq, num_samples)
-    phase = 2 * np.pi * np.cumsum(freq) / sample_rate
-    wave = np.sin(phase)
-    
-    # Apply envelope
-    envelope = np.ones(num_samples)
-    fade_samples = int(0.01 * sample_rate)
-    envelope[:fade_samples] = np.linspace(0, 1, fade_samples)
-    envelope[-fade_samples:] = np.linspace(1, 0, fade_samples)
-    
-    wave = wave * envelope * volume
-    wave = (wave * 32767).astype(np.int16)
-    
-    return wave
-
-def generate_noise(duration, sample_rate=22050, volume=0.2):
-    """Generate white noise"""
-    num_samples = int(duration * sample_rate)
-    wave = np.random.uniform(-1, 1, num_samples)
-    
-    # Apply envelope
-    envelope = np.ones(num_samples)
-    fade_samples = int(0.005 * sample_rate)
-    envelope[:fade_samples] = np.linspace(0, 1, fade_samples)
-    envelope[-fade_samples:] = np.linspace(1, 0, fade_samples)
-    
-    wave = wave * envelope * volume
-    wave = (wave * 32767).astype(np.int16)
-    
-    return wave
-
-def save_sound(wave, filename, sample_rate=22050):
-    """Save wave data as a WAV file"""
-    # Create stereo from mono
-    stereo_wave = np.column_stack((wave, wave))
-    
-    # Create pygame Sound and save
-    sound = pygame.sndarray.make_sound(stereo_wave)
-    
-    filepath = os.path.join('assets', 'audio', 'sfx', filename)
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    
-    # Save using pygame
-    pygame.mixer.Sound.play(sound)  # Brief play to initialize
-    pygame.time.wait(10)
-    
-    # Use numpy to save as WAV
-    from scipy.io import wavfile
-    wavfile.write(filepath, sample_rate, stereo_wave)
-    
-    print(f"✓ Generated: {filename}")
+from synth import note, render_files
 
-def create_all_sounds():
-    """Generate all game sound effects"""
-    
-    print("🔊 Generating placeholder sound effects...\n")
-    
+SAMPLE_RATE = 22050
+
+# 10ms fade in/out to avoid clicks (5ms for noise)
+TONE = {"envelope": ("fade", 0.01, 0.01)}
+NOISE = {"partials": [], "noise": 1.0, "envelope": ("fade", 0.005, 0.005)}
+
+
+def tone(frequency, duration, volume=0.3, start=0.0):
+    """A simple sine wave tone"""
+    return [note(start, TONE, frequency, duration, volume)]
+
+
+def sweep(start_freq, end_freq, duration, volume=0.3, start=0.0):
+    """A linear frequency sweep"""
+    patch = dict(TONE, sweep=end_freq / start_freq)
+    return [note(start, patch, start_freq, duration, volume)]
+
+
+def noise(duration, volume=0.2, start=0.0):
+    """White noise"""
+    return [note(start, NOISE, 0, duration, volume)]
+
+
+def sequence(*parts):
+    """Play tones of equal length one after another"""
+    events = []
+    for i, (frequency, duration, volume) in enumerate(parts):
+        events += tone(frequency, duration, volume, start=i * duration)
+    return events
+
+
+SOUNDS = {
     # Jump sound - rising tone
-    jump = generate_sweep(200, 400, 0.15, volume=0.25)
-    save_sound(jump, 'jump.wav')
-    
+    'jump.wav': sweep(200, 400, 0.15, volume=0.25),
     # Attack sounds - short percussive hits with different pitches
-    attack1 = generate_sweep(300, 150, 0.08, volume=0.3)
-    save_sound(attack1, 'attack1.wav')
-    
-    attack2 = generate_sweep(350, 170, 0.08, volume=0.32)
-    save_sound(attack2, 'attack2.wav')
-    
-    attack3 = generate_sweep(400, 200, 0.1, volume=0.35)
-    save_sound(attack3, 'attack3.wav')
-    
+    'attack1.wav': sweep(300, 150, 0.08, volume=0.3),
+    'attack2.wav': sweep(350, 170, 0.08, volume=0.32),
+    'attack3.wav': sweep(400, 200, 0.1, volume=0.35),
     # Shadow Strike - whoosh sound (noise with sweep)
-    whoosh_noise = generate_noise(0.25, volume=0.15)
-    whoosh_tone = generate_sweep(600, 200, 0.25, volume=0.2)
-    shadow_strike = whoosh_noise + whoosh_tone
-    save_sound(shadow_strike, 'shadow_strike.wav')
-    
+    'shadow_strike.wav': noise(0.25, volume=0.15) + sweep(600, 200, 0.25, volume=0.2),
     # Player hit - descending tone
-    player_hit = generate_sweep(400, 200, 0.2, volume=0.25)
-    save_sound(player_hit, 'player_hit.wav')
-    
+    'player_hit.wav': sweep(400, 200, 0.2, volume=0.25),
     # Land sound - thump
-    land = generate_tone(100, 0.08, volume=0.2)
-    save_sound(land, 'land.wav')
-    
+    'land.wav': tone(100, 0.08, volume=0.2),
     # Enemy hit - sharp impact
-    enemy_hit = generate_sweep(250, 100, 0.1, volume=0.3)
-    save_sound(enemy_hit, 'enemy_hit.wav')
-    
+    'enemy_hit.wav': sweep(250, 100, 0.1, volume=0.3),
     # Enemy death - descending sweep
-    enemy_death = generate_sweep(300, 80, 0.3, volume=0.25)
-    save_sound(enemy_death, 'enemy_death.wav')
-    
+    'enemy_death.wav': sweep(300, 80, 0.3, volume=0.25),
     # Menu select - pleasant beep
-    menu_select = generate_tone(440, 0.08, volume=0.25)
-    save_sound(menu_select, 'menu_select.wav')
-    
+    'menu_select.wav': tone(440, 0.08, volume=0.25),
     # Menu move - subtle beep
-    menu_move = generate_tone(330, 0.05, volume=0.2)
-    save_sound(menu_move, 'menu_move.wav')
-    
+    'menu_move.wav': tone(330, 0.05, volume=0.2),
     # Pause - two-tone
-    pause_tone1 = generate_tone(440, 0.08, volume=0.2)
-    pause_tone2 = generate_tone(330, 0.08, volume=0.2)
-    pause = np.concatenate([pause_tone1, pause_tone2])
-    save_sound(pause, 'pause.wav')
-    
+    'pause.wav': sequence((440, 0.08, 0.2), (330, 0.08, 0.2)),
     # Combo - rising celebratory tone
-    combo = generate_sweep(440, 880, 0.15, volume=0.3)
-    save_sound(combo, 'combo.wav')
-    
+    'combo.wav': sweep(440, 880, 0.15, volume=0.3),
     # Game over - descending sad tone
-    game_over = generate_sweep(440, 220, 0.5, volume=0.25)
-    save_sound(game_over, 'game_over.wav')
-    
+    'game_over.wav': sweep(440, 220, 0.5, volume=0.25),
     # Boss spawn - ominous rising tone
-    boss_spawn = generate_sweep(100, 300, 0.8, volume=0.4)
-    save_sound(boss_spawn, 'boss_spawn.wav')
-    
+    'boss_spawn.wav': sweep(100, 300, 0.8, volume=0.4),
     # Boss defeat - triumphant rising chord
-    boss_defeat1 = generate_tone(440, 0.2, volume=0.3)
-    boss_defeat2 = generate_tone(550, 0.2, volume=0.3)
-    boss_defeat3 = generate_tone(660, 0.2, volume=0.3)
-    boss_defeat = np.concatenate([boss_defeat1, boss_defeat2, boss_defeat3])
-    save_sound(boss_defeat, 'boss_defeat.wav')
-    
+    'boss_defeat.wav': sequence((440, 0.2, 0.3), (550, 0.2, 0.3), (660, 0.2, 0.3)),
     # Boss attack - heavy impact
-    boss_attack = generate_sweep(150, 80, 0.15, volume=0.4)
-    save_sound(boss_attack, 'boss_attack.wav')
-    
+    'boss_attack.wav': sweep(150, 80, 0.15, volume=0.4),
     # Boss hurt - deep rumble
-    boss_hurt = generate_tone(80, 0.25, volume=0.35)
-    save_sound(boss_hurt, 'boss_hurt.wav')
-    
-    # Level complete - celebratory fanfare
-    level_complete1 = generate_tone(523, 0.1, volume=0.3)  # C
-    level_complete2 = generate_tone(659, 0.1, volume=0.3)  # E
-    level_complete3 = generate_tone(784, 0.1, volume=0.3)  # G
-    level_complete = np.concatenate([level_complete1, level_complete2, level_complete3])
-    save_sound(level_complete, 'level_complete.wav')
-    
+    'boss_hurt.wav': tone(80, 0.25, volume=0.35),
+    # Level complete - celebratory fanfare (C E G)
+    'level_complete.wav': sequence((523, 0.1, 0.3), (659, 0.1, 0.3), (784, 0.1, 0.3)),
     # Powerup - magical rising tone
-    powerup = generate_sweep(300, 600, 0.3, volume=0.25)
-    save_sound(powerup, 'powerup.wav')
-    
+    'powerup.wav': sweep(300, 600, 0.3, volume=0.25),
     # Coin collect - pleasant chime
-    coin_collect = generate_tone(800, 0.08, volume=0.2)
-    save_sound(coin_collect, 'coin_collect.wav')
-    
+    'coin_collect.wav': tone(800, 0.08, volume=0.2),
     # Footstep - subtle tap
-    footstep = generate_tone(200, 0.04, volume=0.15)
-    save_sound(footstep, 'footstep.wav')
-    
+    'footstep.wav': tone(200, 0.04, volume=0.15),
+}
+
+
+def create_all_sounds():
+    """Generate all game sound effects (in parallel)"""
+
+    print("🔊 Generating placeholder sound effects...\n")
+
+    out_dir = os.path.join('assets', 'audio', 'sfx')
+    jobs = [(os.path.join(out_dir, filename), events, {"sample_rate": SAMPLE_RATE, "channels": 2})
+            for filename, events in SOUNDS.items()]
+    for path, _ in render_files(jobs):
+        print(f"✓ Generated: {os.path.basename(path)}")
+
     print("\n✅ All sound effects generated successfully!")
-    print(f"📁 Saved to: assets/audio/sfx/")
+    print(f"📁 Saved to: {out_dir}/")
+
 
 if __name__ == "__main__":
-    try:
-        import scipy.io.wavfile
-        create_all_sounds()
-    except ImportError:
-        print("⚠️  scipy not installed. Installing...")
-        import subprocess
-        subprocess.check_call(['pip', 'install', 'scipy', 'numpy'])
-        print("\n✓ Dependencies installed. Run this script again.")
+    create_all_sounds()
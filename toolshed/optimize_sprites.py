@@ -1,75 +1,202 @@
 #!/usr/bin/env python3
-"""Optimize PNG sprite images in-place or to an output folder.
+"""Optimize PNG sprite images in-place or next to the originals.
 
-Tries to use `pngquant` or `optipng` if available, otherwise falls back to Pillow
-quantization and PNG `optimize` flag. Designed as a simple, safe tool for
-reducing repo sizes for development and CI.
+Every file is re-encoded several ways and the smallest result that decodes
+back to the same pixels is kept:
+
+* truecolour (RGBA, or RGB when the image is fully opaque) and greyscale
+  (L/LA when every pixel is grey), with zlib at maximum compression;
+* an exact palette (with per-entry alpha) when the image has at most 256
+  distinct colours;
+* with --max-error, lossy palettes of 256 down to 16 colours (Pillow's
+  octree quantizer, plus libimagequant when Pillow was built with it);
+* `pngquant` and `optipng` as extra candidates when they are on PATH.
+
+A candidate is accepted only if no visible pixel channel differs from the
+source by more than --max-error (0, the default, means pixel-exact; the
+colour of fully transparent pixels is ignored). If nothing beats the
+source it is left alone. Files are processed in parallel, and each decision
+is recorded in a cache keyed by the file's SHA-256, so unchanged files are
+skipped on the next run.
+
+Usage:
+    python toolshed/optimize_sprites.py [paths ...] [--inplace] [--max-error 0] [--cache .png_cache.json]
 """
 import argparse
+import hashlib
+import io
+import json
 import shutil
 import subprocess
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from PIL import Image
 
+import numpy as np
+from PIL import Image, features
 
-def run_cmd(cmd):
-    try:
-        subprocess.run(cmd, check=True)
-        return True
-    except Exception:
-        return False
+LOSSY_COLOURS = (256, 128, 64, 32, 16)
+CACHE_VERSION = 1
+
+
+def sha256(data: bytes):
+    return hashlib.sha256(data).hexdigest()
+
+
+def visible(rgba):
+    """RGBA array with the colour of fully transparent pixels zeroed"""
+    out = rgba.copy()
+    out[out[..., 3] == 0] = 0
+    return out
+
+
+def max_error(reference, data: bytes):
+    """Largest per-channel difference between `reference` and the decoded PNG"""
+    with Image.open(io.BytesIO(data)) as img:
+        decoded = visible(np.asarray(img.convert("RGBA")))
+    if decoded.shape != reference.shape:
+        return 255
+    return int(np.abs(decoded.astype(np.int16) - reference).max(initial=0))
+
+
+def encode(img: Image.Image):
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def exact_palette(rgba):
+    """P-mode image holding exactly the colours of `rgba`, or None if there are more than 256"""
+    if Image.fromarray(rgba, "RGBA").getcolors(256) is None:
+        return None
+    # One uint32 per pixel makes the unique pass a flat sort
+    packed = np.ascontiguousarray(rgba).view("<u4").reshape(-1)
+    values, index = np.unique(packed, return_inverse=True)
+    colours = values.view(np.uint8).reshape(-1, 4)
+    # Opaque entries last, so the tRNS chunk only has to cover the translucent ones
+    order = np.argsort(colours[:, 3] == 255, kind="stable")
+    remap = np.empty(len(colours), np.uint8)
+    remap[order] = np.arange(len(colours))
+    img = Image.fromarray(remap[index.ravel()].reshape(rgba.shape[:2]), "P")
+    img.putpalette(colours[order].tobytes(), rawmode="RGBA")
+    return img
 
 
-def optimize_with_pngquant(src: Path, dest: Path, quality=(60, 90)):
-    cmd = ["pngquant", "--quality", f"{quality[0]}-{quality[1]}", "--output", str(dest), "--force", str(src)]
-    return run_cmd(cmd)
+def lossless_candidates(rgba):
+    opaque = bool((rgba[..., 3] == 255).all())
+    grey = bool(((rgba[..., 0] == rgba[..., 1]) & (rgba[..., 1] == rgba[..., 2])).all())
+    img = Image.fromarray(rgba, "RGBA")
+    yield "rgb" if opaque else "rgba", lambda: encode(img.convert("RGB") if opaque else img)
+    if grey:
+        yield "grey", lambda: encode(img.convert("L") if opaque else img.convert("LA"))
+    palette = exact_palette(rgba)
+    if palette is not None:
+        yield "palette", lambda: encode(palette)
 
 
-def optimize_with_optipng(src: Path, dest: Path):
-    # optipng writes in-place so copy first
+def lossy_candidates(rgba):
+    img = Image.fromarray(rgba, "RGBA")
+    methods = [("octree", Image.Quantize.FASTOCTREE)]
+    if features.check_feature("libimagequant"):
+        methods.append(("imagequant", Image.Quantize.LIBIMAGEQUANT))
+    for name, method in methods:
+        for colours in LOSSY_COLOURS:
+            yield (f"{name}-{colours}",
+                   lambda method=method, colours=colours:
+                   encode(img.quantize(colours, method=method, dither=Image.Dither.NONE)))
+
+
+def external_candidates(path: Path, allow_lossy):
+    """pngquant/optipng outputs, when the tools are installed"""
+    def run(cmd, dest):
+        try:
+            subprocess.run(cmd, check=True, capture_output=True)
+            return dest.read_bytes()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    tmp = Path(tempfile.mkdtemp(prefix="optimize_sprites_"))
     try:
-        shutil.copy2(src, dest)
-        return run_cmd(["optipng", "-o3", str(dest)])
-    except Exception:
-        return False
+        if allow_lossy and shutil.which("pngquant"):
+            dest = tmp / "pngquant.png"
+            yield "pngquant", run(["pngquant", "--quality", "60-90", "--output", str(dest), "--force", str(path)], dest)
+        if shutil.which("optipng"):
+            dest = tmp / "optipng.png"
+            shutil.copy2(path, dest)
+            yield "optipng", run(["optipng", "-quiet", "-o3", str(dest)], dest)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def optimize_file(path: Path, dest: Path, allowed_error=0):
+    """Try every candidate for one file; write the best to `dest` if it beats the source.
+
+    Returns a decision dict: the winning encoder ("original" if none won),
+    the source and result sizes and the SHA-256 of both."""
+    data = path.read_bytes()
+    with Image.open(io.BytesIO(data)) as img:
+        rgba = np.asarray(img.convert("RGBA"))
+    reference = visible(rgba)
 
+    best_name, best = "original", data
+    candidates = list(lossless_candidates(rgba))
+    if allowed_error:
+        candidates += lossy_candidates(rgba)
+    for name, make in candidates:
+        out = make()
+        if len(out) < len(best) and max_error(reference, out) <= allowed_error:
+            best_name, best = name, out
+    for name, out in external_candidates(path, allowed_error > 0):
+        if out and len(out) < len(best) and max_error(reference, out) <= allowed_error:
+            best_name, best = name, out
 
-def optimize_with_pillow(src: Path, dest: Path):
-    img = Image.open(src).convert("RGBA")
-    # Split alpha and color
-    r, g, b, a = img.split()
-    rgb = Image.merge("RGB", (r, g, b))
-    # Quantize colors to reduce palette size
-    pal = rgb.quantize(method=Image.MEDIANCUT)
-    # Reattach alpha by converting to RGBA
-    out = pal.convert("RGBA")
-    out.putalpha(a)
-    out.save(dest, optimize=True)
-    return True
+    if best is not data:
+        dest.write_bytes(best)
+    return {"encoder": best_name, "source_size": len(data), "size": len(best),
+            "source_sha256": sha256(data), "sha256": sha256(best)}
 
 
-def optimize_file(path: Path, inplace: bool = False):
-    dest = path if inplace else path.with_suffix(path.suffix + ".opt.png")
+def _optimize_job(job):
+    path, dest, allowed_error = job
+    try:
+        return str(path), optimize_file(path, dest, allowed_error)
+    except Exception as e:  # Anything PIL cannot read or write is reported, not fatal
+        return str(path), {"error": str(e)}
+
 
-    # Try pngquant first
-    if shutil.which("pngquant"):
-        if optimize_with_pngquant(path, dest):
-            return dest
+def load_cache(path: Path, allowed_error):
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    # Decisions made under different settings are not reusable
+    if cache.get("version") != CACHE_VERSION or cache.get("max_error") != allowed_error:
+        return {}
+    return cache.get("files", {})
 
-    # Then optipng
-    if shutil.which("optipng"):
-        if optimize_with_optipng(path, dest):
-            return dest
 
-    # Fallback to Pillow-based optimization
-    optimize_with_pillow(path, dest)
-    return dest
+def is_done(cache, path: Path, dest: Path, digest):
+    """Whether the cache shows `path` (with this content) needs no work"""
+    decision = cache.get(digest)
+    if decision is None:
+        return False
+    if decision["encoder"] == "original" or dest == path:
+        # Already as small as we can make it, or the result of an in-place run
+        return True
+    return dest.is_file() and sha256(dest.read_bytes()) == decision["sha256"]
 
 
 def main():
     p = argparse.ArgumentParser(description="Optimize PNG sprites in assets/sprites.")
     p.add_argument("paths", nargs="*", help="Files or folders to optimize (default: assets/sprites)")
     p.add_argument("--inplace", action="store_true", help="Overwrite original files")
+    p.add_argument("--max-error", type=int, default=0,
+                   help="Largest per-channel change allowed (0 = lossless; try 4-8 for lossy palettes)")
+    p.add_argument("--cache", default=".png_cache.json", help="Decision cache path")
+    p.add_argument("--force", action="store_true", help="Ignore the cache and re-try every file")
+    p.add_argument("--workers", type=int, default=None, help="Processes to use (default: one per CPU)")
     args = p.parse_args()
 
     targets = args.paths or ["assets/sprites"]
@@ -77,24 +204,59 @@ def main():
     for t in targets:
         pth = Path(t)
         if pth.is_dir():
-            files.extend(pth.rglob("*.png"))
+            files.extend(sorted(pth.rglob("*.png")))
         elif pth.is_file():
             files.append(pth)
+    # Never optimise our own outputs
+    files = [f for f in files if not f.name.endswith(".opt.png")]
 
     if not files:
         print("No PNG files found to optimize")
         return 0
 
-    print(f"Optimizing {len(files)} PNGs (inplace={args.inplace})")
+    cache_path = Path(args.cache)
+    cache = {} if args.force else load_cache(cache_path, args.max_error)
+    jobs = []
+    skipped = 0
     for f in files:
-        try:
-            out = optimize_file(f, inplace=args.inplace)
-            print(f"Optimized: {f} -> {out}")
-        except Exception as e:
-            print(f"Failed to optimize {f}: {e}")
+        dest = f if args.inplace else f.with_suffix(f.suffix + ".opt.png")
+        if is_done(cache, f, dest, sha256(f.read_bytes())):
+            skipped += 1
+        else:
+            jobs.append((f, dest, args.max_error))
+
+    print(f"Optimizing {len(jobs)} PNGs (inplace={args.inplace}, max error {args.max_error}, "
+          f"{skipped} unchanged since the last run)")
+    saved = defaultdict(lambda: [0, 0, 0])  # Directory: [files, bytes before, bytes after]
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for name, decision in pool.map(_optimize_job, jobs, chunksize=1):
+            if "error" in decision:
+                failed += 1
+                print(f"✗ Failed to optimize {name}: {decision['error']}")
+                continue
+            cache[decision["source_sha256"]] = decision
+            if args.inplace:
+                cache[decision["sha256"]] = dict(decision, encoder="original")  # Our output is final
+            totals = saved[Path(name).parent.as_posix()]
+            totals[0] += 1
+            totals[1] += decision["source_size"]
+            totals[2] += decision["size"]
+            if decision["encoder"] != "original":
+                print(f"✓ {name}: {decision['source_size']} -> {decision['size']} bytes ({decision['encoder']})")
+
+    with open(cache_path, "w") as f:
+        json.dump({"version": CACHE_VERSION, "max_error": args.max_error, "files": cache}, f, indent=1)
 
-    print("Done")
-    return 0
+    if saved:
+        print("\nSaved per directory:")
+        for directory, (count, before, after) in sorted(saved.items()):
+            print(f"  {directory}: {before - after} bytes over {count} files "
+                  f"({(before - after) / before:.1%})")
+        before = sum(t[1] for t in saved.values())
+        after = sum(t[2] for t in saved.values())
+        print(f"Total: {before - after} bytes saved ({before} -> {after})")
+    return 1 if failed else 0
 
 
 if __name__ == '__main__':
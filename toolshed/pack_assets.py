@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Pack the game's assets into one indexed bundle file.
+
+Every file under assets/ the runtime loads (images, sounds, pre-converted
+mixer buffers and JSON manifests) is stored back to back in one archive,
+behind a header and a JSON index of name -> offset, length, codec (the
+file extension) and SHA-256; see python/asset_bundle.py for the layout.
+The Python runtime opens the bundle once and serves every asset from the
+mapping, so startup I/O is one sequential read instead of a probe and an
+open per file. Files are stored in path order, so each folder's assets
+sit together.
+
+Run it after changing anything under assets/. --check only reports whether
+the existing bundle still matches the loose files (exit 1 if not).
+
+Usage:
+    python toolshed/pack_assets.py [--root assets] [--out assets.pak] [--check]
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "python"))
+from asset_bundle import ALIGN, HEADER, MAGIC, VERSION, AssetBundle, aligned  # noqa: E402
+
+PACKED_TYPES = {".png", ".wav", ".ogg", ".mp3", ".pcm", ".json"}
+
+
+def packed_files(root: Path):
+    """(name, path) of every file the bundle holds, in storage order"""
+    files = []
+    for path in sorted(root.rglob("*")):
+        if path.is_file() and path.suffix.lower() in PACKED_TYPES and not path.name.endswith(".opt.png"):
+            files.append((path.relative_to(root).as_posix(), path))
+    return files
+
+
+def pack(files, out: Path):
+    """Write the bundle; returns its index"""
+    index, blobs, offset = {}, [], 0
+    for name, path in files:
+        data = path.read_bytes()
+        index[name] = {"offset": offset, "length": len(data), "codec": path.suffix.lower().lstrip("."),
+                       "sha256": hashlib.sha256(data).hexdigest()}
+        blobs.append(data + bytes(aligned(len(data)) - len(data)))
+        offset += aligned(len(data))
+    header = json.dumps(index, separators=(",", ":")).encode()
+    head = HEADER.pack(MAGIC, VERSION, len(header)) + header
+    tmp = out.with_name(out.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(head + bytes(aligned(len(head)) - len(head)))
+        f.writelines(blobs)
+    os.replace(tmp, out)
+    return index
+
+
+def stale_entries(files, out: Path):
+    """Names that differ between the loose files and the bundle at `out`"""
+    bundle = AssetBundle(out)
+    names = {name for name, _ in files}
+    stale = sorted(set(bundle.index) - names)
+    for name, path in files:
+        entry = bundle.index.get(name)
+        if entry is None or entry["sha256"] != hashlib.sha256(path.read_bytes()).hexdigest():
+            stale.append(name)
+    return stale
+
+
+def main():
+    p = argparse.ArgumentParser(description="Pack assets/ into one bundle file for the Python runtime.")
+    p.add_argument("--root", default="assets", help="Folder to pack")
+    p.add_argument("--out", default="assets.pak", help="Bundle to write (python/config.py ASSET_BUNDLE)")
+    p.add_argument("--check", action="store_true", help="Only check that the bundle is up to date")
+    args = p.parse_args()
+
+    root, out = Path(args.root), Path(args.out)
+    files = packed_files(root)
+    if not files:
+        print(f"No assets found in {root}")
+        return 1
+
+    if args.check:
+        try:
+            stale = stale_entries(files, out)
+        except (OSError, ValueError) as e:
+            print(f"✗ {out}: {e}")
+            return 1
+        for name in stale:
+            print(f"✗ {name} changed since {out} was packed")
+        if not stale:
+            print(f"✓ {out} is up to date ({len(files)} files)")
+        return 1 if stale else 0
+
+    index = pack(files, out)
+    by_codec = {}
+    for entry in index.values():
+        count, total = by_codec.get(entry["codec"], (0, 0))
+        by_codec[entry["codec"]] = (count + 1, total + entry["length"])
+    for codec, (count, total) in sorted(by_codec.items()):
+        print(f"  {codec}: {count} files, {total / 1024:.0f} KB")
+    print(f"✓ Packed {len(index)} files into {out} ({out.stat().st_size / 1024:.0f} KB, {ALIGN}-byte aligned)")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
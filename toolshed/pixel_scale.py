@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""Pixel-art upscaling, and a batch tool that pre-scales sprite sheets for the game.
+
+The scalers work on RGBA uint8 arrays and compare every pixel with its
+neighbours as whole-array NumPy operations (shifted views of an
+edge-padded copy), so a sheet is scaled in a handful of vector passes:
+
+* nearest: integer pixel repetition;
+* scale2x / scale3x (AdvMAME2x/3x): fill each output sub-pixel from a
+  neighbour when the surrounding pixels say it lies on a diagonal edge;
+* epx: Eric Johnston's original 2x rules, which leave a pixel whole when
+  three or more of its neighbours agree;
+* edge: scale2x/3x comparing colours within EDGE_TOLERANCE instead of
+  exactly, so edges in anti-aliased or dithered art are still followed.
+
+Colours are compared with the RGB of fully transparent pixels ignored.
+resize() reaches non-integer sizes (64 -> 96 px) by scaling up past the
+target with the method and sampling down to it with nearest.
+
+As a tool, it cuts each sheet into frames (layout from sheets.json),
+scales every frame to the size the game draws it at, packs the frames
+without gutters into assets/sprites/scaled/ and records them in
+assets/sprites/scaled/manifest.json. SpriteLoader loads those instead of
+scaling at runtime. Sheets are processed in parallel.
+
+Usage:
+    python toolshed/pixel_scale.py [--method scale] [--workers N]
+    python toolshed/pixel_scale.py assets/sprites/characters --size 96 [--method epx]
+"""
+import argparse
+import hashlib
+import json
+import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from optimize_sprites import lossless_candidates
+from scan_sprites import SHEETS, SheetIndex, frame_layout
+
+SPRITES = Path("assets/sprites")
+OUT_DIR = SPRITES / "scaled"
+INDEX = SheetIndex()  # sheets.json, loaded once per worker process
+EDGE_TOLERANCE = 24  # Largest per-channel difference the edge method treats as the same colour
+
+# Sheets the game scales at load (glob relative to assets/sprites: frame size
+# drawn), from Player.load_sprites and Enemy's sprite set-up
+RUNTIME_SIZES = {
+    "characters/ninja_*.png": 96,
+    "enemies/fly_*.png": 64,
+}
+
+
+def nearest(rgba, factor):
+    return np.repeat(np.repeat(rgba, factor, axis=0), factor, axis=1)
+
+
+def _neighbours(rgba, offsets):
+    """Views of the edge-padded image shifted by each (dy, dx)"""
+    h, w = rgba.shape[:2]
+    padded = np.pad(rgba, ((1, 1), (1, 1), (0, 0)), mode="edge")
+    return [padded[1 + dy:1 + dy + h, 1 + dx:1 + dx + w] for dy, dx in offsets]
+
+
+def _comparable(rgba):
+    """int16 copy with the colour of fully transparent pixels zeroed"""
+    out = rgba.astype(np.int16)
+    out[out[..., 3] == 0] = 0
+    return out
+
+
+def _equal(tolerance):
+    if tolerance:
+        return lambda a, b: np.abs(a - b).max(axis=-1) <= tolerance
+    return lambda a, b: (a == b).all(axis=-1)
+
+
+def _assemble(pixels, factor):
+    """Interleave factor*factor sub-pixel images (row-major) into one image"""
+    h, w, c = pixels[0].shape
+    out = np.stack(pixels).reshape(factor, factor, h, w, c)
+    return out.transpose(2, 0, 3, 1, 4).reshape(h * factor, w * factor, c)
+
+
+def _pick(condition, a, b):
+    return np.where(condition[..., None], a, b)
+
+
+def scale2x(rgba, tolerance=0):
+    eq = _equal(tolerance)
+    #   A
+    # C P B
+    #   D
+    P, A, B, C, D = _neighbours(rgba, [(0, 0), (-1, 0), (0, 1), (0, -1), (1, 0)])
+    p, a, b, c, d = _neighbours(_comparable(rgba), [(0, 0), (-1, 0), (0, 1), (0, -1), (1, 0)])
+    ca, ab, dc, bd = eq(c, a), eq(a, b), eq(d, c), eq(b, d)
+    return _assemble([
+        _pick(ca & ~dc & ~ab, A, P),
+        _pick(ab & ~ca & ~bd, B, P),
+        _pick(dc & ~bd & ~ca, C, P),
+        _pick(bd & ~ab & ~dc, D, P),
+    ], 2)
+
+
+def scale3x(rgba, tolerance=0):
+    eq = _equal(tolerance)
+    offsets = [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1)]
+    # A B C / D E F / G H I
+    A, B, C, D, E, F, G, H, I = _neighbours(rgba, offsets)
+    a, b, c, d, e, f, g, h, i = _neighbours(_comparable(rgba), offsets)
+    db, bf, dh, hf = eq(d, b), eq(b, f), eq(d, h), eq(h, f)
+    top_left = db & ~bf & ~dh
+    top_right = bf & ~db & ~hf
+    bottom_left = dh & ~db & ~hf
+    bottom_right = hf & ~dh & ~bf
+    return _assemble([
+        _pick(top_left, D, E),
+        _pick((top_left & ~eq(e, c)) | (top_right & ~eq(e, a)), B, E),
+        _pick(top_right, F, E),
+        _pick((top_left & ~eq(e, g)) | (bottom_left & ~eq(e, a)), D, E),
+        E,
+        _pick((top_right & ~eq(e, i)) | (bottom_right & ~eq(e, c)), F, E),
+        _pick(bottom_left, D, E),
+        _pick((bottom_left & ~eq(e, i)) | (bottom_right & ~eq(e, g)), H, E),
+        _pick(bottom_right, F, E),
+    ], 3)
+
+
+def epx(rgba):
+    eq = _equal(0)
+    P, A, B, C, D = _neighbours(rgba, [(0, 0), (-1, 0), (0, 1), (0, -1), (1, 0)])
+    p, a, b, c, d = _neighbours(_comparable(rgba), [(0, 0), (-1, 0), (0, 1), (0, -1), (1, 0)])
+    # Three or more matching neighbours: keep the pixel whole
+    pairs = [eq(a, b), eq(a, c), eq(a, d), eq(b, c), eq(b, d), eq(c, d)]
+    keep = np.sum(pairs, axis=0) >= 3
+    ca, ab, dc, bd = pairs[1], pairs[0], pairs[5], pairs[4]
+    return _assemble([
+        _pick(ca & ~keep, A, P),
+        _pick(ab & ~keep, B, P),
+        _pick(dc & ~keep, C, P),
+        _pick(bd & ~keep, D, P),
+    ], 2)
+
+
+# Method: {integer factor: scaler}. Factors a method lacks are made of the
+# ones it has, then nearest
+METHODS = {
+    "nearest": {},
+    "scale": {2: scale2x, 3: scale3x},
+    "epx": {2: epx},
+    "edge": {2: partial(scale2x, tolerance=EDGE_TOLERANCE), 3: partial(scale3x, tolerance=EDGE_TOLERANCE)},
+}
+
+
+def upscale(rgba, factor, method="scale"):
+    """Scale by an integer factor, built from the method's 2x/3x steps"""
+    steps = METHODS[method]
+    for step in sorted(steps, reverse=True):
+        while factor % step == 0 and factor > 1:
+            rgba = steps[step](rgba)
+            factor //= step
+    return nearest(rgba, factor) if factor > 1 else rgba
+
+
+def resize(rgba, size, method="scale"):
+    """Scale to (width, height): up by the smallest factor the method can do
+    that reaches the target, then nearest-sampled down to it exactly"""
+    width, height = size
+    h, w = rgba.shape[:2]
+    factor = max(1, math.ceil(max(width / w, height / h) - 1e-9))
+    steps = METHODS[method]
+    if steps and factor > 1 and all(factor % s for s in steps):
+        # Round up to a factor the method's own steps make (e.g. 3 -> 4 for epx)
+        factor = min(s ** math.ceil(math.log(factor, s) - 1e-9) for s in steps)
+    rgba = upscale(rgba, factor, method)
+    rows = ((np.arange(height) + 0.5) * rgba.shape[0] / height).astype(int)
+    cols = ((np.arange(width) + 0.5) * rgba.shape[1] / width).astype(int)
+    return rgba[rows][:, cols]
+
+
+def frames_of(rgba, name, meta=None):
+    """Frames of a sheet, cut by its sheets.json entry `meta` when it has one,
+    else by its layout in SHEETS; any other image is one frame"""
+    if meta is not None:
+        x, width, height = meta["offset"], meta["frame_width"], meta["frame_height"]
+        return [rgba[:height, x + i * meta["stride"]:x + i * meta["stride"] + width] for i in range(meta["frames"])]
+    if name not in SHEETS:
+        return [rgba]
+    count, size = SHEETS[name]
+    layout = frame_layout(rgba.shape[1], count, size)
+    if layout is None:
+        raise ValueError(f"width {rgba.shape[1]} does not split into {count} frames of {size}px")
+    stride = size + layout[0]
+    return [rgba[:size, i * stride:i * stride + size] for i in range(count)]
+
+
+def scale_sheet(job):
+    """Scale every frame of one sheet and write them packed side by side"""
+    path, size, method = job
+    rel = path.relative_to(SPRITES)
+    data = path.read_bytes()
+    with Image.open(path) as img:
+        rgba = np.asarray(img.convert("RGBA"))
+    meta = INDEX.lookup(rel.as_posix(), data)
+    frames = [resize(frame, (size, size), method) for frame in frames_of(rgba, path.stem, meta)]
+    packed = np.concatenate(frames, axis=1)
+    out = OUT_DIR / rel.parent / f"{path.stem}@{size}.png"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_bytes(min((make() for _, make in lossless_candidates(packed)), key=len))
+    entry = {"file": out.relative_to(OUT_DIR).as_posix(), "frames": len(frames), "method": method,
+             "source_sha256": hashlib.sha256(data).hexdigest()}
+    return rel.as_posix(), f"{size}x{size}", entry
+
+
+def write_manifest(results):
+    """Merge this run into manifest.json: sprite path -> {"WxH": entry}"""
+    path = OUT_DIR / "manifest.json"
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    for rel, size, entry in results:
+        manifest.setdefault(rel, {})[size] = entry
+    with open(path, "w") as f:
+        json.dump(dict(sorted(manifest.items())), f, indent=2)
+    return path
+
+
+def main():
+    p = argparse.ArgumentParser(description="Pre-scale sprite sheets with a pixel-art scaler.")
+    p.add_argument("paths", nargs="*", help="Sheets or folders under assets/sprites (default: RUNTIME_SIZES)")
+    p.add_argument("--size", type=int, help="Frame size to scale to (required with paths)")
+    p.add_argument("--method", choices=sorted(METHODS), default="scale", help="Scaler to use")
+    p.add_argument("--workers", type=int, default=None, help="Processes to use (default: one per CPU)")
+    args = p.parse_args()
+
+    if args.paths:
+        if not args.size:
+            p.error("--size is required when paths are given")
+        jobs = []
+        for target in map(Path, args.paths):
+            files = sorted(target.rglob("*.png")) if target.is_dir() else [target]
+            jobs += [(f, args.size, args.method) for f in files
+                     if not f.name.endswith(".opt.png") and OUT_DIR not in f.parents]
+    else:
+        jobs = [(f, size, args.method) for pattern, size in RUNTIME_SIZES.items()
+                for f in sorted(SPRITES.glob(pattern)) if not f.name.endswith(".opt.png")]
+    if not jobs:
+        print("No sprites found to scale")
+        return 0
+
+    failed = 0
+    results = []
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for job, result in zip(jobs, pool.map(_scale_job, jobs)):
+            if isinstance(result, str):
+                failed += 1
+                print(f"✗ {job[0]}: {result}")
+            else:
+                results.append(result)
+                print(f"✓ {job[0]} -> {OUT_DIR / result[2]['file']} ({result[2]['frames']} frames at {result[1]})")
+    if results:
+        print(f"Registered {len(results)} sheets in {write_manifest(results)}")
+    return 1 if failed else 0
+
+
+def _scale_job(job):
+    try:
+        return scale_sheet(job)
+    except (OSError, ValueError) as e:
+        return str(e)
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""Check every PNG under assets/ in one pass and write a machine-readable report.
+
+Each image is decoded once to an RGBA array and every check runs on that
+array as whole-array NumPy operations:
+
+* layout: the sheet splits into its expected frame count, either exactly or
+  with a uniform 1-8 px gutter (between frames, or after each one, the two
+  layouts the game's loaders understand); gutters must be transparent
+* size: frames are the expected size; tiles and backgrounds are sensible
+* empty frames: a frame with no visible pixel
+* stray background: a sprite whose frames are opaque around their edges
+  (a background that was never removed), or that has no alpha at all
+* red leakage: pure-red pixels in gutters or on frame borders, where they
+  bleed into neighbouring frames when the sheet is filtered
+* leftovers: optimiser outputs (*.opt.png) that would ship with the game
+* stale metadata: a sheet whose entry in assets/sprites/sheets.json is
+  missing or describes other file contents (the game then has to measure
+  it at load; refresh with `sheet_layout.py index`)
+
+Files are scanned in parallel. SHEETS below is the single table of expected
+frame counts, matching js/spriteLoader.js and the sheets on disk.
+
+Usage:
+    python toolshed/scan_sprites.py [--root assets] [--out sprite_report.json] [--strict]
+Exits 1 if any file has an error (or a warning, with --strict).
+"""
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "python"))
+from sheet_meta import MAX_PAD, SHEETS_FILE, SheetIndex, frame_layout  # noqa: E402
+
+# Sheet name: (frame count, frame size in px); frames are square
+SHEETS = {
+    'ninja_idle': (4, 64),
+    'ninja_walk': (4, 64),
+    'ninja_jump': (4, 64),
+    'ninja_attack': (4, 64),
+    'ninja_shadow_strike': (4, 64),
+    'ninja_hurt': (2, 64),
+    'ninja_death': (4, 64),
+    'basic_idle': (4, 48),
+    'basic_walk': (4, 48),
+    'basic_attack': (4, 48),
+    'basic_hurt': (4, 48),
+    'fly_idle': (3, 40),
+    'fly_move': (3, 40),
+    'fly_attack': (3, 40),
+    'second_idle': (4, 64),
+    'second_walk': (4, 64),
+    'second_attack': (4, 64),
+    'second_hurt': (2, 64),
+    'boss_idle': (4, 128),
+    'boss_walk': (4, 128),
+    'boss_attack1': (4, 128),
+    'boss2_idle': (4, 128),
+    'boss2_walk': (4, 128),
+    'boss2_attack': (4, 128),
+    'boss2_hurt': (4, 128),
+    'boss3_idle': (4, 128),
+    'boss3_walk': (4, 128),
+    'boss3_attack': (4, 128),
+    'boss3_hurt': (4, 128),
+    'boss4_idle': (4, 128),
+    'boss4_walk': (4, 128),
+    'boss4_attack': (4, 128),
+    'boss4_hurt': (4, 128),
+}
+
+TILE_SIZES = ((64, 64), (32, 32))  # 32x32 is the legacy tile size
+MIN_BACKGROUND = (800, 360)
+OPAQUE_EDGE = 0.5  # Fraction of a frame's border that is opaque before it counts as a background
+RED = (200, 100, 100)  # "Spike red": R >= 200, G <= 100, B <= 100
+INDEX = SheetIndex()  # Loaded once per worker process
+
+
+@lru_cache(maxsize=None)
+def decode(path):
+    """(RGBA uint8 array, source mode, whether the source has alpha); decoded once per process"""
+    with Image.open(path) as img:
+        has_alpha = img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+        return np.asarray(img.convert("RGBA")), img.mode, has_alpha
+
+
+def sheet_name(path: Path):
+    """Key of a sheet in sheets.json: its path relative to assets/sprites"""
+    try:
+        return path.resolve().relative_to(Path(SHEETS_FILE).parent).as_posix()
+    except ValueError:  # Scanning a folder outside assets/sprites
+        return path.as_posix()
+
+
+def kind_of(path: Path):
+    parts = path.parts
+    if path.name.endswith(".opt.png"):
+        return "leftover"
+    if path.stem in SHEETS:
+        return "sheet"
+    if "tiles" in parts:
+        return "tile"
+    if "backgrounds" in parts:
+        return "background"
+    if "items" in parts:
+        return "sprite"
+    return "image"
+
+
+def red_mask(rgba):
+    return ((rgba[..., 0] >= RED[0]) & (rgba[..., 1] <= RED[1])
+            & (rgba[..., 2] <= RED[2]) & (rgba[..., 3] > 0))
+
+
+def border_mask(height, width):
+    mask = np.zeros((height, width), bool)
+    mask[[0, -1], :] = True
+    mask[:, [0, -1]] = True
+    return mask
+
+
+def check_frames(rgba, frames, frame_width, pad, issues, stats):
+    """Per-frame checks on a sheet with a known layout"""
+    height, width = rgba.shape[:2]
+    alpha = rgba[..., 3]
+    red = red_mask(rgba)
+    stride = frame_width + pad
+    starts = np.arange(frames) * stride
+
+    # Frames stacked as (frames, height, frame_width) views via fancy indexing
+    columns = starts[:, None] + np.arange(frame_width)
+    frame_alpha = alpha[:, columns].transpose(1, 0, 2)
+    frame_red = red[:, columns].transpose(1, 0, 2)
+
+    visible = frame_alpha.reshape(frames, -1).max(axis=1) > 0
+    for index in np.flatnonzero(~visible):
+        issues.append(("error", "empty_frame", f"frame {index} has no visible pixels"))
+
+    border = border_mask(height, frame_width)
+    opaque_edge = (frame_alpha[:, border] >= 250).mean(axis=1)
+    for index in np.flatnonzero(opaque_edge > OPAQUE_EDGE):
+        issues.append(("warning", "stray_background",
+                       f"frame {index} border is {opaque_edge[index]:.0%} opaque (background not removed?)"))
+
+    leaked = int(frame_red[:, border].sum())
+    if pad:
+        gutter = np.ones(width, bool)
+        gutter[columns.ravel()] = False
+        if np.any(alpha[:, gutter] > 0):
+            issues.append(("warning", "dirty_padding", f"{pad}px gutters contain visible pixels"))
+        leaked += int(red[:, gutter].sum())
+    if leaked:
+        issues.append(("warning", "red_leak", f"{leaked} red pixels on frame borders or gutters"))
+    stats["empty_frames"] = int((~visible).sum())
+    stats["stride"] = stride
+
+
+def scan(path: Path):
+    """Report entry for one image"""
+    entry = {"kind": kind_of(path), "size": path.stat().st_size}
+    issues = []
+    try:
+        rgba, mode, has_alpha = decode(str(path))
+    except Exception as e:  # Anything PIL cannot read is a broken asset
+        entry["issues"] = [{"level": "error", "check": "decode", "message": str(e)}]
+        return entry
+    height, width = rgba.shape[:2]
+    entry.update(width=width, height=height, mode=mode, red_pixels=int(red_mask(rgba).sum()))
+
+    kind = entry["kind"]
+    if kind == "leftover":
+        issues.append(("warning", "leftover", "optimiser output left in assets (would ship with the game)"))
+    elif kind == "sheet":
+        frames, frame_size = SHEETS[path.stem]
+        entry.update(frames=frames, frame_width=frame_size)
+        if height != frame_size:
+            issues.append(("error", "size", f"height {height}px, expected {frame_size}px frames"))
+        if not has_alpha:
+            issues.append(("warning", "stray_background", f"no alpha channel (mode {mode})"))
+        layout = frame_layout(width, frames, frame_size)
+        if layout is None:
+            issues.append(("error", "layout", f"width {width}px does not split into {frames} frames of "
+                                              f"{frame_size}px with a uniform gutter of up to {MAX_PAD}px"))
+        else:
+            pad, trailing = layout
+            entry.update(pad=pad, trailing_pad=trailing)
+            if pad:
+                issues.append(("info", "padding", f"{pad}px gutter {'after' if trailing else 'between'} frames"))
+            check_frames(rgba, frames, frame_size, pad, issues, entry)
+        if INDEX.lookup(sheet_name(path), path.read_bytes()) is None:
+            issues.append(("warning", "stale_metadata", f"no up-to-date entry in {Path(SHEETS_FILE).name} "
+                                                        "(run toolshed/sheet_layout.py index)"))
+    elif kind == "tile":
+        if (width, height) not in TILE_SIZES:
+            issues.append(("error", "size", f"tile is {width}x{height}, expected 64x64 (or legacy 32x32)"))
+    elif kind == "background":
+        if width < MIN_BACKGROUND[0] or height < MIN_BACKGROUND[1]:
+            issues.append(("error", "size", f"background is {width}x{height}, expected at least "
+                                            f"{MIN_BACKGROUND[0]}x{MIN_BACKGROUND[1]}"))
+    elif kind == "sprite":
+        if np.all(rgba[..., 3][border_mask(height, width)] >= 250):
+            issues.append(("warning", "stray_background", "border is fully opaque (background not removed?)"))
+        if not np.any(rgba[..., 3]):
+            issues.append(("error", "empty_frame", "image has no visible pixels"))
+
+    entry["issues"] = [{"level": level, "check": check, "message": message} for level, check, message in issues]
+    return entry
+
+
+def _scan_job(job):
+    path, root = job
+    return path.relative_to(root).as_posix(), scan(path)
+
+
+def main():
+    p = argparse.ArgumentParser(description="Scan every sprite PNG once and report layout/content problems.")
+    p.add_argument("--root", default="assets", help="Folder searched recursively for PNGs")
+    p.add_argument("--out", default="sprite_report.json", help="JSON report path ('-' for stdout)")
+    p.add_argument("--workers", type=int, default=None, help="Processes to use (default: one per CPU)")
+    p.add_argument("--strict", action="store_true", help="Fail on warnings as well as errors")
+    args = p.parse_args()
+
+    start = time.perf_counter()
+    root = Path(args.root)
+    files = sorted(root.rglob("*.png"))
+    if not files:
+        print(f"No PNG files found in {root}")
+        return 0
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        results = dict(pool.map(_scan_job, [(f, root) for f in files], chunksize=4))
+
+    # Sheets the game expects that are not on disk
+    present = {Path(name).stem for name in results}
+    missing = sorted(name for name in SHEETS if name not in present)
+
+    counts = {"error": 0, "warning": 0, "info": 0}
+    for entry in results.values():
+        for issue in entry["issues"]:
+            counts[issue["level"]] += 1
+    counts["error"] += len(missing)
+    report = {
+        "root": root.as_posix(),
+        "files": results,
+        "missing_sheets": missing,
+        "summary": {"files": len(files), "errors": counts["error"], "warnings": counts["warning"],
+                    "seconds": round(time.perf_counter() - start, 3)},
+    }
+    if args.out == "-":
+        print(json.dumps(report, indent=2))
+    else:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        for name, entry in results.items():
+            problems = [i for i in entry["issues"] if i["level"] != "info"]
+            if not problems:
+                continue
+            print(f"{name}:")
+            for issue in problems:
+                marker = "✗" if issue["level"] == "error" else "!"
+                print(f"  {marker} {issue['check']}: {issue['message']}")
+        for name in missing:
+            print(f"✗ missing sheet: {name}.png")
+        print(f"Scanned {len(files)} images in {report['summary']['seconds']}s: "
+              f"{counts['error']} errors, {counts['warning']} warnings -> {args.out}")
+
+    failed = counts["error"] or (args.strict and counts["warning"])
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""Rebuild sprite sheets from declarative layout jobs.
+
+A job (see sheet_layouts.json) names its inputs (files or folders of frame
+images, as globs) and a list of operations applied to each input as a
+stack of frames, a (frames, height, width, 4) RGBA array:
+
+* slice: cut an image into frames, as a strip (`frames`, square frames of
+  `size`, any existing 1-8 px gutter kept, extruded or not) or a `grid`
+  of [cols, rows] read row by row; `fit` centre-pads a strip whose width
+  does not split
+* reorder: pick frames by index (`order`), repeat: cycle frames to `count`
+* scale: resize each frame to `size` with a pixel_scale.py method, or
+  "lanczos" for shrinking high-resolution art
+* trim: crop every frame to the union of their visible pixels (+ `margin`)
+* canvas: place every frame on a `size` canvas (`anchor` center or bottom)
+* pad: lay frames out with a `gutter` between (or after, `trailing`) them,
+  optionally `extrude`-ing each frame's last column into it
+
+A folder input is loaded as one frame per image, ordered by the number at
+the end of each file name. "auto" as a frame count or size means the
+sheet's entry in scan_sprites.SHEETS. Sheets are written to `output`
+(default: over the input, skipped when the pixels are unchanged) and
+their frame metadata (frame size, stride, offset, gutter and each
+frame's visible bounds) is merged into the --meta file for the runtime.
+Inputs are processed in parallel.
+
+Usage:
+    python toolshed/sheet_layout.py --list
+    python toolshed/sheet_layout.py JOB [JOB ...] [--dry-run] [--backup] [--spec toolshed/sheet_layouts.json]
+"""
+import argparse
+import glob
+import json
+import re
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from optimize_sprites import lossless_candidates, visible
+from pixel_scale import METHODS, resize
+from scan_sprites import SHEETS
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "python"))
+from sheet_meta import SheetIndex, frame_layout, sha256  # noqa: E402
+
+SPEC = Path(__file__).with_name("sheet_layouts.json")
+SPRITES = Path("assets/sprites")
+META = SPRITES / "sheets.json"  # Read by python/sheet_meta.py
+BACKUP_DIR = Path("tmp/sprite_backups")
+
+
+@dataclass(frozen=True)
+class Sheet:
+    """A stack of equal-sized frames and the gutter they are laid out with"""
+    name: str  # Output stem, for "auto" lookups in SHEETS
+    frames: np.ndarray  # (count, height, width, 4) uint8
+    pad: int = 0
+    trailing: bool = False  # Gutter after every frame rather than only between them
+    extrude: bool = False  # Gutters repeat each frame's last column
+
+
+def auto(sheet, value, index):
+    """`value`, or field `index` of the sheet's SHEETS entry (0: frames, 1: size) when it is "auto" """
+    if value != "auto":
+        return value
+    if sheet.name not in SHEETS:
+        raise ValueError(f"{sheet.name} is not in SHEETS, so 'auto' has no value")
+    return SHEETS[sheet.name][index]
+
+
+def dimensions(size):
+    return (size, size) if isinstance(size, int) else tuple(size)
+
+
+def op_slice(sheet, frames=None, size=None, grid=None, fit=False):
+    if len(sheet.frames) != 1:
+        raise ValueError("slice needs a whole image, not a stack of frames")
+    image = sheet.frames[0]
+    height, width = image.shape[:2]
+    size = auto(sheet, size, 1) if size is not None else None
+    if grid:
+        cols, rows = grid
+        fw, fh = width // cols, height // rows
+        if width % cols or height % rows or (size and (fw, fh) != dimensions(size)):
+            raise ValueError(f"{width}x{height} is not a {cols}x{rows} grid" + (f" of {size}px frames" if size else ""))
+        cells = [image[r * fh:(r + 1) * fh, c * fw:(c + 1) * fw] for r in range(rows) for c in range(cols)]
+        return replace(sheet, frames=np.stack(cells), pad=0, trailing=False)
+
+    count = auto(sheet, frames, 0)
+    # Square frames (keeping any gutter the sheet has) before an even split
+    widths = [size] if size else [height] + ([width // count] if width % count == 0 else [])
+    for frame_width in widths:
+        layout = frame_layout(width, count, frame_width)
+        if layout is not None:
+            break
+    else:
+        if not fit:
+            raise ValueError(f"width {width} does not split into {count} frames of {widths[0]}px")
+        # Centre the strip on the next width that splits evenly
+        frame_width = -(-width // count)
+        left = (frame_width * count - width) // 2
+        image = np.pad(image, ((0, 0), (left, frame_width * count - width - left), (0, 0)))
+        layout = (0, False)
+    pad, trailing = layout
+    stride = frame_width + pad
+    cells = [image[:, i * stride:i * stride + frame_width] for i in range(count)]
+    gutters = [image[:, i * stride + frame_width:(i + 1) * stride] for i in range(count if trailing else count - 1)]
+    extrude = bool(pad) and all((g == c[:, -1:]).all() for g, c in zip(gutters, cells))
+    return replace(sheet, frames=np.stack(cells), pad=pad, trailing=trailing, extrude=extrude)
+
+
+def op_reorder(sheet, order):
+    return replace(sheet, frames=sheet.frames[list(order)])
+
+
+def op_repeat(sheet, count):
+    count = auto(sheet, count, 0)
+    return replace(sheet, frames=sheet.frames[np.arange(count) % len(sheet.frames)])
+
+
+def op_scale(sheet, size, method="nearest"):
+    width, height = dimensions(auto(sheet, size, 1))
+    if method == "lanczos":
+        frames = [np.asarray(Image.fromarray(f, "RGBA").resize((width, height), Image.Resampling.LANCZOS))
+                  for f in sheet.frames]
+    elif method in METHODS:
+        frames = [resize(f, (width, height), method) for f in sheet.frames]
+    else:
+        raise ValueError(f"unknown scale method {method}")
+    return replace(sheet, frames=np.stack(frames))
+
+
+def op_trim(sheet, margin=0):
+    shown = sheet.frames[..., 3].max(axis=0) > 0
+    if not shown.any():
+        return sheet
+    rows, cols = np.flatnonzero(shown.any(axis=1)), np.flatnonzero(shown.any(axis=0))
+    top, bottom = max(0, rows[0] - margin), min(shown.shape[0], rows[-1] + 1 + margin)
+    left, right = max(0, cols[0] - margin), min(shown.shape[1], cols[-1] + 1 + margin)
+    return replace(sheet, frames=sheet.frames[:, top:bottom, left:right])
+
+
+def op_canvas(sheet, size, anchor="center"):
+    width, height = dimensions(auto(sheet, size, 1))
+    count, h, w = sheet.frames.shape[:3]
+    if h > height or w > width:
+        raise ValueError(f"{w}x{h} frames do not fit a {width}x{height} canvas")
+    out = np.zeros((count, height, width, 4), np.uint8)
+    x = (width - w) // 2
+    y = height - h if anchor == "bottom" else (height - h) // 2
+    out[:, y:y + h, x:x + w] = sheet.frames
+    return replace(sheet, frames=out)
+
+
+def op_pad(sheet, gutter, trailing=False, extrude=False):
+    return replace(sheet, pad=gutter, trailing=trailing, extrude=extrude)
+
+
+OPS = {
+    "slice": op_slice,
+    "reorder": op_reorder,
+    "repeat": op_repeat,
+    "scale": op_scale,
+    "trim": op_trim,
+    "canvas": op_canvas,
+    "pad": op_pad,
+}
+
+
+def compose(sheet):
+    """The sheet as one RGBA image, frames left to right with their gutters"""
+    count, height, width = sheet.frames.shape[:3]
+    stride = width + sheet.pad
+    out = np.zeros((height, stride * count - (0 if sheet.trailing else sheet.pad), 4), np.uint8)
+    for i, frame in enumerate(sheet.frames):
+        x = i * stride
+        out[:, x:x + width] = frame
+        gutter = out[:, x + width:x + stride]
+        if sheet.extrude and gutter.size:
+            gutter[:] = frame[:, -1:]
+    return out
+
+
+def metadata(sheet, data):
+    """Everything the runtime needs to cut the sheet without inspecting it"""
+    count, height, width = sheet.frames.shape[:3]
+    bounds = []
+    for frame in sheet.frames:
+        alpha = frame[..., 3] > 0
+        if alpha.any():
+            rows, cols = np.flatnonzero(alpha.any(axis=1)), np.flatnonzero(alpha.any(axis=0))
+            bounds.append([int(cols[0]), int(rows[0]), int(cols[-1] - cols[0] + 1), int(rows[-1] - rows[0] + 1)])
+        else:
+            bounds.append(None)
+    return {"sha256": sha256(data), "frames": count, "frame_width": width,
+            "frame_height": height, "stride": width + sheet.pad, "offset": 0, "pad": sheet.pad,
+            "trailing": sheet.trailing, "bounds": bounds}
+
+
+def read_rgba(path):
+    with Image.open(path) as img:
+        return np.asarray(img.convert("RGBA"))
+
+
+def frame_number(path):
+    match = re.search(r"(\d+)$", path.stem)
+    return (int(match.group(1)) if match else -1, path.name)
+
+
+def load(path):
+    """A file as a one-frame stack, or a folder of frame images as one frame each"""
+    if not path.is_dir():
+        return read_rgba(path)[None]
+    files = sorted((f for f in path.iterdir() if f.suffix.lower() in (".png", ".gif", ".webp")), key=frame_number)
+    if not files:
+        raise ValueError("no frame images in folder")
+    frames = [read_rgba(f) for f in files]
+    height, width = frames[0].shape[:2]
+    # Stray sizes are snapped to the first frame's, as the old stitcher did
+    return np.stack([f if f.shape[:2] == (height, width) else resize(f, (width, height), "nearest") for f in frames])
+
+
+def output_path(path, template):
+    if not template:
+        return path
+    return Path(template.format(dir=path.parent.as_posix(), stem=path.stem, parent=path.parent.name))
+
+
+def run_layout(job):
+    """Apply one job's ops to one input; returns (output, metadata, status)"""
+    path, ops, template, dry_run, backup = job
+    out = output_path(path, template)
+    sheet = Sheet(out.stem, load(path))
+    for step in ops:
+        args = dict(step)
+        sheet = OPS[args.pop("op")](sheet, **args)
+    rgba = compose(sheet)
+
+    if out.is_file() and np.array_equal(visible(read_rgba(out)), visible(rgba)):
+        return out, metadata(sheet, out.read_bytes()), "unchanged"
+    data = min((make() for _, make in lossless_candidates(rgba)), key=len)
+    if not dry_run:
+        if backup and out.is_file():
+            dest = BACKUP_DIR / out
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(out, dest)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_bytes(data)
+    return out, metadata(sheet, data), f"{rgba.shape[1]}x{rgba.shape[0]}, {len(sheet.frames)} frames"
+
+
+def _layout_job(job):
+    try:
+        return run_layout(job)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        return job[0], None, str(e)
+
+
+def main():
+    p = argparse.ArgumentParser(description="Rebuild sprite sheets from declarative layout jobs.")
+    p.add_argument("jobs", nargs="*", help="Jobs from the spec to run")
+    p.add_argument("--spec", default=str(SPEC), help="Layout spec (JSON)")
+    p.add_argument("--list", action="store_true", help="List the spec's jobs and exit")
+    p.add_argument("--dry-run", action="store_true", help="Report what would change without writing")
+    p.add_argument("--backup", action="store_true", help=f"Copy sheets to {BACKUP_DIR} before overwriting")
+    p.add_argument("--meta", default=str(META), help="Frame metadata file to update")
+    p.add_argument("--workers", type=int, default=None, help="Processes to use (default: one per CPU)")
+    args = p.parse_args()
+
+    with open(args.spec) as f:
+        spec = json.load(f)
+    if args.list or not args.jobs:
+        for name, job in spec.items():
+            print(f"{name}: {job.get('description', '')}")
+        return 0
+    unknown = [name for name in args.jobs if name not in spec]
+    if unknown:
+        p.error(f"unknown job(s): {', '.join(unknown)} (see --list)")
+
+    jobs = []
+    for name in args.jobs:
+        job = spec[name]
+        inputs = sorted({Path(m) for pattern in job["inputs"] for m in glob.glob(pattern)
+                         if not m.endswith(".opt.png")})
+        if not inputs:
+            print(f"- {name}: no inputs match {', '.join(job['inputs'])}")
+        jobs += [(path, job["ops"], job.get("output"), args.dry_run, args.backup) for path in inputs]
+
+    failed = 0
+    results = []
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for path, (out, meta, status) in zip((j[0] for j in jobs), pool.map(_layout_job, jobs)):
+            if meta is None:
+                failed += 1
+                print(f"✗ {path}: {status}")
+                continue
+            print(f"✓ {path}" + (f" -> {out}" if out != path else "") + f": {status}")
+            if SPRITES.resolve() in out.resolve().parents:
+                results.append((out, meta))
+    if results and not args.dry_run:
+        SheetIndex(args.meta).update({out.resolve().relative_to(SPRITES.resolve()).as_posix(): meta
+                                      for out, meta in results})
+        print(f"Recorded {len(results)} sheets in {args.meta}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
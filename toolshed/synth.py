@@ -0,0 +1,259 @@
+"""Shared synthesis engine for the toolshed sound and music generators.
+
+Sounds are described declaratively: a *patch* is a plain dict saying how to
+build one note (partials, sweep, noise, drive, envelope), and a piece of
+audio is a list of Events placing patches on a timeline. Rendering then
+works like a sampler:
+
+* each distinct (patch, frequency, duration, sample rate) is synthesised
+  once and cached as a one-shot wavetable;
+* every event using that one-shot is stamped onto the timeline in one
+  vectorised offset-add (np.bincount over the event offsets, so overlapping
+  events sum correctly);
+* long tracks are rendered and written in fixed-size chunks, so memory is
+  bounded by the chunk and the one-shot cache, not the track length;
+* render_files() writes several outputs in parallel across processes.
+
+Patch keys (all optional):
+    partials     [(ratio, gain[, phase])] sines over the note frequency, default [(1, 1.0)]
+    sweep        end/start frequency ratio of a glide over the note
+    sweep_curve  "linear" (default) or "exp"
+    noise        noise gain; noise_type "uniform" (default) or "normal"
+    smooth       moving-average window over the noise, in samples (a cheap low-pass)
+    tremolo      (rate_hz, depth): depth 1 swings the level between 0 and 1
+    drive        tanh overdrive gain; drive_level scales its output (default 1)
+    sub          gain of a sine an octave below, added after the drive
+    envelope     ("fade", in_s, out_s) | ("adsr", a, d, sustain, r) | ("exp", rate)
+                 | ("swell", attack_s, end_level) | ("power", attack_s, exponent)
+                 | ("triangle",)
+    gain         output gain, default 1
+    seed         noise seed, default 0 (one-shots are cached, so noise is fixed per patch)
+"""
+import os
+import wave
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+
+CHUNK_FRAMES = 1 << 16  # Samples rendered per chunk of a track
+
+# time and duration in seconds; gain scales this event's one-shot
+Event = namedtuple("Event", "time patch freq duration gain")
+Event.__new__.__defaults__ = (1.0,)
+
+
+def note(time, patch, freq, duration, gain=1.0):
+    return Event(time, patch, freq, duration, gain)
+
+
+def freeze(value):
+    """Hashable form of a patch (dicts and lists become sorted tuples)"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(frozen):
+    return {k: v for k, v in frozen}
+
+
+def envelope(spec, n, sample_rate):
+    """Envelope of `n` samples from an envelope spec (see the module docstring)"""
+    if spec is None or n == 0:
+        return np.ones(n)
+    kind, *args = spec
+    t = np.arange(n) / sample_rate
+    env = np.ones(n)
+    if kind == "fade":
+        fade_in, fade_out = (int(s * sample_rate) for s in args)
+        if fade_in:
+            env[:fade_in] = np.linspace(0, 1, fade_in)[:n]
+        if fade_out:
+            env[-fade_out:] *= np.linspace(1, 0, fade_out)[-n:]
+    elif kind == "adsr":
+        attack, decay, sustain, release = args
+        a, d, r = int(attack * sample_rate), int(decay * sample_rate), int(release * sample_rate)
+        if n > a:
+            env[:a] = np.linspace(0, 1, a)
+        if n > a + d:
+            env[a:a + d] = np.linspace(1, sustain, d)
+            env[a + d:] = sustain
+        if n > r:
+            env[n - r:] = np.linspace(sustain, 0, r)
+    elif kind == "exp":
+        env = np.exp(-t * args[0])
+    elif kind == "swell":
+        attack, end_level = args
+        a = min(int(attack * sample_rate), n // 4)
+        env[:a] = np.linspace(0, 1, a)
+        env[a:] = np.linspace(1, end_level, n - a)
+    elif kind == "power":
+        attack, exponent = args
+        env = np.minimum(1, t / attack) * np.maximum(0, 1 - t / (n / sample_rate)) ** exponent
+    elif kind == "triangle":
+        half = n // 2
+        env[:half] = np.linspace(0, 1, half)
+        env[half:] = np.linspace(1, 0, n - half)
+    else:
+        raise ValueError(f"Unknown envelope {kind!r}")
+    return env
+
+
+def synthesize(patch, freq, n, sample_rate):
+    """Render one note of `patch` (uncached)"""
+    t = np.arange(n) / sample_rate
+    ratio = patch.get("sweep")
+    if ratio is None:
+        phase = 2 * np.pi * freq * t
+    else:
+        if patch.get("sweep_curve", "linear") == "exp":
+            inst = freq * ratio ** np.linspace(0, 1, n)
+        else:
+            inst = np.linspace(freq, freq * ratio, n)
+        phase = 2 * np.pi * np.cumsum(inst) / sample_rate
+
+    wave_ = np.zeros(n)
+    for partial in patch.get("partials", [(1, 1.0)]):
+        ratio_, gain, offset = (tuple(partial) + (0.0,))[:3]
+        wave_ += gain * np.sin(phase * ratio_ + offset)
+
+    if patch.get("noise"):
+        rng = np.random.default_rng(patch.get("seed", 0))
+        if patch.get("noise_type", "uniform") == "normal":
+            noise = rng.normal(0, 1, n)
+        else:
+            noise = rng.uniform(-1, 1, n)
+        smooth = patch.get("smooth")
+        if smooth:
+            noise = np.convolve(noise, np.ones(smooth) / smooth, mode="same")
+        wave_ += patch["noise"] * noise
+
+    if patch.get("tremolo"):
+        rate, depth = patch["tremolo"]
+        wave_ *= 1 - depth * (0.5 - 0.5 * np.sin(2 * np.pi * rate * t))
+    if patch.get("drive"):
+        wave_ = np.tanh(wave_ * patch["drive"]) * patch.get("drive_level", 1.0)
+    if patch.get("sub"):
+        wave_ += patch["sub"] * np.sin(phase * 0.5)
+
+    wave_ *= envelope(patch.get("envelope"), n, sample_rate) * patch.get("gain", 1.0)
+    return wave_.astype(np.float32)
+
+
+@lru_cache(maxsize=512)
+def _one_shot(frozen_patch, freq, n, sample_rate):
+    data = synthesize(thaw(frozen_patch), freq, n, sample_rate)
+    data.flags.writeable = False  # Shared by every event that uses it
+    return data
+
+
+def one_shot(patch, freq, duration, sample_rate):
+    """Cached wavetable for one note of `patch`"""
+    return _one_shot(freeze(patch), float(freq), int(duration * sample_rate), sample_rate)
+
+
+def stamp(out, wave_, offsets, gains, start=0):
+    """Add `wave_` scaled by `gains` at each of `offsets` (absolute samples)
+    into `out`, which holds samples [start, start + len(out))"""
+    if len(offsets) == 0 or len(wave_) == 0:
+        return
+    index = offsets[:, None] - start + np.arange(len(wave_))
+    keep = (index >= 0) & (index < len(out))
+    values = gains[:, None] * wave_
+    out += np.bincount(index[keep], weights=values[keep], minlength=len(out))[:len(out)]
+
+
+class Track:
+    """Events grouped by one-shot, ready to render any window of samples"""
+
+    def __init__(self, events, sample_rate, duration=None):
+        self.sample_rate = sample_rate
+        groups = {}
+        end = 0
+        for event in events:
+            n = int(event.duration * sample_rate)
+            key = (freeze(event.patch), float(event.freq), n)
+            offset = int(event.time * sample_rate)
+            groups.setdefault(key, []).append((offset, event.gain))
+            end = max(end, offset + n)
+        self.frames = end if duration is None else int(duration * sample_rate)
+
+        self.groups = []
+        for (patch, freq, n), hits in groups.items():
+            hits.sort()
+            offsets = np.array([h[0] for h in hits], dtype=np.int64)
+            gains = np.array([h[1] for h in hits])
+            self.groups.append((patch, freq, n, offsets, gains))
+
+    def render(self, start, length):
+        """Samples [start, start + length) as float64"""
+        out = np.zeros(length)
+        for patch, freq, n, offsets, gains in self.groups:
+            # Only events overlapping the window
+            lo = np.searchsorted(offsets, start - n, side="right")
+            hi = np.searchsorted(offsets, start + length, side="left")
+            if lo < hi:
+                stamp(out, _one_shot(patch, freq, n, self.sample_rate), offsets[lo:hi], gains[lo:hi], start)
+        return out
+
+    def chunks(self, chunk_frames=CHUNK_FRAMES):
+        for start in range(0, self.frames, chunk_frames):
+            yield self.render(start, min(chunk_frames, self.frames - start))
+
+    def peak(self, chunk_frames=CHUNK_FRAMES):
+        return max((float(np.abs(c).max()) for c in self.chunks(chunk_frames)), default=0.0)
+
+
+def render(events, sample_rate, duration=None):
+    """Whole piece as one float64 array (for short sounds)"""
+    track = Track(events, sample_rate, duration)
+    return track.render(0, track.frames)
+
+
+def to_pcm(data, channels=1):
+    pcm = np.round(np.clip(data, -1, 1) * 32767).astype("<i2")
+    if channels > 1:
+        pcm = np.repeat(pcm[:, None], channels, axis=1)
+    return pcm.tobytes()
+
+
+def write_wav(path, events, sample_rate, duration=None, channels=1, peak=None, gain=1.0):
+    """Render `events` to a 16-bit WAV chunk by chunk; returns the frame count
+
+    With `peak`, the track is scaled so its loudest sample sits at `peak`
+    (this renders twice, which is cheap as the one-shots are cached).
+    """
+    track = Track(events, sample_rate, duration)
+    if peak is not None:
+        loudest = track.peak()
+        if loudest > 0:
+            gain = gain * peak / loudest
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with wave.open(path, "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        for chunk in track.chunks():
+            w.writeframes(to_pcm(chunk * gain, channels))
+    return track.frames
+
+
+def _write_job(job):
+    path, events, options = job
+    return path, write_wav(path, events, **options)
+
+
+def render_files(jobs, workers=None):
+    """Write several WAVs in parallel; `jobs` are (path, events, write_wav options).
+    Returns [(path, frames)] in job order."""
+    jobs = list(jobs)
+    if workers == 1 or len(jobs) < 2:
+        return [_write_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_write_job, jobs))
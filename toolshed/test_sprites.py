@@ -27,6 +27,7 @@ else:
         sys.path.insert(0, fallback_src)
 
 from sprite_loader import sprite_loader  # noqa: E402
+from scan_sprites import SHEETS  # noqa: E402
 
 
 def main():
@@ -40,29 +41,18 @@ def main():
 
     failures = []
 
-    enemy_sheets = [
-        ("enemies/basic_idle.png", (48, 48), 4),
-        ("enemies/basic_walk.png", (48, 48), 6),
-        ("enemies/basic_attack.png", (48, 48), 4),
-        ("enemies/basic_hurt.png", (48, 48), 4),
-        ("enemies/fly_idle.png", (40, 40), 4),
-        ("enemies/boss_idle.png", (128, 128), 4),
-        ("enemies/boss2_idle.png", (128, 128), 4),
-        ("enemies/boss2_walk.png", (128, 128), 4),
-        ("enemies/boss2_attack.png", (128, 128), 4),
-        ("enemies/boss2_hurt.png", (128, 128), 4),
-    ]
+    # Frame counts and sizes come from the asset scanner's table
+    enemy_sheets = [f"enemies/{name}.png" for name in (
+        "basic_idle", "basic_walk", "basic_attack", "basic_hurt", "fly_idle",
+        "boss_idle", "boss2_idle", "boss2_walk", "boss2_attack", "boss2_hurt",
+    )]
 
-    player_sheets = [
-        ("characters/ninja_idle.png", (64, 64), 4),
-        ("characters/ninja_walk.png", (64, 64), 4),
-        ("characters/ninja_jump.png", (64, 64), 4),
-        ("characters/ninja_attack.png", (64, 64), 4),
-        ("characters/ninja_shadow_strike.png", (64, 64), 8),
-        ("characters/ninja_hurt.png", (64, 64), 2),
-    ]
+    player_sheets = [f"characters/{name}.png" for name in (
+        "ninja_idle", "ninja_walk", "ninja_jump", "ninja_attack", "ninja_shadow_strike", "ninja_hurt",
+    )]
 
-    def check_sheet(path, frame_size, frames):
+    def check_sheet(path):
+        frames, size = SHEETS[os.path.splitext(os.path.basename(path))[0]]
         full_path = os.path.join(sprite_loader.base_path, path)
         exists = os.path.exists(full_path)
         status = "✓" if exists else "✗"
@@ -71,19 +61,19 @@ def main():
             failures.append(path)
             return
         try:
-            sprite_loader.load_spritesheet(path, frame_size[0], frame_size[1], frames, frame_size)
+            sprite_loader.load_spritesheet(path, size, size, frames, (size, size))
         except Exception as exc:  # pragma: no cover - defensive
             failures.append(path)
             print(f"    ✗ Failed to load: {exc}")
 
     print("Enemy Sprites:")
-    for sprite_path, size, frames in enemy_sheets:
-        check_sheet(sprite_path, size, frames)
+    for sprite_path in enemy_sheets:
+        check_sheet(sprite_path)
 
     print()
     print("Ninja Skunk Sprites:")
-    for sprite_path, size, frames in player_sheets:
-        check_sheet(sprite_path, size, frames)
+    for sprite_path in player_sheets:
+        check_sheet(sprite_path)
 
     # Background panoramas and tiles
     background_images = [
@@ -1,11 +1,20 @@
 """
-Upscale background tile images to 64x64 using Pillow (nearest neighbor).
-Usage: python toolshed/upscale_tiles.py
+Upscale background tile images to 64x64 with a pixel-art scaler (see pixel_scale.py).
+Usage: python toolshed/upscale_tiles.py [nearest|scale|epx|edge]
 """
+import sys
+
+import numpy as np
 from PIL import Image
 from PIL import ImageDraw, ImageFont
 import os
 
+from pixel_scale import METHODS, resize
+
+method = sys.argv[1] if len(sys.argv) > 1 else 'scale'
+if method not in METHODS:
+    raise SystemExit(f'Unknown method {method}; choose from {", ".join(sorted(METHODS))}')
+
 BASE = os.path.join(os.path.dirname(__file__), '..', 'assets', 'sprites', 'backgrounds', 'tiles')
 files = [
     'ground_tile.png',
@@ -25,9 +34,8 @@ for f in files:
         im = Image.open(p)
         w,h = im.size
         if (w,h) != (64,64):
-            print(f'Resizing {f}: {w}x{h} -> 64x64')
-            im = im.convert('RGBA')
-            im = im.resize((64,64), Image.NEAREST)
+            print(f'Resizing {f}: {w}x{h} -> 64x64 ({method})')
+            im = Image.fromarray(resize(np.asarray(im.convert('RGBA')), (64, 64), method), 'RGBA')
             im.save(p, format='PNG')
         else:
             print(f'{f} already 64x64, skipping')